@@ -0,0 +1,218 @@
+########################################################################
+## IMPORTS
+########################################################################
+from PySide6.QtCore import QObject, QTimer, QElapsedTimer, QEasingCurve, QAbstractAnimation, QCoreApplication, Qt
+
+
+########################################################################
+## ANIMATION CALLBACKS CLASS
+########################################################################
+class AnimationCallbacks():
+    '''
+    Signal-like list of python callables.
+
+    Used by ClockAnimation instead of Qt signals so that an animation
+    does not need its own QObject.
+
+    '''
+
+    def __init__(self):
+        self.callbacks = []
+
+    def connect(self, callback):
+        self.callbacks.append(callback)
+
+    def disconnect(self, callback=None):
+        if callback is None:
+            self.callbacks = []
+        elif callback in self.callbacks:
+            self.callbacks.remove(callback)
+
+    def emit(self, *args):
+        for callback in list(self.callbacks):
+            callback(*args)
+
+    def receivers(self):
+        return len(self.callbacks)
+
+
+########################################################################
+## SHARED ANIMATION CLOCK CLASS
+########################################################################
+class SharedAnimationClock(QObject):
+    '''
+    Library wide animation tick.
+
+    One timer advances every running ClockAnimation. The timer only runs
+    while at least one animation is registered.
+
+    '''
+    _instance = None
+
+    def __init__(self, parent=None):
+        super(SharedAnimationClock, self).__init__(parent)
+
+        self.animations = []
+
+        # Default tick interval (~60 frames per second)
+        self.interval = 16
+
+        self.elapsed = QElapsedTimer()
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(self.interval)
+        self.timer.timeout.connect(self.tick)
+
+    @staticmethod
+    def instance():
+        if SharedAnimationClock._instance is None:
+            SharedAnimationClock._instance = SharedAnimationClock(QCoreApplication.instance())
+        return SharedAnimationClock._instance
+
+    def setInterval(self, interval):
+        self.interval = int(interval)
+        self.timer.setInterval(self.interval)
+
+    def register(self, animation):
+        if animation not in self.animations:
+            self.animations.append(animation)
+
+        if not self.timer.isActive():
+            self.elapsed.start()
+            self.timer.start()
+
+    def unregister(self, animation):
+        if animation in self.animations:
+            self.animations.remove(animation)
+
+        if len(self.animations) == 0:
+            self.timer.stop()
+
+    def tick(self):
+        delta = self.elapsed.restart()
+        for animation in list(self.animations):
+            try:
+                animation.advance(delta)
+            except Exception as error:
+                # Never advance a failing animation again, otherwise it
+                # raises on every tick
+                animation._running = False
+                self.unregister(animation)
+                # RuntimeError: the widget driven by the animation was deleted
+                if not isinstance(error, RuntimeError):
+                    raise
+
+
+########################################################################
+## CLOCK ANIMATION CLASS
+########################################################################
+class ClockAnimation():
+    '''
+    Lightweight replacement for QVariantAnimation driven by the
+    SharedAnimationClock.
+
+    Supports the subset of the QVariantAnimation API used by the custom
+    widgets: start/end values, duration, easing curve and direction.
+    Calling start() on a running animation keeps it running, so changing
+    the direction reverses it from its current value.
+
+    '''
+
+    def __init__(self, startValue=0.0, endValue=1.0, duration=250):
+        self._startValue = startValue
+        self._endValue = endValue
+        self._duration = int(duration)
+        self._easingCurve = QEasingCurve(QEasingCurve.Linear)
+        self._direction = QAbstractAnimation.Forward
+        self._currentTime = 0
+        self._currentValue = startValue
+        self._running = False
+
+        self.valueChanged = AnimationCallbacks()
+        self.finished = AnimationCallbacks()
+
+    def setStartValue(self, value):
+        self._startValue = value
+
+    def startValue(self):
+        return self._startValue
+
+    def setEndValue(self, value):
+        self._endValue = value
+
+    def endValue(self):
+        return self._endValue
+
+    def setDuration(self, duration):
+        self._duration = int(duration)
+
+    def duration(self):
+        return self._duration
+
+    def setEasingCurve(self, easingCurve):
+        self._easingCurve = QEasingCurve(easingCurve)
+
+    def easingCurve(self):
+        return self._easingCurve
+
+    def setDirection(self, direction):
+        self._direction = direction
+
+    def direction(self):
+        return self._direction
+
+    def state(self):
+        if self._running:
+            return QAbstractAnimation.Running
+        return QAbstractAnimation.Stopped
+
+    def currentValue(self):
+        return self._currentValue
+
+    def start(self):
+        if self._running:
+            return
+
+        if self._direction == QAbstractAnimation.Forward:
+            self._currentTime = 0
+        else:
+            self._currentTime = self._duration
+
+        self._running = True
+        self.updateCurrentValue()
+        SharedAnimationClock.instance().register(self)
+
+    def stop(self):
+        self._running = False
+        SharedAnimationClock.instance().unregister(self)
+
+    def advance(self, delta):
+        if not self._running:
+            return
+
+        if self._direction == QAbstractAnimation.Forward:
+            self._currentTime = min(self._duration, self._currentTime + delta)
+            done = self._currentTime >= self._duration
+        else:
+            self._currentTime = max(0, self._currentTime - delta)
+            done = self._currentTime <= 0
+
+        self.updateCurrentValue()
+
+        if done:
+            self.stop()
+            self.finished.emit()
+
+    def updateCurrentValue(self):
+        if self._duration > 0:
+            progress = self._easingCurve.valueForProgress(self._currentTime / self._duration)
+        else:
+            progress = 1.0 if self._direction == QAbstractAnimation.Forward else 0.0
+
+        value = self._startValue + (self._endValue - self._startValue) * progress
+        if isinstance(self._startValue, int) and isinstance(self._endValue, int):
+            value = int(value)
+
+        self._currentValue = value
+        self.valueChanged.emit(value)
@@ -52,8 +52,9 @@ def generateIcons(icons_color="#FFFFFF"):
     svg_color = "#FFFFFF"
     normal_color = icons_color
 
-    focused_color = adjust_lightness(normal_color, 1.5)
-    disabled_color = adjust_lightness(normal_color, .5)
+    palette = createPalette({"icons-color": normal_color})
+    focused_color = palette["COLOR_ICONS_FOCUS"]
+    disabled_color = palette["COLOR_ICONS_DISABLED"]
 
     icons_folder = os.path.abspath(os.path.join(os.getcwd(), 'QSS/Icons'))
 
@@ -19,7 +19,9 @@ import qtsass
 ########################################################################
 # IMPORT OS
 import os
+import re
 import shutil
+import hashlib
 
 from .colorsystem import CreateColorVariable, Dark, Light
 from .SvgToPngIcons import NewIconsGenerator
@@ -55,8 +57,6 @@ class CompileStyleSheet():
         styles_sass_path = os.path.abspath(os.path.join(os.getcwd(), 'QSS/_styles.scss'))
         css_path = os.path.abspath(os.path.join(os.getcwd(), 'QSS/main.css'))
 
-        variablesFile = CreateColorVariable.CreateVariables(self)
-
         if not os.path.exists(main_sass_path):
             shutil.copy(os.path.abspath(os.path.join(os.path.dirname(__file__), 'main.scss')),
                         os.path.abspath(os.path.join(os.getcwd(), 'QSS')))
@@ -81,10 +81,22 @@ class CompileStyleSheet():
 
             f.close()
 
-        qtsass.compile_filename(main_sass_path, css_path)
+        # Reuse the stylesheet compiled for the same variables and SCSS sources
+        palette = CreateColorVariable.getThemePalette(self)
+        variables = CreateColorVariable.returnVariables(self, palette)
+        cacheKey = returnCompiledStyleKey(variables, main_sass_path)
+        compiledStyle = loadCompiledStyle(cacheKey)
+
+        if compiledStyle is None:
+            CreateColorVariable.writeVariables(self, palette)
+            qtsass.compile_filename(main_sass_path, css_path)
+
+            with open(css_path, "r") as css:
+                compiledStyle = css.read()
+
+            saveCompiledStyle(cacheKey, compiledStyle)
 
-        with open(css_path, "r") as css:
-            self.setStyleSheet(css.read())
+        self.setStyleSheet(compiledStyle)
 
         ########################################################################
         ## GENERATE NEW ICONS
@@ -111,6 +123,124 @@ class CompileStyleSheet():
         else:
             self.customWidgetsThreadpool.start(allIconsWorker)
 
+########################################################################
+## COMPILED STYLESHEET CACHE
+## Shared by all apps of the user, keyed by the generated _variables.scss,
+## the SCSS sources imported by main.scss and the qtsass version.
+## Only the most recently used stylesheets are kept.
+########################################################################
+COMPILED_STYLE_CACHE_SIZE = 32
+
+
+def returnCompiledStyleFolder():
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation),
+                        "Custom_Widgets", "compiledStyles")
+
+
+def returnScssSources(scssPath, sources=None):
+    # Return scssPath and every SCSS file it imports, in import order
+    if sources is None:
+        sources = []
+    if scssPath in sources:
+        return sources
+    sources.append(scssPath)
+
+    with open(scssPath, "r") as file:
+        content = file.read()
+
+    folder = os.path.dirname(scssPath)
+    for statement in re.findall(r"@import\s+([^;]+);", content):
+        for name in statement.split(","):
+            name = name.strip().strip("'\"")
+            if name.endswith(".css") or name.startswith("url(") or "://" in name:
+                continue
+
+            directory, base = os.path.split(name)
+            if base.endswith(".scss"):
+                base = base[:-len(".scss")]
+            for candidate in (base + ".scss", "_" + base + ".scss"):
+                importPath = os.path.abspath(os.path.join(folder, directory, candidate))
+                if os.path.isfile(importPath):
+                    returnScssSources(importPath, sources)
+                    break
+
+    return sources
+
+
+def returnCompiledStyleKey(variables, mainScssPath):
+    key = hashlib.sha1()
+    key.update(("qtsass " + str(qtsass.__version__) + "\n").encode())
+
+    # _variables.scss is only written on a miss, hash the text it would get
+    key.update(hashlib.sha1(variables.encode()).digest())
+
+    qssFolder = os.path.dirname(mainScssPath)
+    variablesPath = os.path.abspath(os.path.join(qssFolder, '_variables.scss'))
+    for scssPath in returnScssSources(mainScssPath):
+        if scssPath == variablesPath:
+            continue
+        # Relative paths let apps with the same sources share the stylesheet
+        key.update((os.path.relpath(scssPath, qssFolder) + "\n").encode())
+        with open(scssPath, "rb") as file:
+            key.update(hashlib.sha1(file.read()).digest())
+
+    return key.hexdigest()
+
+
+def loadCompiledStyle(key):
+    cssFile = os.path.join(returnCompiledStyleFolder(), key + ".css")
+    try:
+        with open(cssFile, "r") as css:
+            compiledStyle = css.read()
+        # Mark it as recently used so pruning keeps it
+        os.utime(cssFile)
+    except OSError:
+        return None
+
+    return compiledStyle
+
+
+def saveCompiledStyle(key, compiledStyle):
+    folder = returnCompiledStyleFolder()
+    try:
+        os.makedirs(folder, exist_ok=True)
+        cssFile = os.path.join(folder, key + ".css")
+        # Write and rename so other apps never read half a stylesheet
+        with open(cssFile + "." + str(os.getpid()) + ".tmp", "w") as css:
+            css.write(compiledStyle)
+        os.replace(cssFile + "." + str(os.getpid()) + ".tmp", cssFile)
+    except OSError:
+        # The cache is only an optimization
+        return
+
+    pruneCompiledStyles(folder)
+
+
+def pruneCompiledStyles(folder, keep=COMPILED_STYLE_CACHE_SIZE):
+    # Delete all but the most recently used stylesheets
+    cssFiles = []
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return
+
+    for name in names:
+        if not name.endswith(".css"):
+            continue
+        cssFile = os.path.join(folder, name)
+        try:
+            cssFiles.append((os.path.getmtime(cssFile), cssFile))
+        except OSError:
+            # Pruned by another app
+            pass
+
+    cssFiles.sort(reverse=True)
+    for mtime, cssFile in cssFiles[keep:]:
+        try:
+            os.remove(cssFile)
+        except OSError:
+            pass
+
 ########################################################################
 ## ==>END
 ########################################################################
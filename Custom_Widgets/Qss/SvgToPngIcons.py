@@ -27,8 +27,9 @@ class NewIconsGenerator():
         svg_color = "#FFFFFF"
         normal_color = str(color["icons-color"])
 
-        focused_color = adjust_lightness(normal_color, 1.5)
-        disabled_color = adjust_lightness(normal_color, .5)
+        palette = createPalette({"icons-color": normal_color})
+        focused_color = palette["COLOR_ICONS_FOCUS"]
+        disabled_color = palette["COLOR_ICONS_DISABLED"]
 
         iconsFolderName = normal_color.replace("#", "")
         iconsFolder = os.path.abspath(os.path.join(os.getcwd(), 'QSS/' + iconsFolderName))
@@ -190,6 +191,8 @@ class NewIconsGenerator():
 
         svg_color = "#ffffff"
 
+        # Icon colors of every theme, their shades are computed in one batch
+        themeIconColors = []
         for theme in self.ui.themes:
             THEME = settings.value("THEME")
             # if theme.defaultTheme or theme.name == THEME:
@@ -223,8 +226,13 @@ class NewIconsGenerator():
                     print("No icons color specified for theme", theme.name)
                 continue
 
-            focused_color = adjust_lightness(normal_color, 1.5)
-            disabled_color = adjust_lightness(normal_color, .5)
+            themeIconColors.append(normal_color)
+
+        palettes = createPalettes([{"icons-color": normal_color} for normal_color in themeIconColors])
+
+        for normal_color, palette in zip(themeIconColors, palettes):
+            focused_color = palette["COLOR_ICONS_FOCUS"]
+            disabled_color = palette["COLOR_ICONS_DISABLED"]
 
             iconsFolderName = normal_color.replace("#", "")
 
@@ -0,0 +1,422 @@
+########################################################################
+## COLOR ENGINE
+## Named colors, color parsing and lightness adjustment without any
+## third party dependency. Results match the matplotlib based
+## implementation colorsystem.py used before.
+########################################################################
+
+########################################################################
+## IMPORTS
+########################################################################
+import re
+import colorsys
+
+
+########################################################################
+## NAMED COLORS
+########################################################################
+# CSS4 / X11 color names
+CSS4_COLORS = {
+    "aliceblue": "#F0F8FF",
+    "antiquewhite": "#FAEBD7",
+    "aqua": "#00FFFF",
+    "aquamarine": "#7FFFD4",
+    "azure": "#F0FFFF",
+    "beige": "#F5F5DC",
+    "bisque": "#FFE4C4",
+    "black": "#000000",
+    "blanchedalmond": "#FFEBCD",
+    "blue": "#0000FF",
+    "blueviolet": "#8A2BE2",
+    "brown": "#A52A2A",
+    "burlywood": "#DEB887",
+    "cadetblue": "#5F9EA0",
+    "chartreuse": "#7FFF00",
+    "chocolate": "#D2691E",
+    "coral": "#FF7F50",
+    "cornflowerblue": "#6495ED",
+    "cornsilk": "#FFF8DC",
+    "crimson": "#DC143C",
+    "cyan": "#00FFFF",
+    "darkblue": "#00008B",
+    "darkcyan": "#008B8B",
+    "darkgoldenrod": "#B8860B",
+    "darkgray": "#A9A9A9",
+    "darkgreen": "#006400",
+    "darkgrey": "#A9A9A9",
+    "darkkhaki": "#BDB76B",
+    "darkmagenta": "#8B008B",
+    "darkolivegreen": "#556B2F",
+    "darkorange": "#FF8C00",
+    "darkorchid": "#9932CC",
+    "darkred": "#8B0000",
+    "darksalmon": "#E9967A",
+    "darkseagreen": "#8FBC8F",
+    "darkslateblue": "#483D8B",
+    "darkslategray": "#2F4F4F",
+    "darkslategrey": "#2F4F4F",
+    "darkturquoise": "#00CED1",
+    "darkviolet": "#9400D3",
+    "deeppink": "#FF1493",
+    "deepskyblue": "#00BFFF",
+    "dimgray": "#696969",
+    "dimgrey": "#696969",
+    "dodgerblue": "#1E90FF",
+    "firebrick": "#B22222",
+    "floralwhite": "#FFFAF0",
+    "forestgreen": "#228B22",
+    "fuchsia": "#FF00FF",
+    "gainsboro": "#DCDCDC",
+    "ghostwhite": "#F8F8FF",
+    "gold": "#FFD700",
+    "goldenrod": "#DAA520",
+    "gray": "#808080",
+    "green": "#008000",
+    "greenyellow": "#ADFF2F",
+    "grey": "#808080",
+    "honeydew": "#F0FFF0",
+    "hotpink": "#FF69B4",
+    "indianred": "#CD5C5C",
+    "indigo": "#4B0082",
+    "ivory": "#FFFFF0",
+    "khaki": "#F0E68C",
+    "lavender": "#E6E6FA",
+    "lavenderblush": "#FFF0F5",
+    "lawngreen": "#7CFC00",
+    "lemonchiffon": "#FFFACD",
+    "lightblue": "#ADD8E6",
+    "lightcoral": "#F08080",
+    "lightcyan": "#E0FFFF",
+    "lightgoldenrodyellow": "#FAFAD2",
+    "lightgray": "#D3D3D3",
+    "lightgreen": "#90EE90",
+    "lightgrey": "#D3D3D3",
+    "lightpink": "#FFB6C1",
+    "lightsalmon": "#FFA07A",
+    "lightseagreen": "#20B2AA",
+    "lightskyblue": "#87CEFA",
+    "lightslategray": "#778899",
+    "lightslategrey": "#778899",
+    "lightsteelblue": "#B0C4DE",
+    "lightyellow": "#FFFFE0",
+    "lime": "#00FF00",
+    "limegreen": "#32CD32",
+    "linen": "#FAF0E6",
+    "magenta": "#FF00FF",
+    "maroon": "#800000",
+    "mediumaquamarine": "#66CDAA",
+    "mediumblue": "#0000CD",
+    "mediumorchid": "#BA55D3",
+    "mediumpurple": "#9370DB",
+    "mediumseagreen": "#3CB371",
+    "mediumslateblue": "#7B68EE",
+    "mediumspringgreen": "#00FA9A",
+    "mediumturquoise": "#48D1CC",
+    "mediumvioletred": "#C71585",
+    "midnightblue": "#191970",
+    "mintcream": "#F5FFFA",
+    "mistyrose": "#FFE4E1",
+    "moccasin": "#FFE4B5",
+    "navajowhite": "#FFDEAD",
+    "navy": "#000080",
+    "oldlace": "#FDF5E6",
+    "olive": "#808000",
+    "olivedrab": "#6B8E23",
+    "orange": "#FFA500",
+    "orangered": "#FF4500",
+    "orchid": "#DA70D6",
+    "palegoldenrod": "#EEE8AA",
+    "palegreen": "#98FB98",
+    "paleturquoise": "#AFEEEE",
+    "palevioletred": "#DB7093",
+    "papayawhip": "#FFEFD5",
+    "peachpuff": "#FFDAB9",
+    "peru": "#CD853F",
+    "pink": "#FFC0CB",
+    "plum": "#DDA0DD",
+    "powderblue": "#B0E0E6",
+    "purple": "#800080",
+    "rebeccapurple": "#663399",
+    "red": "#FF0000",
+    "rosybrown": "#BC8F8F",
+    "royalblue": "#4169E1",
+    "saddlebrown": "#8B4513",
+    "salmon": "#FA8072",
+    "sandybrown": "#F4A460",
+    "seagreen": "#2E8B57",
+    "seashell": "#FFF5EE",
+    "sienna": "#A0522D",
+    "silver": "#C0C0C0",
+    "skyblue": "#87CEEB",
+    "slateblue": "#6A5ACD",
+    "slategray": "#708090",
+    "slategrey": "#708090",
+    "snow": "#FFFAFA",
+    "springgreen": "#00FF7F",
+    "steelblue": "#4682B4",
+    "tan": "#D2B48C",
+    "teal": "#008080",
+    "thistle": "#D8BFD8",
+    "tomato": "#FF6347",
+    "turquoise": "#40E0D0",
+    "violet": "#EE82EE",
+    "wheat": "#F5DEB3",
+    "white": "#FFFFFF",
+    "whitesmoke": "#F5F5F5",
+    "yellow": "#FFFF00",
+    "yellowgreen": "#9ACD32",
+}
+
+# Single letter base colors
+BASE_COLORS = {
+    "b": (0, 0, 1),
+    "g": (0, 0.5, 0),
+    "r": (1, 0, 0),
+    "c": (0, 0.75, 0.75),
+    "m": (0.75, 0, 0.75),
+    "y": (0.75, 0.75, 0),
+    "k": (0, 0, 0),
+    "w": (1, 1, 1),
+}
+
+# Tableau palette, also used by the "C0" to "C9" color cycle names
+TABLEAU_COLORS = {
+    "tab:blue": "#1f77b4",
+    "tab:orange": "#ff7f0e",
+    "tab:green": "#2ca02c",
+    "tab:red": "#d62728",
+    "tab:purple": "#9467bd",
+    "tab:brown": "#8c564b",
+    "tab:pink": "#e377c2",
+    "tab:gray": "#7f7f7f",
+    "tab:olive": "#bcbd22",
+    "tab:cyan": "#17becf",
+}
+
+NAMED_COLORS = {}
+NAMED_COLORS.update(CSS4_COLORS)
+NAMED_COLORS.update(TABLEAU_COLORS)
+NAMED_COLORS.update({name.replace("gray", "grey"): color for name, color in TABLEAU_COLORS.items() if "gray" in name})
+NAMED_COLORS.update(BASE_COLORS)
+
+COLOR_CYCLE = list(TABLEAU_COLORS.values())
+
+# Kept for code that used matplotlib.colors.cnames
+cnames = CSS4_COLORS
+
+
+########################################################################
+## PARSE A COLOR INTO RED, GREEN, BLUE AND ALPHA FLOATS (0 - 1)
+########################################################################
+def to_rgba(color):
+    original = color
+    if isinstance(color, str):
+        if color.lower() == "none":
+            return (0., 0., 0., 0.)
+
+        # Color cycle
+        if re.fullmatch("C[0-9]+", color):
+            color = COLOR_CYCLE[int(color[1:]) % len(COLOR_CYCLE)]
+
+        # Named color
+        elif color in NAMED_COLORS:
+            color = NAMED_COLORS[color]
+        elif len(color) != 1 and color.lower() in NAMED_COLORS:
+            color = NAMED_COLORS[color.lower()]
+
+    if isinstance(color, str):
+        if re.fullmatch("#[a-fA-F0-9]+", color):
+            if len(color) == 7:
+                # #rrggbb
+                return (*[n / 0xff for n in bytes.fromhex(color[1:])], 1.)
+            elif len(color) == 4:
+                # #rgb
+                return (*[int(n, 16) / 0xf for n in color[1:]], 1.)
+            elif len(color) == 9:
+                # #rrggbbaa
+                return tuple(n / 0xff for n in bytes.fromhex(color[1:]))
+            elif len(color) == 5:
+                # #rgba
+                return tuple(int(n, 16) / 0xf for n in color[1:])
+            else:
+                raise ValueError("Invalid hex color specifier: " + repr(original))
+
+        # rgb(), rgba(), hsl() and hsla() functions
+        functionColor = parseColorFunction(color)
+        if functionColor is not None:
+            return functionColor
+
+        # Gray level
+        try:
+            gray = float(color)
+        except ValueError:
+            pass
+        else:
+            if not (0 <= gray <= 1):
+                raise ValueError("Invalid string grayscale value " + repr(original) + ". Value must be within 0-1 range")
+            return gray, gray, gray, 1.
+
+        raise ValueError("Invalid RGBA argument: " + repr(original))
+
+    # Sequence of floats
+    try:
+        values = tuple(color)
+    except TypeError:
+        raise ValueError("Invalid RGBA argument: " + repr(original))
+    if len(values) not in [3, 4]:
+        raise ValueError("RGBA sequence should have length 3 or 4")
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+        raise ValueError("Invalid RGBA argument: " + repr(original))
+    values = tuple(float(value) for value in values)
+    if any(value < 0 or value > 1 for value in values):
+        raise ValueError("RGBA values should be within 0-1 range")
+    if len(values) == 3:
+        values = values + (1.,)
+    return values
+
+
+def to_rgb(color):
+    return to_rgba(color)[:3]
+
+
+########################################################################
+## CSS COLOR FUNCTIONS
+########################################################################
+COLOR_FUNCTION = re.compile(r"\s*(rgba?|hsla?)\s*\(([^)]*)\)\s*", re.IGNORECASE)
+
+
+def parseColorFunction(color):
+    match = COLOR_FUNCTION.fullmatch(color)
+    if match is None:
+        return None
+
+    name = match.group(1).lower()
+    arguments = [argument for argument in re.split(r"[\s,/]+", match.group(2).strip()) if len(argument) > 0]
+    if len(arguments) not in [3, 4]:
+        raise ValueError("Invalid RGBA argument: " + repr(color))
+
+    try:
+        if name.startswith("rgb"):
+            rgb = [parseColorChannel(argument, 255) for argument in arguments[:3]]
+        else:
+            hue = float(arguments[0].lower().replace("deg", "")) % 360 / 360
+            saturation = parseColorChannel(arguments[1], 100)
+            lightness = parseColorChannel(arguments[2], 100)
+            rgb = list(colorsys.hls_to_rgb(hue, lightness, saturation))
+
+        alpha = parseColorChannel(arguments[3], 1) if len(arguments) == 4 else 1.
+    except ValueError:
+        raise ValueError("Invalid RGBA argument: " + repr(color))
+
+    return tuple(min(1., max(0., value)) for value in rgb + [alpha])
+
+
+def parseColorChannel(argument, scale):
+    if argument.endswith("%"):
+        return float(argument[:-1]) / 100
+    return float(argument) / scale
+
+
+########################################################################
+## HEX COLORS
+########################################################################
+def rgb_to_hex(rgb):
+    hexColor = '%02x%02x%02x' % rgb
+    return "#" + str(hexColor)
+
+
+def to_hex(color):
+    return rgb_to_hex(tuple(int(round(value * 255)) for value in to_rgb(color)))
+
+
+########################################################################
+## ADJUST THE LIGHTNESS OF A COLOR
+########################################################################
+# Memoized HLS value of every base color and every computed shade
+hlsCache = {}
+shadeCache = {}
+
+
+def to_hls(color):
+    if not isinstance(color, str):
+        return colorsys.rgb_to_hls(*to_rgb(color))
+
+    if color not in hlsCache:
+        hlsCache[color] = colorsys.rgb_to_hls(*to_rgb(color))
+    return hlsCache[color]
+
+
+def adjust_lightness(color, amount=0.5):
+    if isinstance(color, str) and (color, amount) in shadeCache:
+        return shadeCache[(color, amount)]
+
+    c = to_hls(color)
+
+    if c[1] > 0:
+        rgb = colorsys.hls_to_rgb(c[0], amount * c[1], c[2])
+    else:
+        rgb = colorsys.hls_to_rgb(c[0], 1 - (amount * 1), c[2])
+
+    # Channels are scaled by 250, not 255, as the generated themes always were
+    newColor = rgb_to_hex((int(rgb[0] * 250), int(rgb[1] * 250), int(rgb[2] * 250)))
+
+    if isinstance(color, str):
+        shadeCache[(color, amount)] = newColor
+    return newColor
+
+
+########################################################################
+## PALETTE ENGINE
+########################################################################
+# Lightness amounts of every tonal scale
+BACKGROUND_SCALE = (1, 0.9, 0.8, 0.6, 0.5, 0.4)
+TEXT_SCALE = (1, 0.9, 0.8, 0.7)
+ACCENT_SCALE = (1, 0.8, 0.6, 0.4)
+ICONS_SCALE = (("FOCUS", 1.5), ("DISABLED", 0.5))
+
+
+def createPalettes(themes, backgroundScale=BACKGROUND_SCALE):
+    '''
+    Compute the tonal scales of several themes at once.
+
+    Every theme is a mapping with the keys used by getCurrentThemeInfo:
+    "background-color", "text-color", "accent-color" and "icons-color".
+    Missing or empty colors are skipped. Returns one plain mapping per
+    theme, from SCSS variable name (without $) to hex color.
+
+    '''
+    scales = [("background-color", "COLOR_BACKGROUND_", [(str(index + 1), amount) for index, amount in enumerate(backgroundScale)]),
+              ("text-color", "COLOR_TEXT_", [(str(index + 1), amount) for index, amount in enumerate(TEXT_SCALE)]),
+              ("accent-color", "COLOR_ACCENT_", [(str(index + 1), amount) for index, amount in enumerate(ACCENT_SCALE)]),
+              ("icons-color", "COLOR_ICONS_", list(ICONS_SCALE))]
+
+    # Every base color of every theme with its scale
+    requests = []
+    for theme in themes:
+        requests.append([(key, prefix, scale, str(theme[key])) for key, prefix, scale in scales
+                         if theme.get(key) is not None and theme.get(key) != ""])
+
+    # Compute every distinct shade once, themes sharing a color share its shades
+    shades = {}
+    for themeRequests in requests:
+        for key, prefix, scale, color in themeRequests:
+            for suffix, amount in scale:
+                shades[(color, amount)] = None
+    for color, amount in shades:
+        shades[(color, amount)] = adjust_lightness(color, amount)
+
+    palettes = []
+    for themeRequests in requests:
+        palette = {}
+        for key, prefix, scale, color in themeRequests:
+            if key == "icons-color":
+                palette["COLOR_ICONS"] = color
+            for suffix, amount in scale:
+                palette[prefix + suffix] = shades[(color, amount)]
+        palettes.append(palette)
+
+    return palettes
+
+
+def createPalette(theme, backgroundScale=BACKGROUND_SCALE):
+    return createPalettes([theme], backgroundScale)[0]
@@ -12,34 +12,11 @@ import sys
 # IMPORT PYSIDE
 from PySide6.QtCore import *
 
-import matplotlib.colors as mc
-import colorsys
+from .colorengine import adjust_lightness, rgb_to_hex, createPalette
 ########################################################################
 settings = QSettings()
 
 
-########################################################################
-## 
-########################################################################
-def adjust_lightness(color, amount=0.5):
-    try:
-        c = mc.cnames[color]
-    except:
-        c = color
-    c = colorsys.rgb_to_hls(*mc.to_rgb(c))
-
-    if c[1] > 0:
-        rgb = colorsys.hls_to_rgb(c[0], amount * c[1], c[2])
-    else:
-        rgb = colorsys.hls_to_rgb(c[0], 1 - (amount * 1), c[2])
-
-    newColor = rgb_to_hex((int(rgb[0] * 250), int(rgb[1] * 250), int(rgb[2] * 250)))
-    return newColor
-
-def rgb_to_hex(rgb):
-    hexColor = '%02x%02x%02x' % rgb
-    return "#"+str(hexColor)
-
 ########################################################################
 ## THEMES
 ########################################################################
@@ -49,23 +26,26 @@ class Dark:
     accent_color = "#A8B9BD"
     icons_color = "#ffffff"
 
-    BG_1 = adjust_lightness(bg_color, 1)
-    BG_2 = adjust_lightness(bg_color, 0.9)
-    BG_3 = adjust_lightness(bg_color, 0.8)
-    BG_4 = adjust_lightness(bg_color, 0.7)
-    BG_5 = adjust_lightness(bg_color, 0.5)
-    BG_6 = adjust_lightness(bg_color, 0.4)
-
-    CT_1 = adjust_lightness(txt_color, 1)
-    CT_2 = adjust_lightness(txt_color, 0.9)
-    CT_3 = adjust_lightness(txt_color, 0.8)
-    CT_4 = adjust_lightness(txt_color, 0.7)
-
-    CA_1 = adjust_lightness(accent_color, 1)
-    CA_2 = adjust_lightness(accent_color, .8)
-    CA_3 = adjust_lightness(accent_color, .6)
-    CA_4 = adjust_lightness(accent_color, .4)
-    
+    palette = createPalette({"background-color": bg_color, "text-color": txt_color, "accent-color": accent_color},
+                            (1, 0.9, 0.8, 0.7, 0.5, 0.4))
+
+    BG_1 = palette["COLOR_BACKGROUND_1"]
+    BG_2 = palette["COLOR_BACKGROUND_2"]
+    BG_3 = palette["COLOR_BACKGROUND_3"]
+    BG_4 = palette["COLOR_BACKGROUND_4"]
+    BG_5 = palette["COLOR_BACKGROUND_5"]
+    BG_6 = palette["COLOR_BACKGROUND_6"]
+
+    CT_1 = palette["COLOR_TEXT_1"]
+    CT_2 = palette["COLOR_TEXT_2"]
+    CT_3 = palette["COLOR_TEXT_3"]
+    CT_4 = palette["COLOR_TEXT_4"]
+
+    CA_1 = palette["COLOR_ACCENT_1"]
+    CA_2 = palette["COLOR_ACCENT_2"]
+    CA_3 = palette["COLOR_ACCENT_3"]
+    CA_4 = palette["COLOR_ACCENT_4"]
+
     ICONS = ":/icons/Icons/"
 
 
@@ -75,23 +55,26 @@ class Light:
     txt_color = "#000000"
     accent_color = "#00bcff"
     icons_color = ""
-    
-    BG_1 = adjust_lightness(bg_color, 1)
-    BG_2 = adjust_lightness(bg_color, 0.99)
-    BG_3 = adjust_lightness(bg_color, 0.95)
-    BG_4 = adjust_lightness(bg_color, 0.90)
-    BG_5 = adjust_lightness(bg_color, 0.85)
-    BG_6 = adjust_lightness(bg_color, 0.80)
-
-    CT_1 = adjust_lightness(txt_color, 1)
-    CT_2 = adjust_lightness(txt_color, 0.9)
-    CT_3 = adjust_lightness(txt_color, 0.8)
-    CT_4 = adjust_lightness(txt_color, 0.7)
-
-    CA_1 = adjust_lightness(accent_color, 1)
-    CA_2 = adjust_lightness(accent_color, .8)
-    CA_3 = adjust_lightness(accent_color, .6)
-    CA_4 = adjust_lightness(accent_color, .4)
+
+    palette = createPalette({"background-color": bg_color, "text-color": txt_color, "accent-color": accent_color},
+                            (1, 0.99, 0.95, 0.90, 0.85, 0.80))
+
+    BG_1 = palette["COLOR_BACKGROUND_1"]
+    BG_2 = palette["COLOR_BACKGROUND_2"]
+    BG_3 = palette["COLOR_BACKGROUND_3"]
+    BG_4 = palette["COLOR_BACKGROUND_4"]
+    BG_5 = palette["COLOR_BACKGROUND_5"]
+    BG_6 = palette["COLOR_BACKGROUND_6"]
+
+    CT_1 = palette["COLOR_TEXT_1"]
+    CT_2 = palette["COLOR_TEXT_2"]
+    CT_3 = palette["COLOR_TEXT_3"]
+    CT_4 = palette["COLOR_TEXT_4"]
+
+    CA_1 = palette["COLOR_ACCENT_1"]
+    CA_2 = palette["COLOR_ACCENT_2"]
+    CA_3 = palette["COLOR_ACCENT_3"]
+    CA_4 = palette["COLOR_ACCENT_4"]
 
     ICONS = ":/icons/Icons/"
 
@@ -163,16 +146,18 @@ class CreateColorVariable():
 
         return currentThemeInfo
         
-    def CreateVariables(self):
+    def getThemePalette(self):
         settings = QSettings()
         
         THEME = settings.value("THEME")
         themeFound = False
         if THEME == "LIGHT":
             theme = Light()
+            palette = Light.palette
 
         elif THEME == "DARK":
             theme = Dark()
+            palette = Dark.palette
 
         else:
             for themes in self.ui.themes:
@@ -190,72 +175,34 @@ class CreateColorVariable():
             if not themeFound:
                 theme = Light()
 
-
-            theme.BG_1 = adjust_lightness(theme.bg_color, 1)
-            theme.BG_2 = adjust_lightness(theme.bg_color, 0.90)
-            theme.BG_3 = adjust_lightness(theme.bg_color, 0.80)
-            theme.BG_4 = adjust_lightness(theme.bg_color, 0.60)
-            theme.BG_5 = adjust_lightness(theme.bg_color, 0.50)
-            theme.BG_6 = adjust_lightness(theme.bg_color, 0.40)
-
-            theme.CT_1 = adjust_lightness(theme.txt_color, 1)
-            theme.CT_2 = adjust_lightness(theme.txt_color, 0.9)
-            theme.CT_3 = adjust_lightness(theme.txt_color, 0.8)
-            theme.CT_4 = adjust_lightness(theme.txt_color, 0.7)
-
-            theme.CA_1 = adjust_lightness(theme.accent_color, 1)
-            theme.CA_2 = adjust_lightness(theme.accent_color, .8)
-            theme.CA_3 = adjust_lightness(theme.accent_color, .6)
-            theme.CA_4 = adjust_lightness(theme.accent_color, .4)
+            palette = createPalette({"background-color": theme.bg_color, "text-color": theme.txt_color,
+                                     "accent-color": theme.accent_color})
 
             theme.ICONS = ":/icons/Icons/"
 
         # Create global color variables
         self.theme = Object()
-        self.theme.COLOR_BACKGROUND_1 = theme.BG_1
-        self.theme.COLOR_BACKGROUND_2 = theme.BG_2
-        self.theme.COLOR_BACKGROUND_3 = theme.BG_3
-        self.theme.COLOR_BACKGROUND_4 = theme.BG_4
-        self.theme.COLOR_BACKGROUND_5 = theme.BG_5
-        self.theme.COLOR_BACKGROUND_6 = theme.BG_6
-
-        self.theme.COLOR_TEXT_1 = theme.CT_1
-        self.theme.COLOR_TEXT_2 = theme.CT_2
-        self.theme.COLOR_TEXT_3 = theme.CT_3
-        self.theme.COLOR_TEXT_4 = theme.CT_4
-
-        self.theme.COLOR_ACCENT_1 = theme.CA_1
-        self.theme.COLOR_ACCENT_2 = theme.CA_2
-        self.theme.COLOR_ACCENT_3 = theme.CA_3
-        self.theme.COLOR_ACCENT_4 = theme.CA_4
+        for name, color in palette.items():
+            setattr(self.theme, name, color)
 
         self.theme.PATH_RESOURCES = theme.ICONS
 
-        # scss_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '_variables.scss'))
-        scss_folder = os.path.abspath(os.path.join(os.getcwd(), 'QSS'))
-        if not os.path.exists(scss_folder):
-            os.makedirs(scss_folder)
+        return palette
 
-        scss_path = os.path.abspath(os.path.join(scss_folder, '_variables.scss'))
-        f = open(scss_path, 'w')
-        print(f"""
+    def CreateVariables(self):
+        palette = CreateColorVariable.getThemePalette(self)
+        CreateColorVariable.writeVariables(self, palette)
+
+        return palette
+
+    def returnVariables(self, palette):
+        colorVariables = "\n".join("        $" + name + ": " + color + ";" for name, color in palette.items())
+
+        return f"""
         //===================================================//
         // FILE AUTO-GENERATED, ANY CHANGES MADE WILL BE LOST //
         //====================================================//
-        $COLOR_BACKGROUND_1: {theme.BG_1};
-        $COLOR_BACKGROUND_2: {theme.BG_2};
-        $COLOR_BACKGROUND_3: {theme.BG_3}; 
-        $COLOR_BACKGROUND_4: {theme.BG_4}; 
-        $COLOR_BACKGROUND_5: {theme.BG_5}; 
-        $COLOR_BACKGROUND_6: {theme.BG_6}; 
-        $COLOR_TEXT_1: {theme.CT_1};
-        $COLOR_TEXT_2: {theme.CT_2};
-        $COLOR_TEXT_3: {theme.CT_3};
-        $COLOR_TEXT_4: {theme.CT_4};
-        $COLOR_ACCENT_1: {theme.CA_1};
-        $COLOR_ACCENT_2: {theme.CA_2};
-        $COLOR_ACCENT_3: {theme.CA_3};
-        $COLOR_ACCENT_4: {theme.CA_4};
+{colorVariables}
         $OPACITY_TOOLTIP: 230;
         $SIZE_BORDER_RADIUS: 4px;
         $BORDER_1: 1px solid $COLOR_BACKGROUND_1;
@@ -264,14 +211,27 @@ class CreateColorVariable():
         $BORDER_SELECTION_3: 1px solid $COLOR_ACCENT_3;
         $BORDER_SELECTION_2: 1px solid $COLOR_ACCENT_2;
         $BORDER_SELECTION_1: 1px solid $COLOR_ACCENT_1;
-        $PATH_RESOURCES: '{theme.ICONS}';
+        $PATH_RESOURCES: '{self.theme.PATH_RESOURCES}';
         //===================================================//
         // END //
         //====================================================//
-        """, file=f)
+        \n"""
 
+    def writeVariables(self, palette):
+        # scss_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '_variables.scss'))
+        scss_folder = os.path.abspath(os.path.join(os.getcwd(), 'QSS'))
+        if not os.path.exists(scss_folder):
+            os.makedirs(scss_folder)
+
+        variables = CreateColorVariable.returnVariables(self, palette)
+
+        scss_path = os.path.abspath(os.path.join(scss_folder, '_variables.scss'))
+        f = open(scss_path, 'w')
+        f.write(variables)
         f.close()
 
+        return variables
+
 ########################################################################
 ##
 ########################################################################
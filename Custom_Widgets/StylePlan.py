@@ -0,0 +1,275 @@
+########################################################################
+## IMPORTS
+########################################################################
+import json
+from collections import OrderedDict
+
+
+########################################################################
+## JSON SECTION HANDLERS
+## Sections are applied in registration order, unregistered sections
+## are ignored
+########################################################################
+styleSectionHandlers = OrderedDict()
+
+
+def registerStyleSection(section, handler, widgetSection=False, deferrable=False, singleEntry=False, compiler=None):
+    '''
+    Register handler(self, ui, sectionData) for a top level JSON section.
+
+    Widget sections are lists of entries with a "name" key, each entry
+    is applied on its own with sectionData set to a one entry list.
+    The handler may return the number of widgets it configured.
+    Entries of deferrable widget sections only touch the named widget,
+    so they can wait until that widget is first shown.
+    Single entry sections configure one object (the window, the app
+    settings), all their entries are merged into one.
+    A compiler(ui, data) validates an entry (or the whole section data)
+    and resolves the widgets it names once, when the plan is compiled.
+    The handler then receives the compiled entries instead of the JSON.
+
+    '''
+    if not callable(handler):
+        raise Exception("Error: The handler of the '" + str(section) + "' section is not callable")
+    if compiler is not None and not callable(compiler):
+        raise Exception("Error: The compiler of the '" + str(section) + "' section is not callable")
+
+    styleSectionHandlers[str(section)] = {"handler": handler, "widgetSection": bool(widgetSection),
+                                          "deferrable": bool(widgetSection) and bool(deferrable),
+                                          "singleEntry": not widgetSection and bool(singleEntry),
+                                          "compiler": compiler}
+
+
+def unregisterStyleSection(section):
+    if section in styleSectionHandlers:
+        del styleSectionHandlers[section]
+
+
+########################################################################
+## STYLE PLAN CLASS
+########################################################################
+class StylePlan():
+    '''
+    Flat list of style operations compiled from a JSON stylesheet.
+
+    Every operation is a dict with the section name, the widget name
+    (None for sections applied as a whole) and the section data to apply.
+    Entries of widget sections become one operation per widget. Plans
+    compiled for a ui also hold the "compiled" data of sections with a
+    compiler, with the widgets already resolved and the values validated.
+
+    '''
+
+    def __init__(self, operations=None, provenance=None):
+        self.operations = operations if operations is not None else []
+        # JSON key path -> file whose value was applied
+        self.provenance = provenance if provenance is not None else OrderedDict()
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __iter__(self):
+        return iter(self.operations)
+
+
+########################################################################
+## MERGE JSON STYLESHEETS
+## Later files win. Entries with a "name" are merged with the entry of
+## the same name, entries of single entry sections are merged into one
+## and other section entries are appended. Inside an entry, objects are
+## merged key by key and any other value is replaced.
+########################################################################
+def mergeJsonStyles(documents):
+    merged = OrderedDict()
+    provenance = OrderedDict()
+
+    for source, data in documents:
+        if not isinstance(data, dict):
+            raise Exception("Error: The JSON stylesheet '" + str(source) + "' must be an object, got " +
+                            type(data).__name__)
+
+        for section, value in data.items():
+            if isinstance(value, list) and section in styleSectionHandlers and \
+                    styleSectionHandlers[section]["singleEntry"]:
+                merged[section] = mergeSingleEntry(merged.get(section), value, section, source, provenance)
+            elif isinstance(value, list):
+                if not isinstance(merged.get(section), list):
+                    removeProvenance(provenance, section)
+                    merged[section] = []
+                mergeJsonEntries(merged[section], value, section, source, provenance)
+            else:
+                merged[section] = mergeJsonValue(merged.get(section), value, section, source, provenance)
+
+    return merged, provenance
+
+
+def isNamedEntry(entry):
+    return isinstance(entry, dict) and "name" in entry
+
+
+def mergeJsonEntries(entries, newEntries, path, source, provenance):
+    names = {}
+    for index, entry in enumerate(entries):
+        if isNamedEntry(entry):
+            names[str(entry["name"])] = index
+
+    for entry in newEntries:
+        if isNamedEntry(entry):
+            entryPath = path + "[" + str(entry["name"]) + "]"
+            if str(entry["name"]) in names:
+                index = names[str(entry["name"])]
+                entries[index] = mergeJsonValue(entries[index], entry, entryPath, source, provenance)
+                continue
+            names[str(entry["name"])] = len(entries)
+        else:
+            entryPath = path + "[" + str(len(entries)) + "]"
+
+        entries.append(mergeJsonValue(None, entry, entryPath, source, provenance))
+
+
+def mergeSingleEntry(entries, newEntries, path, source, provenance):
+    if isinstance(entries, list) and len(entries) == 1:
+        entry = entries[0]
+    else:
+        removeProvenance(provenance, path)
+        entry = None
+
+    for newEntry in newEntries:
+        entry = mergeJsonValue(entry, newEntry, path + "[0]", source, provenance)
+
+    if entry is None:
+        return []
+    return [entry]
+
+
+def mergeJsonValue(value, newValue, path, source, provenance):
+    if isinstance(newValue, dict):
+        if not isinstance(value, dict):
+            removeProvenance(provenance, path)
+            value = OrderedDict()
+        for key, item in newValue.items():
+            value[key] = mergeJsonValue(value.get(key), item, path + "." + key, source, provenance)
+        return value
+
+    if isinstance(newValue, list) and len(newValue) > 0 and all(isNamedEntry(entry) for entry in newValue) and \
+            (value is None or (isinstance(value, list) and all(isNamedEntry(entry) for entry in value))):
+        entries = list(value) if value is not None else []
+        mergeJsonEntries(entries, newValue, path, source, provenance)
+        return entries
+
+    # Scalars and unnamed lists replace the earlier value
+    removeProvenance(provenance, path)
+    provenance[path] = source
+    return newValue
+
+
+def removeProvenance(provenance, path):
+    # Forget the keys of a value that is being replaced
+    stale = [key for key in provenance if key == path or key.startswith(path + ".") or key.startswith(path + "[")]
+    for key in stale:
+        del provenance[key]
+
+
+########################################################################
+## COMPILE JSON STYLESHEET DATA INTO A STYLE PLAN
+## With a ui, every operation is also resolved, so invalid entries or
+## missing widgets fail before anything is applied
+########################################################################
+def compileStylePlan(data, ui=None):
+    if not isinstance(data, dict):
+        raise Exception("Error: The JSON stylesheet must be an object, got " + type(data).__name__)
+
+    sections = [section for section in styleSectionHandlers if section in data]
+
+    operations = []
+    for section in sections:
+        sectionData = data[section]
+
+        if styleSectionHandlers[section]["widgetSection"]:
+            if not isinstance(sectionData, list):
+                raise Exception("Error: '" + section + "' must be a list of widget entries")
+
+            for entry in sectionData:
+                # Entries without a widget name are ignored when applied
+                if not isinstance(entry, dict) or "name" not in entry or len(str(entry["name"])) == 0:
+                    continue
+                operations.append({"section": section, "name": str(entry["name"]), "data": entry})
+        else:
+            operations.append({"section": section, "name": None, "data": sectionData})
+
+    if ui is not None:
+        for operation in operations:
+            resolveStyleOperation(operation, ui)
+
+    return StylePlan(operations)
+
+
+########################################################################
+## RESOLVE THE WIDGETS OF A SINGLE OPERATION
+########################################################################
+def resolveStyleOperation(operation, ui):
+    section = styleSectionHandlers.get(operation["section"])
+    if section is None or section["compiler"] is None or "compiled" in operation:
+        return operation
+
+    operation["compiled"] = section["compiler"](ui, operation["data"])
+    return operation
+
+
+########################################################################
+## RETURN THE SECTION DATA OF A SINGLE OPERATION
+########################################################################
+def returnOperationData(operation):
+    data = operation.get("compiled", operation["data"])
+    if operation["name"] is None:
+        return data
+    return [data]
+
+
+########################################################################
+## DIFF TWO STYLE PLANS
+########################################################################
+def returnOperationKey(operation):
+    return (operation["section"], operation["name"])
+
+
+def diffStylePlans(oldPlan, newPlan):
+    # Returns the new or changed operations of newPlan (in plan order)
+    # and the operations of oldPlan that no longer exist
+    oldOperations = {}
+    if oldPlan is not None:
+        for operation in oldPlan:
+            oldOperations[returnOperationKey(operation)] = operation
+
+    changed = []
+    newKeys = set()
+    for operation in newPlan:
+        key = returnOperationKey(operation)
+        newKeys.add(key)
+        if key not in oldOperations or oldOperations[key]["data"] != operation["data"]:
+            changed.append(operation)
+
+    removed = [operation for key, operation in oldOperations.items() if key not in newKeys]
+    return changed, removed
+
+
+########################################################################
+## RETURN THE MERGED STYLE PLAN OF ONE OR MORE JSON FILES
+########################################################################
+def returnStylePlan(jsonFiles, ui=None):
+    if isinstance(jsonFiles, str):
+        jsonFiles = [jsonFiles]
+
+    documents = []
+    for jsonFile in jsonFiles:
+        with open(jsonFile, "rb") as file:
+            content = file.read()
+        try:
+            documents.append((jsonFile, json.loads(content.decode("utf-8"))))
+        except ValueError as error:
+            raise Exception("Error reading your JSON file '" + str(jsonFile) + "' : " + str(error))
+
+    data, provenance = mergeJsonStyles(documents)
+    plan = compileStylePlan(data, ui)
+    plan.provenance = provenance
+    return plan
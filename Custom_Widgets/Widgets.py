@@ -7,6 +7,10 @@ from .Qss import SassCompiler
 CompileStyleSheet = SassCompiler.CompileStyleSheet
 
 from .Qss.SvgToPngIcons import NewIconsGenerator
+from .AnimationClock import ClockAnimation
+from .StylePlan import StylePlan, compileStylePlan, returnStylePlan, returnOperationData, returnOperationKey, \
+    diffStylePlans, registerStyleSection, unregisterStyleSection, resolveStyleOperation, \
+    styleSectionHandlers
 
 
 try:
@@ -20,6 +24,9 @@ except ModuleNotFoundError:
 
 # JSON FOR READING THE JSON STYLESHEET
 import json
+import re
+import time
+from collections import OrderedDict
 
 class CustomQSlider(QtWidgets.QSlider):
     def __init__(self, parent=None):
@@ -84,6 +91,9 @@ class QCustomPushButtonGroup(QPushButton):
         if group is None:
             raise Exception("Unknown button group. The button does not belong to any group")
         setattr(self.groupParent, "group_active_" + str(group), style)
+        if getattr(self.groupParent, "group_property_mode_" + str(group), False):
+            applyButtonGroupPropertyStyle(self.groupParent, group)
+            return
         group_btns = self.getButtonGroupButtons()
         for x in group_btns:
             if x.active:
@@ -94,30 +104,74 @@ class QCustomPushButtonGroup(QPushButton):
         if group is None:
             raise Exception("Unknown button group. The button does not belong to any group")
         setattr(self.groupParent, "group_not_active_" + str(group), style)
+        if getattr(self.groupParent, "group_property_mode_" + str(group), False):
+            applyButtonGroupPropertyStyle(self.groupParent, group)
+
+
+########################################################################
+## BUTTON GROUP PROPERTY MODE
+## ACTIVE AND NOT ACTIVE STYLES ARE COMPILED ONCE INTO A SELECTOR ON THE
+## "groupActive" DYNAMIC PROPERTY, SWITCHING THE ACTIVE BUTTON ONLY
+## REPOLISHES THE PREVIOUS AND THE NEW ACTIVE BUTTON
+########################################################################
+def returnButtonGroupPropertyStyle(activeStyle, notActiveStyle):
+    return 'QPushButton[groupActive="true"]{' + str(activeStyle) + '} ' \
+           'QPushButton[groupActive="false"]{' + str(notActiveStyle) + '}'
+
+
+def isButtonGroupPropertyStyle(activeStyle, notActiveStyle):
+    # Styles with their own selectors can not be nested in the property selector
+    return not any(brace in str(activeStyle) + str(notActiveStyle) for brace in "{}")
+
+
+def applyButtonGroupPropertyStyle(groupParent, group):
+    activeStyle = getattr(groupParent, "group_active_" + str(group))
+    notActiveStyle = getattr(groupParent, "group_not_active_" + str(group))
+
+    if not isButtonGroupPropertyStyle(activeStyle, notActiveStyle):
+        # Fall back to setting the stylesheets on every click
+        setattr(groupParent, "group_property_mode_" + str(group), False)
+        for btn in getattr(groupParent, "group_btns_" + str(group)):
+            if btn.active:
+                btn.setStyleSheet(activeStyle)
+            else:
+                btn.setStyleSheet(notActiveStyle)
+        return
+
+    style = returnButtonGroupPropertyStyle(activeStyle, notActiveStyle)
+    for btn in getattr(groupParent, "group_btns_" + str(group)):
+        btn.setProperty("groupActive", bool(btn.active))
+        btn.setStyleSheet(style)
+
+
+def setButtonGroupPropertyActive(btn, active):
+    btn.active = active
+    btn.setProperty("groupActive", active)
+    btn.style().unpolish(btn)
+    btn.style().polish(btn)
+    btn.update()
 
 
 class QCustomQPushButton(QtWidgets.QPushButton):
     def __init__(self, parent=None):
         super().__init__(parent)
         ########################################################################
-        ## CREATE ANIMATION
+        ## ANIMATIONS ARE CREATED ON THE FIRST ENTER/PRESS EVENT
         ########################################################################
-        self._animation = QtCore.QVariantAnimation()
-        self._animation.setStartValue(0.00001)
-        self._animation.setEndValue(0.9999)
-        self._animation.valueChanged.connect(self._animate)
-
-        # DEAFAULT ANIMATION DURATION
-        self._animation.setDuration(500)
+        self._buttonAnimation = None
+        self._buttonShadowAnimation = None
 
-        self._shadowAnimation = QtCore.QVariantAnimation()
-        self._shadowAnimation.setStartValue(0)
-        self._shadowAnimation.setEndValue(10)
-        self._shadowAnimation.valueChanged.connect(self._animateShadow)
-        # self._shadowAnimation.setEasingCurve(QtCore.QEasingCurve.OutQuad)
+        # ANIMATION STATES: "idle", "animating-in", "active" OR "animating-out"
+        self._animationState = "idle"
+        self._shadowAnimationState = "idle"
 
         # DEAFAULT ANIMATION DURATION
-        self._shadowAnimation.setDuration(500)
+        self.animationDuration = 500
+        self.animationEasingCurve = QtCore.QEasingCurve.Linear
+
+        # DEAFAULT SHADOW ANIMATION DURATION
+        self.shadowAnimationDuration = 500
+        self.shadowAnimationEndValue = 10
 
         # DEFAULT COLOR
         self.color1 = None
@@ -147,6 +201,90 @@ class QCustomQPushButton(QtWidgets.QPushButton):
         # SET DEFAULT SHADOW EVENT TO NONE
         self.applyShadowOn = None
 
+        # ANIMATE BUTTON USING STYLESHEETS BY DEFAULT
+        self.renderMode = "stylesheet"
+
+        # DO NOT QUANTIZE ANIMATION PROGRESS BY DEFAULT
+        self.animationSteps = None
+
+        # ANIMATED SHADOWS USE QGraphicsDropShadowEffect BY DEFAULT
+        self.shadowRenderMode = "effect"
+        self._shadowSprite = None
+
+        # PAINT RENDER MODE VALUES
+        self._animationProgress = 0.00001
+        self._paintActive = False
+        self._paintGradients = None
+
+    ########################################################################
+    ## ANIMATION PROGRESS PROPERTY (USED BY THE PAINT RENDER MODE)
+    ########################################################################
+    def getAnimationProgress(self):
+        return self._animationProgress
+
+    def setAnimationProgress(self, value):
+        self._animationProgress = float(value)
+        self.update()
+
+    animationProgress = QtCore.Property(float, getAnimationProgress, setAnimationProgress)
+
+    ########################################################################
+    ## CREATE ANIMATIONS
+    ## ALL BUTTON ANIMATIONS ARE DRIVEN BY THE SHARED ANIMATION CLOCK
+    ########################################################################
+    def _createAnimations(self):
+        if self._buttonAnimation is not None:
+            return
+
+        self._buttonAnimation = ClockAnimation(0.00001, 0.9999, self.animationDuration)
+        self._buttonAnimation.setEasingCurve(self.animationEasingCurve)
+        self._buttonAnimation.valueChanged.connect(self._animate)
+        self._buttonAnimation.finished.connect(self._animationFinished)
+
+        self._buttonShadowAnimation = ClockAnimation(0, self.shadowAnimationEndValue, self.shadowAnimationDuration)
+        self._buttonShadowAnimation.valueChanged.connect(self._animateShadow)
+        self._buttonShadowAnimation.finished.connect(self._shadowAnimationFinished)
+
+        # STOP BOTH ANIMATIONS IF THE BUTTON IS DELETED WHILE THEY RUN
+        animations = (self._buttonAnimation, self._buttonShadowAnimation)
+        self.destroyed.connect(lambda: [animation.stop() for animation in animations])
+
+    @property
+    def _animation(self):
+        self._createAnimations()
+        return self._buttonAnimation
+
+    @property
+    def _shadowAnimation(self):
+        self._createAnimations()
+        return self._buttonShadowAnimation
+
+    ########################################################################
+    ## SET BUTTON ANIMATION DURATION AND EASING CURVE
+    ########################################################################
+    def setObjectAnimationDuration(self, duration):
+        self.animationDuration = int(duration)
+        if self._buttonAnimation is not None:
+            self._buttonAnimation.setDuration(self.animationDuration)
+
+    def setObjectAnimationEasingCurve(self, easingCurve):
+        self.animationEasingCurve = easingCurve
+        if self._buttonAnimation is not None:
+            self._buttonAnimation.setEasingCurve(easingCurve)
+
+    ########################################################################
+    ## SET BUTTON SHADOW ANIMATION DURATION AND BLUR RADIUS
+    ########################################################################
+    def setShadowAnimationDuration(self, duration):
+        self.shadowAnimationDuration = int(duration)
+        if self._buttonShadowAnimation is not None:
+            self._buttonShadowAnimation.setDuration(self.shadowAnimationDuration)
+
+    def setShadowAnimationEndValue(self, blurRadius):
+        self.shadowAnimationEndValue = int(blurRadius)
+        if self._buttonShadowAnimation is not None:
+            self._buttonShadowAnimation.setEndValue(self.shadowAnimationEndValue)
+
     ########################################################################
     ## BUTTON THEMES
     ########################################################################
@@ -194,6 +332,8 @@ class QCustomQPushButton(QtWidgets.QPushButton):
         else:
             raise Exception("Unknown theme '" + str(theme) + "'")
 
+        self._paintGradients = None
+
     ########################################################################
     ## SET BUTTON THEME
     ########################################################################
@@ -201,21 +341,46 @@ class QCustomQPushButton(QtWidgets.QPushButton):
         self.color1 = QtGui.QColor(color1)
         self.color2 = QtGui.QColor(color2)
 
+        self._paintGradients = None
+
     ########################################################################
     ## SET BUTTON ANIMATION
     ########################################################################
     def setObjectAnimation(self, animation):
         self.setObjectAnimate = str(animation)
 
+    ########################################################################
+    ## SET THE NUMBER OF DISTINCT ANIMATION FRAMES (STYLESHEET RENDER MODE)
+    ########################################################################
+    def setObjectAnimationSteps(self, steps):
+        if steps is None or int(steps) == 0:
+            self.animationSteps = None
+        elif int(steps) > 0:
+            self.animationSteps = int(steps)
+        else:
+            raise Exception("setObjectAnimationSteps() only accepts positive numbers, " + str(steps) + " given instead")
+
+    ########################################################################
+    ## SET BUTTON ANIMATION RENDER MODE
+    ## "stylesheet" REBUILDS THE BUTTON STYLESHEET ON EVERY ANIMATION FRAME
+    ## "paint" DRAWS THE ANIMATED GRADIENTS INSIDE paintEvent
+    ########################################################################
+    def setObjectRenderMode(self, mode):
+        if str(mode) not in ("stylesheet", "paint"):
+            raise Exception("Unknown render mode '" + str(mode) + "'. Supported modes are 'stylesheet' and 'paint'")
+
+        self.renderMode = str(mode)
+        self._paintActive = False
+
     ########################################################################
     ## SET BUTTON ANIMATION EVENT TRIGGER
     ########################################################################
     def setObjectAnimateOn(self, trigger):
         self.setObjectAnimatedOn = trigger
         if str(trigger) == "click":
-            self._animation.setDuration(200)
+            self.setObjectAnimationDuration(200)
         else:
-            self._animation.setDuration(500)
+            self.setObjectAnimationDuration(500)
 
     ########################################################################
     ## SET BUTTON STYLESHEET TO BE AOOLIED AFTER ANIMATION IS OVER
@@ -230,22 +395,84 @@ class QCustomQPushButton(QtWidgets.QPushButton):
     def setObjectDefaultStyle(self, style):
         self.defaultStyle = str(style)
 
+        self._paintGradients = None
+
+    ########################################################################
+    ## BUTTON ANIMATION STATE MACHINE
+    ## idle -> animating-in -> active -> animating-out -> idle
+    ########################################################################
+    def _animateIn(self):
+        self._animationState = "animating-in"
+        self._animation.setDirection(QtCore.QAbstractAnimation.Forward)
+        self._animation.start()
+
+    def _animateOut(self):
+        self._animationState = "animating-out"
+        self._animation.setDirection(QtCore.QAbstractAnimation.Backward)
+        self._animation.start()
+
+    def _animationFinished(self):
+        if self._animationState == "animating-in":
+            self._animationState = "active"
+        elif self._animationState == "animating-out":
+            self._animationState = "idle"
+            self.applyDefaultStyle()
+
+    def _animateShadowIn(self):
+        self._shadowAnimationState = "animating-in"
+        self._shadowAnimation.setDirection(QtCore.QAbstractAnimation.Forward)
+        self._shadowAnimation.start()
+
+    def _animateShadowOut(self):
+        self._shadowAnimationState = "animating-out"
+        self._shadowAnimation.setDirection(QtCore.QAbstractAnimation.Backward)
+        self._shadowAnimation.start()
+
+    def _shadowAnimationFinished(self):
+        if self._shadowAnimationState == "animating-in":
+            self._shadowAnimationState = "active"
+        elif self._shadowAnimationState == "animating-out":
+            self._shadowAnimationState = "idle"
+            self.removeButtonShadow()
+
+    ########################################################################
+    ## SET ANIMATED SHADOW RENDER MODE
+    ## "effect" ANIMATES THE QGraphicsDropShadowEffect BLUR RADIUS
+    ## "sprite" COMPOSITES PRE-RENDERED SHADOW PIXMAPS BEHIND THE BUTTON
+    ########################################################################
+    def setShadowRenderMode(self, mode):
+        if str(mode) not in ("effect", "sprite"):
+            raise Exception("Unknown shadow render mode '" + str(mode) + "'. Supported modes are 'effect' and 'sprite'")
+
+        self.shadowRenderMode = str(mode)
+
+    def shadowSprite(self):
+        # The sprite is drawn by a sibling widget, a button without a parent
+        # falls back to the shadow effect
+        if self.parentWidget() is None:
+            return None
+        if self._shadowSprite is None:
+            self._shadowSprite = ShadowSpriteRenderer(self)
+            self._shadowSprite.destroyed.connect(self._shadowSpriteDestroyed)
+        return self._shadowSprite
+
+    def _shadowSpriteDestroyed(self):
+        self._shadowSprite = None
+
     ########################################################################
     ## SET BUTTON BUTTON HOVER IN EVENT
     ########################################################################
     def enterEvent(self, event):
         self.mousePosition = "over"
         if self.setObjectAnimatedOn == "hover" or self.setObjectAnimatedOn is None:
-            self._animation.setDirection(QtCore.QAbstractAnimation.Forward)
-            self._animation.start()
+            self._animateIn()
         #
         if self.setIconAnimatedOn == "hover":
             if hasattr(self, 'anim'):
                 self.anim.start()
         if self.applyShadowOn == "hover":
             if self.animateShadow:
-                self._shadowAnimation.setDirection(QtCore.QAbstractAnimation.Forward)
-                self._shadowAnimation.start()
+                self._animateShadowIn()
 
             else:
                 self.setGraphicsEffect(self.shadow)
@@ -258,16 +485,11 @@ class QCustomQPushButton(QtWidgets.QPushButton):
     def leaveEvent(self, event):
         self.mousePosition = "out"
         if self.setObjectAnimatedOn == "hover" or self.setObjectAnimatedOn is None:
-            self._animation.setDirection(QtCore.QAbstractAnimation.Backward)
-            self._animation.start()
-            self._animation.finished.connect(lambda: self.applyDefaultStyle())
+            self._animateOut()
 
         if self.applyShadowOn == "hover":
             if self.animateShadow:
-                self._shadowAnimation.setDirection(QtCore.QAbstractAnimation.Backward)
-                self._shadowAnimation.start()
-                self._shadowAnimation.finished.connect(lambda: self.removeButtonShadow())
-                # disconnect(self._shadowAnimation.finished, self.removeButtonShadow())
+                self._animateShadowOut()
 
         super().leaveEvent(event)
 
@@ -277,16 +499,14 @@ class QCustomQPushButton(QtWidgets.QPushButton):
     def mousePressEvent(self, event):
         self.clickPosition = "down"
         if self.setObjectAnimatedOn == "click":
-            self._animation.setDirection(QtCore.QAbstractAnimation.Forward)
-            self._animation.start()
+            self._animateIn()
         #
         if self.setIconAnimatedOn == "click":
             if hasattr(self, 'anim'):
                 self.anim.start()
         if self.applyShadowOn == "click":
             if self.animateShadow:
-                self._shadowAnimation.setDirection(QtCore.QAbstractAnimation.Forward)
-                self._shadowAnimation.start()
+                self._animateShadowIn()
             else:
                 self.setGraphicsEffect(self.shadow)
 
@@ -298,14 +518,10 @@ class QCustomQPushButton(QtWidgets.QPushButton):
     def mouseReleaseEvent(self, event):
         self.clickPosition = "up"
         if self.setObjectAnimatedOn == "click":
-            self._animation.setDirection(QtCore.QAbstractAnimation.Backward)
-            self._animation.start()
-            self._animation.finished.connect(lambda: self.applyDefaultStyle())
+            self._animateOut()
         if self.applyShadowOn == "click":
             if self.animateShadow:
-                self._shadowAnimation.setDirection(QtCore.QAbstractAnimation.Backward)
-                self._shadowAnimation.start()
-                self._shadowAnimation.finished.connect(lambda: self.removeButtonShadow())
+                self._animateShadowOut()
             else:
                 self.setGraphicsEffect(self.shadow)
         super().mouseReleaseEvent(event)
@@ -318,6 +534,10 @@ class QCustomQPushButton(QtWidgets.QPushButton):
     ##
     ########################################################################
     def removeButtonShadow(self):
+        if self.shadowRenderMode == "sprite" and self.shadowSprite() is not None:
+            self.shadowSprite().setBlurRadius(self._shadowAnimation.startValue())
+            return
+
         # self.shadow.setBlurRadius(0)
         #######################################################################
         ## # Appy shadow to button
@@ -333,6 +553,9 @@ class QCustomQPushButton(QtWidgets.QPushButton):
             if self.fallBackStyle is None:
                 pass
             else:
+                # STOP PAINTING THE ANIMATED GRADIENTS
+                self._paintActive = False
+
                 if self.defaultStyle is not None:
                     self.setStyleSheet(str(self.defaultStyle + self.fallBackStyle))
                 else:
@@ -350,49 +573,145 @@ class QCustomQPushButton(QtWidgets.QPushButton):
     ## ANIMATE BUTTON BACKGROUND AND BORDER
     ########################################################################
     def _animate(self, value):
-        color_stop = 1
-        if self.defaultStyle is not None:
-            qss = str(self.defaultStyle)
-        else:
-            qss = """
-
-            """
+        if self.renderMode == "paint":
+            self._animatePaint(value)
+            return
 
         if self.color1 is not None or self.color2 is not None:
-            grad = "background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {color1}, stop:{value} {color2}, stop: 1.0 {color1});".format(
-                color1=self.color1.name(), color2=self.color2.name(), value=value
-            )
+            if self.animationSteps is not None:
+                # QUANTIZE ANIMATION PROGRESS SO THAT FRAMES SHARE THE SAME STYLESHEET
+                value = min(0.9999, max(0.00001, round(value * self.animationSteps) / self.animationSteps))
 
-            style = """
-                border-top-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.466, stop: """ + str(
-                value) + """  """ + str(self.color1.name()) + """, stop: """ + str(color_stop) + """  """ + str(
-                self.color2.name()) + """);
-                border-bottom-color: qlineargradient(spread:pad, x1:1, y1:0.5, x2:0, y2:0.5, stop: """ + str(
-                value) + """ """ + str(self.color1.name()) + """, stop: """ + str(color_stop) + """  """ + str(
-                self.color2.name()) + """);
-                border-right-color: qlineargradient(spread:pad, x1:0.5, y1:0, x2:0.5, y2:1, stop:""" + str(
-                value) + """  """ + str(self.color1.name()) + """, stop: """ + str(color_stop) + """  """ + str(
-                self.color2.name()) + """);
-                border-left-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop: """ + str(
-                value) + """ """ + str(self.color1.name()) + """, stop: """ + str(color_stop) + """  """ + str(
-                self.color2.name()) + """);
+            qss = returnAnimatedButtonStyle(self.color1.name(), self.color2.name(), self.setObjectAnimate,
+                                            self.defaultStyle, value)
 
-            """
+            if qss != self.styleSheet():
+                self.setStyleSheet(qss)
 
-            if self.setObjectAnimate == "border":
-                qss += style
-            elif self.setObjectAnimate == "background":
-                qss += grad
+    ########################################################################
+    ## ANIMATE BUTTON BACKGROUND AND BORDER FROM paintEvent
+    ########################################################################
+    def _animatePaint(self, value):
+        if self.color1 is None and self.color2 is None:
+            return
+
+        if not self._paintActive:
+            # THE STATIC STYLE IS APPLIED ONCE PER ANIMATION, THE ANIMATED
+            # BACKGROUND AND BORDER ARE DRAWN UNDERNEATH IT
+            if self.defaultStyle is not None:
+                qss = str(self.defaultStyle)
             else:
-                qss += grad
-                qss += style
+                qss = ""
 
+            if self.setObjectAnimate != "border":
+                qss += "background-color: transparent;"
+            if self.setObjectAnimate != "background":
+                qss += "border-color: transparent;"
+
+            self._paintActive = True
             self.setStyleSheet(qss)
 
+        self.setAnimationProgress(value)
+
+    def _paintColors(self):
+        # Same opaque colors as the stylesheet mode, which animates color.name()
+        color1 = self.color1 if self.color1 is not None else self.color2
+        color2 = self.color2 if self.color2 is not None else self.color1
+        return QtGui.QColor(color1.name()), QtGui.QColor(color2.name())
+
+    def _createPaintGradients(self):
+        rect = QtCore.QRectF(self.rect())
+        style = str(self.defaultStyle) if self.defaultStyle is not None else ""
+
+        borderWidth = returnStyleLength(style, "border-width")
+        if borderWidth is None:
+            borderWidth = returnStyleLength(style, "border")
+        if borderWidth is None:
+            borderWidth = 0
+
+        borderRadius = returnStyleLength(style, "border-radius")
+        if borderRadius is None:
+            borderRadius = 0
+
+        def point(x, y):
+            return QtCore.QPointF(rect.left() + x * rect.width(), rect.top() + y * rect.height())
+
+        outerPath = QtGui.QPainterPath()
+        outerPath.addRoundedRect(rect, borderRadius, borderRadius)
+
+        innerRect = rect.adjusted(borderWidth, borderWidth, -borderWidth, -borderWidth)
+        innerRadius = max(0, borderRadius - borderWidth)
+        innerPath = QtGui.QPainterPath()
+        innerPath.addRoundedRect(innerRect, innerRadius, innerRadius)
+
+        # EACH BORDER SIDE OWNS THE TRIANGLE BETWEEN THE WIDGET CENTER AND THAT SIDE
+        center = rect.center()
+        corners = {
+            "top": (rect.topLeft(), rect.topRight()),
+            "right": (rect.topRight(), rect.bottomRight()),
+            "bottom": (rect.bottomRight(), rect.bottomLeft()),
+            "left": (rect.bottomLeft(), rect.topLeft())
+        }
+        borderPaths = {}
+        for side in corners:
+            sidePath = QtGui.QPainterPath()
+            sidePath.addPolygon(QtGui.QPolygonF([center, corners[side][0], corners[side][1]]))
+            sidePath.closeSubpath()
+            borderPaths[side] = outerPath.subtracted(innerPath).intersected(sidePath)
+
+        self._paintGradients = {
+            "background": QtGui.QLinearGradient(point(0, 0), point(1, 0)),
+            "top": QtGui.QLinearGradient(point(0, 0.5), point(1, 0.466)),
+            "bottom": QtGui.QLinearGradient(point(1, 0.5), point(0, 0.5)),
+            "right": QtGui.QLinearGradient(point(0.5, 0), point(0.5, 1)),
+            "left": QtGui.QLinearGradient(point(0.5, 1), point(0.5, 0)),
+            "backgroundPath": outerPath,
+            "borderPaths": borderPaths,
+            "borderWidth": borderWidth
+        }
+
+    ########################################################################
+    ## PAINT ANIMATED BUTTON BACKGROUND AND BORDER
+    ########################################################################
+    def paintEvent(self, event):
+        if self.renderMode == "paint" and self._paintActive and (self.color1 is not None or self.color2 is not None):
+            if self._paintGradients is None:
+                self._createPaintGradients()
+
+            gradients = self._paintGradients
+            value = self._animationProgress
+            color1, color2 = self._paintColors()
+
+            painter = QtGui.QPainter(self)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.setPen(QtCore.Qt.NoPen)
+
+            if self.setObjectAnimate != "border":
+                gradients["background"].setStops([(0, color1), (value, color2), (1.0, color1)])
+                painter.fillPath(gradients["backgroundPath"], QtGui.QBrush(gradients["background"]))
+
+            if self.setObjectAnimate != "background" and gradients["borderWidth"] > 0:
+                for side in ("top", "bottom", "right", "left"):
+                    gradients[side].setStops([(value, color1), (1, color2)])
+                    painter.fillPath(gradients["borderPaths"][side], QtGui.QBrush(gradients[side]))
+
+            painter.end()
+
+        super().paintEvent(event)
+
+    def resizeEvent(self, event):
+        self._paintGradients = None
+        super().resizeEvent(event)
+
     ########################################################################
     ## ANIMATE BUTTON SHADOW
     ########################################################################
     def _animateShadow(self, value):
+        if self.shadowRenderMode == "sprite" and self.shadowSprite() is not None:
+            # Composite a pre-rendered shadow instead of re-blurring the button
+            self.shadowSprite().setBlurRadius(value)
+            return
+
         # Animate the transition
         self.shadow.setBlurRadius(value)
         #######################################################################
@@ -401,6 +720,269 @@ class QCustomQPushButton(QtWidgets.QPushButton):
         self.setGraphicsEffect(self.shadow)
 
 
+########################################################################
+## ANIMATED BUTTON STYLESHEET CACHE
+########################################################################
+class ButtonStyleCache():
+    def __init__(self, maxSize=512):
+        self.maxSize = maxSize
+        self.styles = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        if key in self.styles:
+            self.hits += 1
+            self.styles.move_to_end(key)
+            return self.styles[key]
+
+        self.misses += 1
+        return None
+
+    def add(self, key, style):
+        self.styles[key] = style
+        self.styles.move_to_end(key)
+        while len(self.styles) > self.maxSize:
+            self.styles.popitem(last=False)
+
+    def setMaxSize(self, maxSize):
+        self.maxSize = int(maxSize)
+        while len(self.styles) > self.maxSize:
+            self.styles.popitem(last=False)
+
+    def clear(self):
+        self.styles.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def cacheInfo(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.styles), "maxSize": self.maxSize}
+
+
+buttonStyleCache = ButtonStyleCache()
+
+
+########################################################################
+## PRE-RENDERED BUTTON SHADOWS
+########################################################################
+class ShadowSpriteRenderer(QWidget):
+    def __init__(self, buttonObject):
+        super().__init__(buttonObject.parentWidget())
+
+        self.buttonObject = buttonObject
+
+        # Number of distinct blur radii rendered for the animation
+        self.steps = 8
+
+        self.blurRadius = None
+        self.pixmap = None
+
+        # Sprites that are not needed yet are rendered one per idle pass
+        self.prerenderTimer = QtCore.QTimer(self)
+        self.prerenderTimer.setInterval(0)
+        self.prerenderTimer.timeout.connect(self.prerenderNext)
+
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.hide()
+
+        buttonObject.installEventFilter(self)
+        # The sprite widget belongs to the button's parent, remove it with the button
+        buttonObject.destroyed.connect(self.deleteLater)
+
+    ########################################################################
+    ## QUANTIZE BLUR RADIUS
+    ########################################################################
+    def quantizeBlurRadius(self, blurRadius):
+        maxBlurRadius = max(1, int(self.buttonObject.shadowAnimationEndValue))
+        step = max(1.0, maxBlurRadius / self.steps)
+        return int(min(maxBlurRadius, round(round(blurRadius / step) * step)))
+
+    def spriteMargin(self):
+        return 2 * max(1, int(self.buttonObject.shadowAnimationEndValue))
+
+    def spriteKey(self, blurRadius):
+        shadow = self.buttonObject.shadow
+        borderRadius = returnStyleLength(self.buttonObject.styleSheet(), "border-radius") or 0
+        return "QCustomShadowSprite-" + "-".join(str(x) for x in (
+            self.buttonObject.width(), self.buttonObject.height(), borderRadius,
+            shadow.color().name(QColor.HexArgb), self.spriteMargin(), blurRadius))
+
+    ########################################################################
+    ## RENDER ALL SPRITES FOR THE CURRENT BUTTON SIZE AND SHAPE
+    ########################################################################
+    def prerender(self):
+        for blurRadius in self.spriteBlurRadii():
+            self.spritePixmap(blurRadius)
+
+    def spriteBlurRadii(self):
+        blurRadii = []
+        for blurRadius in range(0, int(self.buttonObject.shadowAnimationEndValue) + 1):
+            blurRadius = self.quantizeBlurRadius(blurRadius)
+            if blurRadius not in blurRadii:
+                blurRadii.append(blurRadius)
+        return blurRadii
+
+    def schedulePrerender(self):
+        if not self.prerenderTimer.isActive():
+            self.prerenderTimer.start()
+
+    def prerenderNext(self):
+        # Render the next missing sprite, stop once all of them are cached
+        for blurRadius in self.spriteBlurRadii():
+            if QPixmapCache.find(self.spriteKey(blurRadius)) is None:
+                self.spritePixmap(blurRadius)
+                return
+        self.prerenderTimer.stop()
+
+    def spritePixmap(self, blurRadius):
+        key = self.spriteKey(blurRadius)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self.renderSprite(blurRadius)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def renderSprite(self, blurRadius):
+        margin = self.spriteMargin()
+        rect = QtCore.QRectF(margin, margin, self.buttonObject.width(), self.buttonObject.height())
+        borderRadius = returnStyleLength(self.buttonObject.styleSheet(), "border-radius") or 0
+
+        shape = QImage(self.buttonObject.width() + 2 * margin, self.buttonObject.height() + 2 * margin,
+                       QImage.Format_ARGB32_Premultiplied)
+        shape.fill(QtCore.Qt.transparent)
+        painter = QPainter(shape)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(self.buttonObject.shadow.color())
+        painter.drawRoundedRect(rect, borderRadius, borderRadius)
+        painter.end()
+
+        if blurRadius <= 0:
+            return QPixmap.fromImage(shape)
+
+        # Blur the shape once, the result is reused for every animation frame
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+        blur = QGraphicsBlurEffect()
+        blur.setBlurRadius(blurRadius)
+        blur.setBlurHints(QGraphicsBlurEffect.QualityHint)
+        item.setGraphicsEffect(blur)
+        scene.addItem(item)
+
+        sprite = QImage(shape.size(), QImage.Format_ARGB32_Premultiplied)
+        sprite.fill(QtCore.Qt.transparent)
+        painter = QPainter(sprite)
+        scene.render(painter, QtCore.QRectF(sprite.rect()), QtCore.QRectF(sprite.rect()))
+        painter.end()
+
+        return QPixmap.fromImage(sprite)
+
+    ########################################################################
+    ## UPDATE SHADOW
+    ########################################################################
+    def setBlurRadius(self, blurRadius):
+        if self.pixmap is None:
+            # Only the current frame is rendered now, the others when idle
+            self.schedulePrerender()
+
+        blurRadius = self.quantizeBlurRadius(blurRadius)
+        if blurRadius != self.blurRadius or self.pixmap is None:
+            self.blurRadius = blurRadius
+            self.pixmap = self.spritePixmap(blurRadius)
+            self.update()
+
+        if not self.isVisible() and self.buttonObject.isVisible() and self.syncGeometry():
+            self.show()
+
+    def syncGeometry(self):
+        if self.buttonObject.parentWidget() is None:
+            # Never turn the sprite into a top level window
+            self.hide()
+            return False
+
+        if self.parentWidget() is not self.buttonObject.parentWidget():
+            self.setParent(self.buttonObject.parentWidget())
+
+        margin = self.spriteMargin()
+        geometry = self.buttonObject.geometry().adjusted(-margin, -margin, margin, margin)
+        self.setGeometry(geometry.translated(int(self.buttonObject.shadow.xOffset()),
+                                             int(self.buttonObject.shadow.yOffset())))
+        self.stackUnder(self.buttonObject)
+        return True
+
+    def eventFilter(self, obj, event):
+        if obj is self.buttonObject and self.pixmap is not None:
+            if event.type() == QtCore.QEvent.Resize:
+                self.pixmap = self.spritePixmap(self.blurRadius)
+                self.syncGeometry()
+                self.update()
+                self.schedulePrerender()
+            elif event.type() in (QtCore.QEvent.Move, QtCore.QEvent.ParentChange):
+                self.syncGeometry()
+            elif event.type() == QtCore.QEvent.Show:
+                if self.syncGeometry():
+                    self.show()
+            elif event.type() == QtCore.QEvent.Hide:
+                self.hide()
+
+        return False
+
+    def paintEvent(self, event):
+        if self.pixmap is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self.pixmap)
+            painter.end()
+
+
+########################################################################
+## RETURN ANIMATED BUTTON BACKGROUND AND BORDER STYLESHEET
+########################################################################
+def returnAnimatedButtonStyle(color1, color2, animation, defaultStyle, value):
+    key = (color1, color2, animation, defaultStyle, value)
+    qss = buttonStyleCache.get(key)
+    if qss is not None:
+        return qss
+
+    color_stop = 1
+    if defaultStyle is not None:
+        qss = str(defaultStyle)
+    else:
+        qss = """
+
+            """
+
+    grad = "background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {color1}, stop:{value} {color2}, stop: 1.0 {color1});".format(
+        color1=color1, color2=color2, value=value
+    )
+
+    style = """
+                border-top-color: qlineargradient(spread:pad, x1:0, y1:0.5, x2:1, y2:0.466, stop: """ + str(
+        value) + """  """ + str(color1) + """, stop: """ + str(color_stop) + """  """ + str(
+        color2) + """);
+                border-bottom-color: qlineargradient(spread:pad, x1:1, y1:0.5, x2:0, y2:0.5, stop: """ + str(
+        value) + """ """ + str(color1) + """, stop: """ + str(color_stop) + """  """ + str(
+        color2) + """);
+                border-right-color: qlineargradient(spread:pad, x1:0.5, y1:0, x2:0.5, y2:1, stop:""" + str(
+        value) + """  """ + str(color1) + """, stop: """ + str(color_stop) + """  """ + str(
+        color2) + """);
+                border-left-color: qlineargradient(spread:pad, x1:0.5, y1:1, x2:0.5, y2:0, stop: """ + str(
+        value) + """ """ + str(color1) + """, stop: """ + str(color_stop) + """  """ + str(
+        color2) + """);
+
+            """
+
+    if animation == "border":
+        qss += style
+    elif animation == "background":
+        qss += grad
+    else:
+        qss += grad
+        qss += style
+
+    buttonStyleCache.add(key, qss)
+    return qss
+
+
 ########################################################################
 ##
 ########################################################################
@@ -458,7 +1040,7 @@ def applyButtonShadow(buttonObject, **shadowCustomization):
 
     if "blurRadius" in shadowCustomization and int(shadowCustomization['blurRadius']) > 0:
         buttonObject.shadow.setBlurRadius(int(shadowCustomization['blurRadius']))
-        buttonObject._shadowAnimation.setEndValue(int(shadowCustomization['blurRadius']))
+        buttonObject.setShadowAnimationEndValue(int(shadowCustomization['blurRadius']))
     else:
         buttonObject.shadow.setBlurRadius(10)
 
@@ -486,8 +1068,10 @@ def applyButtonShadow(buttonObject, **shadowCustomization):
 
         if "animateShadow" in shadowCustomization and shadowCustomization['animateShadow'] == True:
             buttonObject.animateShadow = True
+            if "shadowRenderMode" in shadowCustomization and len(str(shadowCustomization['shadowRenderMode'])) > 0:
+                buttonObject.setShadowRenderMode(shadowCustomization['shadowRenderMode'])
             if "animateShadowDuration" in shadowCustomization and int(shadowCustomization['animateShadowDuration']) > 0:
-                buttonObject._shadowAnimation.setDuration(int(shadowCustomization['animateShadowDuration']))
+                buttonObject.setShadowAnimationDuration(int(shadowCustomization['animateShadowDuration']))
         else:
             buttonObject.animateShadow = False
 
@@ -564,10 +1148,20 @@ You can customize the animations using a JSon file or Python statements
 """
 
 
+########################################################################
+## Sent to a page before it is rendered without being shown, so that
+## work waiting for the page Show event (deferred styles) is done first
+########################################################################
+PageSnapshotEvent = QtCore.QEvent.Type(QtCore.QEvent.registerEventType())
+
+
 ########################################################################
 ## QStackedWidget Class
 ########################################################################
 class QCustomStackedWidget(QtWidgets.QStackedWidget):
+    # Emitted with the page index once the last requested navigation is done
+    targetReached = Signal(int)
+
     def __init__(self, parent=None):
         super(QCustomStackedWidget, self).__init__(parent)
 
@@ -596,6 +1190,77 @@ class QCustomStackedWidget(QtWidgets.QStackedWidget):
         self._currentWidgetPosition = QtCore.QPoint(0, 0)
         # Default boolean for active widget
         self.widgetActive = False
+        # Default slide transition mode, "widget" moves the live pages,
+        # "snapshot" slides pixmaps of both pages on an overlay
+        self.slideTransitionMode = "widget"
+        # Snapshot overlay and animation (created on first snapshot transition)
+        self._snapshotOverlay = None
+        self._snapshotAnimation = None
+        # Fade overlay (created on first fade transition and reused)
+        self._fader = None
+        # Idle prewarming of likely next pages (created when enabled)
+        self._prewarmer = None
+        # Pages wired to navigation buttons
+        self._navigationTargets = []
+
+        ########################################################################
+        ## Page snapshot cache
+        ########################################################################
+        # Maximum memory used by cached page pixmaps (bytes)
+        self.snapshotCacheBudget = 64 * 1024 * 1024
+        # Partial repaints smaller than this (pixels), such as a blinking
+        # text cursor, do not change the page snapshot
+        self.snapshotMinimumUpdateArea = 256
+        self._snapshotCache = OrderedDict()
+        self._snapshotCacheSize = 0
+        # Pages whose descendants are watched for changes
+        self._snapshotWatchedPages = set()
+        # Watched widget -> page containing it
+        self._snapshotWidgetPages = {}
+        # Pages whose widget map is rebuilt once control returns to the event loop
+        self._snapshotStalePages = set()
+        self._snapshotMapTimer = QtCore.QTimer(self)
+        self._snapshotMapTimer.setSingleShot(True)
+        self._snapshotMapTimer.setInterval(0)
+        self._snapshotMapTimer.timeout.connect(self._rebuildStalePageWidgets)
+        # Pages whose own show event has been received
+        self._snapshotShownPages = set()
+        # Pages shown since their last repaint, the repaint exposing them
+        # does not change their content
+        self._snapshotExposedPages = set()
+        self._snapshotExposeTimer = QtCore.QTimer(self)
+        self._snapshotExposeTimer.setSingleShot(True)
+        self._snapshotExposeTimer.setInterval(0)
+        self._snapshotExposeTimer.timeout.connect(self._snapshotExposedPages.clear)
+        # Pages relaid out because the fader was shown or hidden on them
+        self._snapshotFaderLayoutPages = set()
+        # Guard against invalidating a page while it is being rendered
+        self._capturingSnapshot = False
+        # Capture the current page once it stopped repainting
+        self._snapshotTimer = QtCore.QTimer(self)
+        self._snapshotTimer.setSingleShot(True)
+        self._snapshotTimer.setInterval(250)
+        self._snapshotTimer.timeout.connect(self.captureCurrentPageSnapshot)
+        self.currentChanged.connect(self.scheduleCurrentPageSnapshot)
+
+        ########################################################################
+        ## Lazy pages
+        ########################################################################
+        # Minutes before an unvisited lazy page is destroyed (None = never)
+        self.pageEvictionTime = None
+        self._pageEvictionTimer = None
+        # Page shown before the current one changed, its idle time starts when it is left
+        self._lazyCurrentPage = None
+        self.currentChanged.connect(self._lazyPageChanged)
+
+        ########################################################################
+        ## Navigation requests
+        ########################################################################
+        # Latest page requested while a transition is running
+        self._pendingWidget = None
+        # Jump running transitions to their end when a new page is requested
+        self.navigationFastForward = False
+        self._slideAnimationGroup = None
 
     ########################################################################
     ## Function to update transition direction
@@ -645,12 +1310,40 @@ class QCustomStackedWidget(QtWidgets.QStackedWidget):
         else:
             raise Exception("setSlideTransition() only accepts boolean variables")
 
+    ########################################################################
+    ## Function to update slide transition mode
+    ########################################################################
+    def setSlideTransitionMode(self, mode):
+        if str(mode) not in ("widget", "snapshot"):
+            raise Exception("Unknown slide transition mode '" + str(mode) + "'. Supported modes are 'widget' and 'snapshot'")
+
+        self.slideTransitionMode = str(mode)
+
+    ########################################################################
+    ## Function to update navigation fast forward
+    ########################################################################
+    def setNavigationFastForward(self, fastForward):
+        if isinstance(fastForward, bool):
+            self.navigationFastForward = fastForward
+        else:
+            raise Exception("setNavigationFastForward() only accepts boolean variables")
+
+    ########################################################################
+    ## Function to return the index of the page being navigated to
+    ########################################################################
+    def targetIndex(self):
+        if self._pendingWidget is not None:
+            return self.indexOf(self._pendingWidget)
+        if self.widgetActive:
+            return self.nextWidget
+        return self.currentIndex()
+
     ########################################################################
     ## Function to transition to previous widget
     ########################################################################
     @QtCore.Slot()
     def slideToPreviousWidget(self):
-        currentWidgetIndex = self.currentIndex()
+        currentWidgetIndex = self.targetIndex()
         if currentWidgetIndex > 0:
             self.slideToWidgetIndex(currentWidgetIndex - 1)
 
@@ -659,7 +1352,7 @@ class QCustomStackedWidget(QtWidgets.QStackedWidget):
     ########################################################################
     @QtCore.Slot()
     def slideToNextWidget(self):
-        currentWidgetIndex = self.currentIndex()
+        currentWidgetIndex = self.targetIndex()
         if currentWidgetIndex < (self.count() - 1):
             self.slideToWidgetIndex(currentWidgetIndex + 1)
 
@@ -671,17 +1364,24 @@ class QCustomStackedWidget(QtWidgets.QStackedWidget):
             index = index % self.count()
         elif index < 0:
             index = (index + self.count()) % self.count()
+        self.ensurePage(self.widget(index))
         if self.slideTransition:
             self.slideToWidget(self.widget(index))
         else:
             self.setCurrentIndex(index)
+            self.targetReached.emit(index)
 
     ########################################################################
     ## Function to transition to a given widget
     ########################################################################
     def slideToWidget(self, newWidget):
-        # If the widget is active, exit the function
+        self.ensurePage(newWidget)
+
+        # If a transition is running, only remember the latest requested page
         if self.widgetActive:
+            self._pendingWidget = newWidget
+            if self.navigationFastForward:
+                self.fastForwardTransition()
             return
 
         # Update widget active bool
@@ -694,6 +1394,7 @@ class QCustomStackedWidget(QtWidgets.QStackedWidget):
         # If current widget index is equal to next widget index, exit function
         if _currentWidgetIndex == _nextWidgetIndex:
             self.widgetActive = False
+            self.targetReached.emit(_currentWidgetIndex)
             return
 
         # Get X and Y position of QStackedWidget
@@ -717,6 +1418,12 @@ class QCustomStackedWidget(QtWidgets.QStackedWidget):
                 # Left right transition
                 offsetY = 0
 
+        if self.slideTransitionMode == "snapshot":
+            self.nextWidget = _nextWidgetIndex
+            self.currentWidget = _currentWidgetIndex
+            self.snapshotSlide(QtCore.QPoint(offsetX, offsetY))
+            return
+
         nextWidgetPosition = self.widget(_nextWidgetIndex).pos()
         currentWidgetPosition = self.widget(_currentWidgetIndex).pos()
         self._currentWidgetPosition = currentWidgetPosition
@@ -750,105 +1457,751 @@ class QCustomStackedWidget(QtWidgets.QStackedWidget):
         self.currentWidget = _currentWidgetIndex
 
         self.widgetActive = True
+        self._slideAnimationGroup = anim_group
         anim_group.start(QtCore.QAbstractAnimation.DeleteWhenStopped)
 
         # Play fade animation
         if self.fadeTransition:
-            FadeWidgetTransition(self, self.widget(_currentWidgetIndex), self.widget(_nextWidgetIndex))
+            self.fader().fade(self.widget(_currentWidgetIndex), self.widget(_nextWidgetIndex))
 
     ########################################################################
     ## Function to hide old widget and show new widget after animation is done
     ########################################################################
     @QtCore.Slot()
     def animationDoneSlot(self):
+        self._slideAnimationGroup = None
         self.setCurrentIndex(self.nextWidget)
         self.widget(self.currentWidget).hide()
         self.widget(self.currentWidget).move(self._currentWidgetPosition)
         self.widgetActive = False
+        self.processPendingNavigation()
 
     ########################################################################
-    ## Function extending the QStackedWidget setCurrentWidget to animate transition
+    ## Function to jump the running transition to its end
     ########################################################################
-    @QtCore.Slot()
-    def setCurrentWidget(self, widget):
-        currentIndex = self.currentIndex()
-        nextIndex = self.indexOf(widget)
-        if self.currentIndex() == self.indexOf(widget):
-            return
-        if self.slideTransition:
-            self.slideToWidgetIndex(nextIndex)
+    def fastForwardTransition(self):
+        if self._slideAnimationGroup is not None:
+            self._slideAnimationGroup.setCurrentTime(self._slideAnimationGroup.totalDuration())
+        elif self._snapshotAnimation is not None and \
+                self._snapshotAnimation.state() == QtCore.QAbstractAnimation.Running:
+            self._snapshotAnimation.setCurrentTime(self._snapshotAnimation.totalDuration())
 
-        if self.fadeTransition:
-            self.fader_widget = FadeWidgetTransition(self, self.widget(self.currentIndex()),
-                                                     self.widget(self.indexOf(widget)))
-            if not self.slideTransition:
-                self.setCurrentIndex(nextIndex)
+    ########################################################################
+    ## Function to go to the latest page requested during a transition
+    ########################################################################
+    def processPendingNavigation(self):
+        pendingWidget = self._pendingWidget
+        self._pendingWidget = None
 
-        if not self.slideTransition and not self.fadeTransition:
-            self.setCurrentIndex(nextIndex)
+        if pendingWidget is not None and self.indexOf(pendingWidget) != self.currentIndex():
+            self.slideToWidget(pendingWidget)
+        else:
+            self.targetReached.emit(self.currentIndex())
 
+    ########################################################################
+    ## Function to update idle page prewarming
+    ########################################################################
+    def setPagePrewarm(self, prewarmState):
+        if not isinstance(prewarmState, bool):
+            raise Exception("setPagePrewarm() only accepts boolean variables")
+
+        if prewarmState and self._prewarmer is None:
+            self._prewarmer = StackedWidgetPrewarmer(self)
+            self.currentChanged.connect(self._prewarmer.schedule)
+            self._prewarmer.schedule()
+        elif not prewarmState and self._prewarmer is not None:
+            self.currentChanged.disconnect(self._prewarmer.schedule)
+            self._prewarmer.stop()
+            self._prewarmer.deleteLater()
+            self._prewarmer = None
+
+    def addNavigationTarget(self, page):
+        if page not in self._navigationTargets:
+            self._navigationTargets.append(page)
 
-########################################################################
-## Fade widget class
-########################################################################
-class FadeWidgetTransition(QWidget):
-    def __init__(self, animationSettings, oldWidget, newWidget):
-        QWidget.__init__(self, newWidget)
+    ########################################################################
+    ## Pages most likely to be shown next
+    ########################################################################
+    def prewarmCandidates(self):
+        candidates = []
+        index = self.currentIndex()
+        for candidateIndex in (index + 1, index - 1):
+            if 0 <= candidateIndex < self.count():
+                candidates.append(self.widget(candidateIndex))
+        for page in self._navigationTargets:
+            if self.indexOf(page) >= 0 and page not in candidates:
+                candidates.append(page)
+        return candidates
 
-        self.oldPixmap = QPixmap(newWidget.size())
-        oldWidget.render(self.oldPixmap)
-        self.pixmapOpacity = 1.0
+    ########################################################################
+    ## Polish, lay out and snapshot a page that is not shown yet
+    ########################################################################
+    def prewarmPage(self, page):
+        # Building lazy pages is left to navigation
+        if isinstance(page, QCustomLazyPage) and not page.isBuilt():
+            return False
 
-        self.timeline = QTimeLine()
-        self.timeline.valueChanged.connect(self.animate)
-        self.timeline.finished.connect(self.close)
-        self.timeline.setDuration(animationSettings.fadeTime)
-        self.timeline.setEasingCurve(animationSettings.fadeEasingCurve)
-        self.timeline.start()
+        if page in self._snapshotCache or page is self.widget(self.currentIndex()):
+            return False
 
-        self.resize(newWidget.size())
-        self.show()
+        # Do not push recently shown pages out of the cache
+        size = self.contentsRect().size() * page.devicePixelRatio()
+        if self._snapshotCacheSize + size.width() * size.height() * 4 > self.snapshotCacheBudget:
+            return False
 
-    def paintEvent(self, event):
-        painter = QPainter()
-        painter.begin(self)
-        painter.setOpacity(self.pixmapOpacity)
-        painter.drawPixmap(0, 0, self.oldPixmap)
-        painter.end()
+        # QStackedLayout only resizes the current page
+        if page.geometry() != self.contentsRect():
+            page.setGeometry(self.contentsRect())
 
-    def animate(self, value):
-        self.pixmapOpacity = 1.0 - value
-        self.repaint()
+        page.ensurePolished()
+        for child in page.findChildren(QWidget):
+            child.ensurePolished()
+        if page.layout() is not None:
+            page.layout().activate()
 
+        self._capturePageSnapshot(page)
+        return True
 
-class QMainWindow(QMainWindow):
-    def __init__(self, parent=None):
-        super().__init__(parent)
+    ########################################################################
+    ## Function to check for a running slide or fade transition
+    ########################################################################
+    def transitionRunning(self):
+        return self.widgetActive or (self._fader is not None and self._fader.isActive())
 
-    #######################################################################
-    # Add mouse events to the window
-    #######################################################################
-    def mousePressEvent(self, event):
-        # ###############################################
-        # Get the current position of the mouse
-        self.clickPosition = event.globalPos()
-        # We will use this value to move the window
-        # Hide floating widgets
-        cursor = QtGui.QCursor()
-        xPos = cursor.pos().x()
-        yPos = cursor.pos().y()
-        if hasattr(self, "floatingWidgets"):
-            for x in self.floatingWidgets:
-                if hasattr(x, "autoHide") and x.autoHide:
-                    x.collapseMenu()
+    ########################################################################
+    ## Function to return the fade overlay shared by all fade transitions
+    ########################################################################
+    def fader(self):
+        if self._fader is None:
+            self._fader = FadeWidgetTransition(self)
+            self._fader.installEventFilter(self)
+        return self._fader
 
-    #######################################################################
-    #######################################################################
+    ########################################################################
+    ## Function to slide pixmaps of the current and next widget
+    ########################################################################
+    def snapshotSlide(self, offset):
+        currentWidget = self.widget(self.currentWidget)
+        nextWidget = self.widget(self.nextWidget)
 
-    #######################################################################
-    # Update restore button icon on maximizing or minimizing window
-    #######################################################################
-    def updateRestoreButtonIcon(self):
+        # Cached page snapshots keep the device pixel ratio
+        oldPixmap = self.pageSnapshot(currentWidget)
+        newPixmap = self.pageSnapshot(nextWidget)
+
+        if self._snapshotOverlay is None:
+            self._snapshotOverlay = StackedWidgetSnapshotOverlay(self)
+            self._snapshotAnimation = QtCore.QPropertyAnimation(self._snapshotOverlay, b"progress", self)
+            self._snapshotAnimation.setStartValue(0.0)
+            self._snapshotAnimation.setEndValue(1.0)
+            self._snapshotAnimation.finished.connect(self.snapshotAnimationDoneSlot)
+
+        self._snapshotOverlay.setSnapshots(oldPixmap, newPixmap, offset, self.fadeTransition)
+        self._snapshotOverlay.setGeometry(self.frameRect())
+        self._snapshotOverlay.show()
+        self._snapshotOverlay.raise_()
+
+        # The overlay replaces the live page until the animation is done
+        currentWidget.hide()
+
+        self._snapshotAnimation.setDuration(self.transitionTime)
+        self._snapshotAnimation.setEasingCurve(self.transitionEasingCurve)
+        self._snapshotAnimation.start()
+
+    ########################################################################
+    ## Function to swap in the next widget after the snapshot animation
+    ########################################################################
+    @QtCore.Slot()
+    def snapshotAnimationDoneSlot(self):
+        self.setCurrentIndex(self.nextWidget)
+        self._snapshotOverlay.hide()
+        self._snapshotOverlay.clearSnapshots()
+        self.widgetActive = False
+        self.processPendingNavigation()
+
+    ########################################################################
+    ## PAGE SNAPSHOT CACHE
+    ########################################################################
+    def setSnapshotCacheBudget(self, budget):
+        self.snapshotCacheBudget = int(budget)
+        self._trimSnapshotCache()
+
+    ########################################################################
+    ## Return a pixmap of the page, rendering it only when the cached
+    ## snapshot was invalidated
+    ########################################################################
+    def pageSnapshot(self, page):
+        pixmap = self._snapshotCache.get(page)
+        if pixmap is not None and pixmap.deviceIndependentSize().toSize() == page.size():
+            self._snapshotCache.move_to_end(page)
+            return pixmap
+
+        return self._capturePageSnapshot(page)
+
+    def invalidatePageSnapshot(self, page):
+        self._removePageSnapshot(page)
+
+        if page is self.widget(self.currentIndex()):
+            self.scheduleCurrentPageSnapshot()
+
+    def clearSnapshotCache(self):
+        self._snapshotCache.clear()
+        self._snapshotCacheSize = 0
+
+    @QtCore.Slot()
+    def scheduleCurrentPageSnapshot(self, index=None):
+        self._snapshotTimer.start()
+
+    @QtCore.Slot()
+    def captureCurrentPageSnapshot(self):
+        page = self.widget(self.currentIndex())
+        # Pages of a stacked widget that is not shown are captured on demand
+        if page is None or page in self._snapshotCache or not page.isVisible():
+            return
+
+        # Wait for running transitions, their overlays must not be captured
+        if self.transitionRunning():
+            self._snapshotTimer.start()
+            return
+
+        self._capturePageSnapshot(page)
+
+    def _capturePageSnapshot(self, page):
+        # grab() does not send a Show event. Ancestors are notified too, the
+        # page may sit on a hidden page of an outer stacked widget.
+        widget = page
+        while widget is not None:
+            QtCore.QCoreApplication.sendEvent(widget, QtCore.QEvent(PageSnapshotEvent))
+            widget = widget.parentWidget()
+        self._watchPage(page)
+
+        self._capturingSnapshot = True
+        try:
+            pixmap = page.grab()
+        finally:
+            self._capturingSnapshot = False
+
+        pixmapBytes = self._snapshotBytes(pixmap)
+        if pixmapBytes > self.snapshotCacheBudget:
+            return pixmap
+
+        self._removePageSnapshot(page)
+        self._snapshotCache[page] = pixmap
+        self._snapshotCacheSize += pixmapBytes
+        self._trimSnapshotCache()
+
+        return pixmap
+
+    def _removePageSnapshot(self, page):
+        pixmap = self._snapshotCache.pop(page, None)
+        if pixmap is not None:
+            self._snapshotCacheSize -= self._snapshotBytes(pixmap)
+
+    def _trimSnapshotCache(self):
+        # Drop least recently used snapshots
+        while self._snapshotCacheSize > self.snapshotCacheBudget and len(self._snapshotCache) > 0:
+            page, pixmap = self._snapshotCache.popitem(last=False)
+            self._snapshotCacheSize -= self._snapshotBytes(pixmap)
+
+    def _snapshotBytes(self, pixmap):
+        # Pixmap size is in device pixels (w * h * dpr^2)
+        return pixmap.width() * pixmap.height() * 4
+
+    def _watchPage(self, page):
+        if page in self._snapshotWatchedPages:
+            return
+        self._snapshotWatchedPages.add(page)
+
+        if page.isVisible():
+            self._snapshotShownPages.add(page)
+
+        page.destroyed.connect(lambda: self._unwatchPage(page))
+        self._watchWidget(page, page)
+
+    def _watchWidget(self, widget, page):
+        # Transition overlays are not part of the page content
+        if isinstance(widget, (FadeWidgetTransition, StackedWidgetSnapshotOverlay)):
+            return
+
+        # Installing the same filter twice does not duplicate it
+        widget.installEventFilter(self)
+        self._snapshotWidgetPages[widget] = page
+        for child in widget.findChildren(QWidget):
+            if not isinstance(child, (FadeWidgetTransition, StackedWidgetSnapshotOverlay)):
+                child.installEventFilter(self)
+                self._snapshotWidgetPages[child] = page
+
+    def _unwatchPage(self, page):
+        self._snapshotWatchedPages.discard(page)
+        self._snapshotShownPages.discard(page)
+        self._snapshotExposedPages.discard(page)
+        self._snapshotFaderLayoutPages.discard(page)
+        self._snapshotStalePages.discard(page)
+        self._forgetPageWidgets(page)
+
+    @QtCore.Slot()
+    def _rebuildStalePageWidgets(self):
+        # Drop widgets removed from the pages (and their deleted descendants)
+        stalePages = self._snapshotStalePages
+        self._snapshotStalePages = set()
+        for page in stalePages:
+            # Deleted pages are no longer watched
+            if page in self._snapshotWatchedPages:
+                self._forgetPageWidgets(page)
+                self._watchWidget(page, page)
+
+    def _forgetPageWidgets(self, page):
+        for widget in [widget for widget, widgetPage in self._snapshotWidgetPages.items() if widgetPage is page]:
+            del self._snapshotWidgetPages[widget]
+
+    def _snapshotPageOf(self, widget):
+        # Events of watched widgets are mapped to their page without walking up the parents
+        page = self._snapshotWidgetPages.get(widget)
+        if page is not None:
+            return page
+
+        while widget is not None and widget.parentWidget() is not self:
+            widget = widget.parentWidget()
+        return widget
+
+    def eventFilter(self, obj, event):
+        if self._capturingSnapshot or not obj.isWidgetType():
+            return False
+
+        if obj is self._fader:
+            if event.type() in (QtCore.QEvent.Show, QtCore.QEvent.Hide) and obj.parentWidget() is not self:
+                # The page receives a layout request, its content is unchanged
+                self._snapshotFaderLayoutPages.add(obj.parentWidget())
+            return False
+
+        page = self._snapshotPageOf(obj)
+        if page is None:
+            return False
+
+        eventType = event.type()
+
+        if eventType in (QtCore.QEvent.ChildAdded, QtCore.QEvent.ChildRemoved) and \
+                isinstance(event.child(), (FadeWidgetTransition, StackedWidgetSnapshotOverlay)):
+            # The shared fader moves to the page being entered on every fade
+            return False
+
+        if eventType == QtCore.QEvent.ChildAdded:
+            if event.child().isWidgetType():
+                self._watchWidget(event.child(), page)
+                self.invalidatePageSnapshot(page)
+
+        elif eventType == QtCore.QEvent.ChildRemoved:
+            # Deleted children are no longer widgets when this event arrives.
+            # Removing many children rebuilds the page map only once.
+            self._snapshotStalePages.add(page)
+            self._snapshotMapTimer.start()
+            self.invalidatePageSnapshot(page)
+
+        elif eventType == QtCore.QEvent.LayoutRequest:
+            # Showing or hiding the fader relays out its page
+            if page in self._snapshotFaderLayoutPages:
+                self._snapshotFaderLayoutPages.discard(page)
+            else:
+                self.invalidatePageSnapshot(page)
+
+        elif eventType in (QtCore.QEvent.Resize, QtCore.QEvent.StyleChange):
+            self.invalidatePageSnapshot(page)
+
+        elif eventType == QtCore.QEvent.Paint:
+            # Content changes without a layout change (text, values...)
+            # repaint the widget, cursor blinks and other small partial
+            # updates are ignored. Pages moving or repainted under the
+            # fader during a transition do not change.
+            if self.transitionRunning():
+                return False
+
+            if page in self._snapshotExposedPages:
+                # The page is painted before its children, the exposing
+                # paint pass is over once control returns to the event loop
+                if obj is page:
+                    self._snapshotExposeTimer.start()
+                return False
+
+            updateRect = event.rect()
+            if updateRect == obj.rect() or updateRect.width() * updateRect.height() >= self.snapshotMinimumUpdateArea:
+                self.invalidatePageSnapshot(page)
+
+        elif eventType in (QtCore.QEvent.Show, QtCore.QEvent.Hide):
+            if obj is page:
+                # Switching pages does not change their content
+                if eventType == QtCore.QEvent.Show:
+                    self._snapshotShownPages.add(page)
+                    self._snapshotExposedPages.add(page)
+                else:
+                    self._snapshotShownPages.discard(page)
+                    self._snapshotExposedPages.discard(page)
+            elif page in self._snapshotShownPages:
+                # Descendant shown or hidden while its page is visible.
+                # Show/hide events cascading from the page itself arrive
+                # before the page show and after the page hide.
+                self.invalidatePageSnapshot(page)
+
+        return False
+
+    ########################################################################
+    ## LAZY PAGES
+    ########################################################################
+    def addLazyWidget(self, factory, name=None):
+        return self.insertLazyWidget(self.count(), factory, name)
+
+    def insertLazyWidget(self, index, factory, name=None):
+        page = QCustomLazyPage(factory, self)
+        if name is not None:
+            page.setObjectName(str(name))
+        return self.insertWidget(index, page)
+
+    def lazyPage(self, name):
+        for index in range(self.count()):
+            page = self.widget(index)
+            if isinstance(page, QCustomLazyPage) and page.objectName() == str(name):
+                return page
+        return None
+
+    ########################################################################
+    ## Build the page widget if the page is a lazy page
+    ########################################################################
+    def ensurePage(self, page):
+        if isinstance(page, QCustomLazyPage):
+            page.build()
+            page.lastVisited = time.monotonic()
+
+    ########################################################################
+    ## Destroy lazy pages that have not been shown for the given minutes
+    ########################################################################
+    def setPageEvictionTime(self, minutes):
+        self.pageEvictionTime = minutes
+
+        if minutes is None:
+            if self._pageEvictionTimer is not None:
+                self._pageEvictionTimer.stop()
+            return
+
+        if self._pageEvictionTimer is None:
+            self._pageEvictionTimer = QtCore.QTimer(self)
+            self._pageEvictionTimer.timeout.connect(self.evictIdlePages)
+        # Check at most once a minute
+        self._pageEvictionTimer.start(int(min(60, max(1, minutes * 60 / 2)) * 1000))
+
+    @QtCore.Slot()
+    def evictIdlePages(self):
+        if self.pageEvictionTime is None:
+            return
+
+        now = time.monotonic()
+        currentPage = self.widget(self.currentIndex())
+        for index in range(self.count()):
+            page = self.widget(index)
+            if not isinstance(page, QCustomLazyPage) or page is currentPage or not page.isBuilt():
+                continue
+            # Keep pages taking part in a running transition
+            if self.widgetActive and index in (self.currentWidget, self.nextWidget):
+                continue
+            if now - page.lastVisited >= self.pageEvictionTime * 60:
+                self._removePageSnapshot(page)
+                page.release()
+
+    @QtCore.Slot()
+    def _lazyPageChanged(self, index):
+        page = self.widget(index)
+        if isinstance(self._lazyCurrentPage, QCustomLazyPage) and self._lazyCurrentPage is not page:
+            self._lazyCurrentPage.lastVisited = time.monotonic()
+        self._lazyCurrentPage = page
+
+        self.ensurePage(page)
+
+    ########################################################################
+    ## Function extending the QStackedWidget setCurrentWidget to animate transition
+    ########################################################################
+    @QtCore.Slot()
+    def setCurrentWidget(self, widget):
+        self.ensurePage(widget)
+        # Coalesce requests made while a slide transition is running
+        if self.widgetActive:
+            self.slideToWidget(widget)
+            return
+        currentIndex = self.currentIndex()
+        nextIndex = self.indexOf(widget)
+        if self.currentIndex() == self.indexOf(widget):
+            return
+        if self.slideTransition:
+            self.slideToWidgetIndex(nextIndex)
+
+        if self.fadeTransition and not (self.slideTransition and self.slideTransitionMode == "snapshot"):
+            self.fader().fade(self.widget(self.currentIndex()), self.widget(self.indexOf(widget)))
+            if not self.slideTransition:
+                self.setCurrentIndex(nextIndex)
+                self.targetReached.emit(nextIndex)
+
+        if not self.slideTransition and not self.fadeTransition:
+            self.setCurrentIndex(nextIndex)
+            self.targetReached.emit(nextIndex)
+
+
+########################################################################
+## Stacked widget page prewarmer class
+########################################################################
+class StackedWidgetPrewarmer(QObject):
+    def __init__(self, stackedWidget):
+        QObject.__init__(self, stackedWidget)
+
+        self.stackedWidget = stackedWidget
+        self.queue = []
+
+        # Seconds without user input before prewarming resumes
+        self.inputIdleTime = 0.3
+        self.lastInput = 0.0
+
+        # Start prewarming a moment after navigation settles
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(500)
+        self.timer.timeout.connect(self.prewarmNext)
+
+        self.inputEvents = (QtCore.QEvent.MouseButtonPress, QtCore.QEvent.MouseButtonRelease,
+                            QtCore.QEvent.MouseMove, QtCore.QEvent.KeyPress, QtCore.QEvent.KeyRelease,
+                            QtCore.QEvent.Wheel, QtCore.QEvent.TouchBegin, QtCore.QEvent.TouchUpdate)
+        self.filtering = False
+
+    @QtCore.Slot()
+    def schedule(self, index=None):
+        self.queue = self.stackedWidget.prewarmCandidates()
+        if len(self.queue) == 0:
+            return
+
+        if not self.filtering:
+            QApplication.instance().installEventFilter(self)
+            self.filtering = True
+        self.timer.start(500)
+
+    def stop(self):
+        self.queue = []
+        self.timer.stop()
+        if self.filtering:
+            QApplication.instance().removeEventFilter(self)
+            self.filtering = False
+
+    ########################################################################
+    ## Prewarm one page per idle slot
+    ########################################################################
+    @QtCore.Slot()
+    def prewarmNext(self):
+        # Yield to transitions and user input
+        if self.stackedWidget.widgetActive or time.monotonic() - self.lastInput < self.inputIdleTime:
+            self.timer.start(int(self.inputIdleTime * 1000))
+            return
+
+        while len(self.queue) > 0:
+            page = self.queue.pop(0)
+            if self.stackedWidget.prewarmPage(page):
+                break
+
+        if len(self.queue) > 0:
+            self.timer.start(0)
+        else:
+            self.stop()
+
+    def eventFilter(self, obj, event):
+        if event.type() in self.inputEvents:
+            self.lastInput = time.monotonic()
+        return False
+
+
+########################################################################
+## Lazy page class
+########################################################################
+class QCustomLazyPage(QWidget):
+    def __init__(self, factory, parent=None):
+        QWidget.__init__(self, parent)
+
+        self.factory = factory
+        self.pageWidget = None
+        self.lastVisited = time.monotonic()
+
+        self.pageLayout = QVBoxLayout(self)
+        self.pageLayout.setContentsMargins(0, 0, 0, 0)
+        self.pageLayout.setSpacing(0)
+
+    def isBuilt(self):
+        return self.pageWidget is not None
+
+    def page(self):
+        return self.build()
+
+    def build(self):
+        if self.pageWidget is None:
+            self.pageWidget = self.factory()
+            if not isinstance(self.pageWidget, QWidget):
+                raise Exception("Lazy page factory returned '" + str(self.pageWidget) + "'. A QWidget is required")
+            self.pageLayout.addWidget(self.pageWidget)
+        return self.pageWidget
+
+    def release(self):
+        if self.pageWidget is not None:
+            self.pageLayout.removeWidget(self.pageWidget)
+            self.pageWidget.hide()
+            self.pageWidget.deleteLater()
+            self.pageWidget = None
+
+
+########################################################################
+## Fade widget class
+########################################################################
+class FadeWidgetTransition(QWidget):
+    def __init__(self, animationSettings, oldWidget=None, newWidget=None):
+        QWidget.__init__(self, newWidget if newWidget is not None else animationSettings)
+
+        self.animationSettings = animationSettings
+        self.oldPixmap = None
+        self.pixmapOpacity = 1.0
+
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+
+        self.timeline = QTimeLine(parent=self)
+        self.timeline.valueChanged.connect(self.animate)
+        self.timeline.finished.connect(self.fadeFinished)
+
+        # Faders created for a single transition delete themselves when done,
+        # QCustomStackedWidget keeps one fader and reuses it
+        self.singleShot = oldWidget is not None and newWidget is not None
+        if self.singleShot:
+            self.fade(oldWidget, newWidget)
+        else:
+            self.hide()
+
+    ########################################################################
+    ## Fade out the old widget on top of the new widget
+    ########################################################################
+    def fade(self, oldWidget, newWidget):
+        self.timeline.stop()
+
+        if hasattr(self.animationSettings, "pageSnapshot"):
+            self.oldPixmap = self.animationSettings.pageSnapshot(oldWidget)
+        else:
+            self.oldPixmap = oldWidget.grab()
+        self.pixmapOpacity = 1.0
+
+        if self.parentWidget() is not newWidget:
+            self.setParent(newWidget)
+
+        self.timeline.setDuration(self.animationSettings.fadeTime)
+        self.timeline.setEasingCurve(self.animationSettings.fadeEasingCurve)
+        self.timeline.start()
+
+        self.setGeometry(newWidget.rect())
+        self.show()
+        self.raise_()
+
+    def isActive(self):
+        return self.timeline.state() == QTimeLine.Running
+
+    def fadeFinished(self):
+        self.hide()
+        # Release the pixmap while idle
+        self.oldPixmap = None
+        if self.singleShot:
+            self.deleteLater()
+
+    def paintEvent(self, event):
+        if self.oldPixmap is None:
+            return
+
+        painter = QPainter()
+        painter.begin(self)
+        painter.setOpacity(self.pixmapOpacity)
+        painter.drawPixmap(0, 0, self.oldPixmap)
+        painter.end()
+
+    def animate(self, value):
+        self.pixmapOpacity = 1.0 - value
+        self.update()
+
+
+########################################################################
+## Snapshot slide overlay class
+########################################################################
+class StackedWidgetSnapshotOverlay(QWidget):
+    def __init__(self, parent=None):
+        QWidget.__init__(self, parent)
+
+        self.oldPixmap = None
+        self.newPixmap = None
+        self.offset = QtCore.QPoint(0, 0)
+        self.fade = False
+        self._progress = 0.0
+
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.hide()
+
+    def getProgress(self):
+        return self._progress
+
+    def setProgress(self, value):
+        self._progress = value
+        self.update()
+
+    progress = QtCore.Property(float, getProgress, setProgress)
+
+    def setSnapshots(self, oldPixmap, newPixmap, offset, fade=False):
+        self.oldPixmap = oldPixmap
+        self.newPixmap = newPixmap
+        self.offset = offset
+        self.fade = fade
+        self._progress = 0.0
+
+    def clearSnapshots(self):
+        self.oldPixmap = None
+        self.newPixmap = None
+
+    def paintEvent(self, event):
+        if self.oldPixmap is None or self.newPixmap is None:
+            return
+
+        # Same positions as the live widget slide:
+        # old page moves to +offset, new page moves from -offset to its origin
+        oldPosition = self.offset * self._progress
+        newPosition = self.offset * (self._progress - 1.0)
+
+        painter = QPainter()
+        painter.begin(self)
+        painter.drawPixmap(newPosition, self.newPixmap)
+        if self.fade:
+            painter.setOpacity(1.0 - min(1.0, max(0.0, self._progress)))
+        painter.drawPixmap(oldPosition, self.oldPixmap)
+        painter.end()
+
+
+class QMainWindow(QMainWindow):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+    #######################################################################
+    # Add mouse events to the window
+    #######################################################################
+    def mousePressEvent(self, event):
+        # ###############################################
+        # Get the current position of the mouse
+        self.clickPosition = event.globalPos()
+        # We will use this value to move the window
+        # Hide floating widgets
+        cursor = QtGui.QCursor()
+        xPos = cursor.pos().x()
+        yPos = cursor.pos().y()
+        if hasattr(self, "floatingWidgets"):
+            for x in self.floatingWidgets:
+                if hasattr(x, "autoHide") and x.autoHide:
+                    x.collapseMenu()
+
+    #######################################################################
+    #######################################################################
+
+    #######################################################################
+    # Update restore button icon on maximizing or minimizing window
+    #######################################################################
+    def updateRestoreButtonIcon(self):
         # If window is maxmized
         if self.isMaximized():
             # Change Iconload
@@ -899,6 +2252,15 @@ class QMainWindow(QMainWindow):
     def checkButtonGroup(self):
         btn = self.sender()
         group = btn.group
+
+        if getattr(self, "group_property_mode_" + str(group), False):
+            current = getattr(self, "group_current_" + str(group))
+            if current is not btn:
+                setButtonGroupPropertyActive(current, False)
+                setButtonGroupPropertyActive(btn, True)
+                setattr(self, "group_current_" + str(group), btn)
+            return
+
         groupBtns = getattr(self, "group_btns_" + str(group))
         active = getattr(self, "group_active_" + str(group))
         notActive = getattr(self, "group_not_active_" + str(group))
@@ -979,6 +2341,21 @@ class QCustomSlideMenu(QWidget):
 
         self.float = False
         self.floatPosition = ""
+        self._floatAnchor = None
+
+        # Accordion group coordinating this menu with other menus
+        self.menuGroup = None
+
+        self._menuAnimationState = "idle"
+
+        # Animate a pixmap of the menu contents instead of the live children
+        self.contentProxy = False
+        self._contentProxyPixmap = None
+        self._contentProxyChildren = []
+
+        # Follow parent resizes and moves
+        self._watchedParent = None
+        self._watchParent()
 
         # self.setMaximumSize(QSize(0, 0))
 
@@ -1046,6 +2423,9 @@ class QCustomSlideMenu(QWidget):
                 str(customValues["expandingAnimationEasingCurve"])) > 0:
             self.expandingAnimationEasingCurve = customValues["expandingAnimationEasingCurve"]
 
+        if "contentProxy" in customValues:
+            self.contentProxy = customValues["contentProxy"] == True
+
         if "collapsedStyle" in customValues and len(str(customValues["collapsedStyle"])) > 0:
             self.collapsedStyle = str(customValues["collapsedStyle"])
             if self.collapsed:
@@ -1088,6 +2468,7 @@ class QCustomSlideMenu(QWidget):
                     self.autoHide = True
 
         self.refresh()
+        self.syncGeometry()
 
     ########################################################################
     # Float menu
@@ -1095,46 +2476,13 @@ class QCustomSlideMenu(QWidget):
     def floatMenu(self):
         if self.float:
             if len(str(self.floatPosition)) > 0:
-                position = str(self.floatPosition)
-
-                if position == "top-left":
-                    self.setGeometry(QRect(self.parent().x(), self.parent().y(), self.width(), self.height()))
-
-                if position == "top-right":
-                    self.setGeometry(
-                        QRect(self.parent().width() - self.width(), self.parent().y(), self.width(), self.height()))
-
-                if position == "top-center":
-                    self.setGeometry(QRect((self.parent().width() - self.width()) / 2, self.parent().y(), self.width(),
-                                           self.height()))
-
-                if position == "bottom-right":
-                    self.setGeometry(QRect(self.parent().width() - self.width(), self.parent().height() - self.height(),
-                                           self.width(), self.height()))
-
-                if position == "bottom-left":
-                    self.setGeometry(
-                        QRect(self.parent().x(), self.parent().height() - self.height(), self.width(), self.height()))
-
-                if position == "bottom-center":
-                    self.setGeometry(
-                        QRect((self.parent().width() - self.width()) / 2, self.parent().height() - self.height(),
-                              self.width(), self.height()))
-
-                if position == "center-center":
-                    self.setGeometry(
-                        QRect((self.parent().width() - self.width()) / 2, (self.parent().height() - self.height()) / 2,
-                              self.width(), self.height()))
+                # Positions are compiled once, floatPosition can still be changed directly
+                if self._floatAnchor is None or self._floatAnchor.position != str(self.floatPosition):
+                    self._floatAnchor = SlideMenuFloatAnchor(str(self.floatPosition))
 
-                if position == "center-left":
-                    self.setGeometry(
-                        QRect(self.parent().x(), (self.parent().height() - self.height()) / 2, self.width(),
-                              self.height()))
-
-                if position == "center-right":
-                    self.setGeometry(
-                        QRect(self.parent().width() - self.width(), (self.parent().height() - self.height()) / 2,
-                              self.width(), self.height()))
+                geometry = self._floatAnchor.geometry(self.size(), self.parent())
+                if geometry is not None and geometry != self.geometry():
+                    self.setGeometry(geometry)
 
     ########################################################################
     # Menu Toggle Button
@@ -1146,7 +2494,7 @@ class QCustomSlideMenu(QWidget):
         self.applyButtonStyle()
 
     def activateMenuButton(self, buttonObject):
-        buttonObject.clicked.connect(lambda: self.toggleMenu(buttonObject))
+        connectStyleSignal(buttonObject.clicked, lambda: self.toggleMenu(buttonObject))
 
     def toggleButton(self, **values):
         if not hasattr(self, "targetBtn") and not "buttonName" in values:
@@ -1183,6 +2531,11 @@ class QCustomSlideMenu(QWidget):
     # Slide menu function
     ########################################################################
     def slideMenu(self):
+        # Menus in an accordion group are animated by the group
+        if self.menuGroup is not None:
+            self.menuGroup.slideMenu(self)
+            return
+
         if self.collapsed:
             self.expandMenu()
         else:
@@ -1232,99 +2585,192 @@ class QCustomSlideMenu(QWidget):
                 if len(str(self.targetBtn.menuExpandedStyle)) > 0:
                     self.targetBtn.setStyleSheet(str(self.targetBtn.menuExpandedStyle))
 
+    ########################################################################
+    # Menu animations are created once and reused on every toggle
+    # Width and height are animated together as one QSize so each frame
+    # updates the menu size constraints once
+    ########################################################################
+    def _createMenuAnimations(self):
+        if hasattr(self, "_sizeAnimation"):
+            return
+
+        self._sizeAnimation = QVariantAnimation(self)
+        self._sizeAnimation.valueChanged.connect(self._applyAnimatedSize)
+
+        self._menuAnimationGroup = QParallelAnimationGroup(self)
+        self._menuAnimationGroup.addAnimation(self._sizeAnimation)
+        self._menuAnimationGroup.finished.connect(self._menuAnimationFinished)
+
     def animateMenu(self):
+        startSize, endSize = self._prepareMenuAnimation()
+        self.animateSize(startSize, endSize)
+
+    ########################################################################
+    # Set the animation state, duration and easing curve and return the
+    # start and end size of the next toggle
+    ########################################################################
+    def _prepareMenuAnimation(self):
+        self._createMenuAnimations()
+        # Toggling during an animation reverses it from the current size
+        self._menuAnimationGroup.stop()
+
+        # Animation states: "idle", "animating-in"(expanding) or "animating-out"(collapsing)
+        if self.collapsed:
+            self._menuAnimationState = "animating-in"
+        else:
+            self._menuAnimationState = "animating-out"
+
+        startSize = self.size()
         self.setMinimumSize(QSize(0, 0))
         if self.collapsed:
             if self.expandedWidth != "auto" and self.expandedWidth != 16777215 and self.expandedWidth != "parent":
-                startWidth = self.width()
                 endWidth = self.expandedWidth
             else:
-                startWidth = self.width()
                 endWidth = self.parent().width()
-            if self.floatMenu:
-                self._widthAnimation = QPropertyAnimation(self, b"minimumWidth")
-            else:
-                self._widthAnimation = QPropertyAnimation(self, b"maximumWidth")
-
-            self._widthAnimation.setDuration(self.expandingAnimationDuration)
-            self._widthAnimation.setEasingCurve(self.expandingAnimationEasingCurve)
 
             if self.expandedHeight != "auto" and self.expandedHeight != 16777215 and self.expandedHeight != "parent":
-                startHeight = self.height()
                 endHeight = self.expandedHeight
             else:
-                startHeight = self.height()
                 endHeight = self.parent().height()
-            if self.floatMenu:
-                self._heightAnimation = QPropertyAnimation(self, b"minimumHeight")
-            else:
-                self._heightAnimation = QPropertyAnimation(self, b"maximumHeight")
-            self._heightAnimation.setDuration(self.expandingAnimationDuration)
-            self._heightAnimation.setEasingCurve(self.expandingAnimationEasingCurve)
+
+            self._sizeAnimation.setDuration(self.expandingAnimationDuration)
+            self._sizeAnimation.setEasingCurve(self.expandingAnimationEasingCurve)
 
         if self.expanded:
             if self.collapsedWidth != "auto" and self.collapsedWidth != "parent":
-                startWidth = self.width()
                 endWidth = self.collapsedWidth
             elif self.collapsedWidth == "parent":
-                startWidth = self.width()
                 endWidth = self.parent().width()
             else:
-                startWidth = self.width()
                 endWidth = 0
 
-            self._widthAnimation = QPropertyAnimation(self, b"maximumWidth")
-            self._widthAnimation.setDuration(self.collapsingAnimationDuration)
-            self._widthAnimation.setEasingCurve(self.collapsingAnimationEasingCurve)
-
             if self.collapsedHeight != "auto" and self.collapsedHeight != "parent":
-                startHeight = self.height()
                 endHeight = self.collapsedHeight
             elif self.collapsedHeight == "parent":
-                startHeight = self.height()
                 endHeight = self.parent().height()
             else:
-                startHeight = self.height()
                 endHeight = 0
 
-            self._heightAnimation = QPropertyAnimation(self, b"maximumHeight")
-            self._heightAnimation.setDuration(self.collapsingAnimationDuration)
-            self._heightAnimation.setEasingCurve(self.collapsingAnimationEasingCurve)
+            self._sizeAnimation.setDuration(self.collapsingAnimationDuration)
+            self._sizeAnimation.setEasingCurve(self.collapsingAnimationEasingCurve)
 
-        self.animateWidth(startWidth, endWidth)
-        self.animateHeight(startHeight, endHeight)
+        if self.contentProxy:
+            if self._menuAnimationState == "animating-in":
+                self._startContentProxy(QSize(endWidth, endHeight))
+            else:
+                self._startContentProxy(startSize)
 
-    def animateWidth(self, startWidth, endWidth):
-        if self.expandedWidth == "auto" or self.expandedWidth == 16777215:
-            if self.collapsed:
-                self._widthAnimation.finished.connect(lambda: self.setMaximumWidth(16777215))
-            if self.expanded:
-                self._widthAnimation.finished.connect(lambda: self.setMaximumWidth(0))
+        return startSize, QSize(endWidth, endHeight)
 
-        self._widthAnimation.setStartValue(startWidth)
-        self._widthAnimation.setEndValue(endWidth)
-        self._widthAnimation.start()
+    def animateSize(self, startSize, endSize):
+        self._sizeAnimation.setStartValue(startSize)
+        self._sizeAnimation.setEndValue(endSize)
+        self._menuAnimationGroup.start()
 
-        self._widthAnimation.finished.connect(lambda: self.applyWidgetStyle())
+    def animateWidth(self, startWidth, endWidth):
+        self.animateSize(QSize(startWidth, self.height()), QSize(endWidth, self.height()))
 
     def animateHeight(self, startHeight, endHeight):
-        if self.expandedHeight == "auto" or self.expandedHeight == 16777215:
-            if self.collapsed:
-                self._heightAnimation.finished.connect(lambda: self.setMaximumHeight(16777215))
-            if self.expanded:
-                self._heightAnimation.finished.connect(lambda: self.setMaximumHeight(0))
+        self.animateSize(QSize(self.width(), startHeight), QSize(self.width(), endHeight))
 
-        self._heightAnimation.setStartValue(startHeight)
-        self._heightAnimation.setEndValue(endHeight)
-        self._heightAnimation.start()
+    def _applyAnimatedSize(self, size):
+        # Expanding grows the minimum size, collapsing shrinks the maximum size
+        if self._menuAnimationState == "animating-in":
+            self.setMinimumSize(size)
+        else:
+            self.setMaximumSize(size)
 
-    def refresh(self):
-        if self.isExpanded():
+    def _menuAnimationFinished(self):
+        if self.expandedWidth == "auto" or self.expandedWidth == 16777215:
+            if self._menuAnimationState == "animating-in":
+                self.setMaximumWidth(16777215)
+            if self._menuAnimationState == "animating-out":
+                self.setMaximumWidth(0)
 
-            self.collapsed = False
-            self.expanded = True
+        if self.expandedHeight == "auto" or self.expandedHeight == 16777215:
+            if self._menuAnimationState == "animating-in":
+                self.setMaximumHeight(16777215)
+            if self._menuAnimationState == "animating-out":
+                self.setMaximumHeight(0)
 
-        else:
+        self.applyWidgetStyle()
+
+        self._menuAnimationState = "idle"
+        self._stopContentProxy()
+        self.syncGeometry()
+
+    ########################################################################
+    # Content proxy
+    # The children are rendered once at the expanded size, hidden while the
+    # menu animates and the clipped pixmap is painted instead
+    ########################################################################
+    def _startContentProxy(self, size):
+        # Reversing mid-animation keeps the current snapshot
+        if self._contentProxyPixmap is not None:
+            return
+
+        size = QSize(max(1, size.width()), max(1, size.height()))
+        if size.width() >= 16777215 or size.height() >= 16777215:
+            return
+
+        layout = self.layout()
+        if layout is not None:
+            layout.setGeometry(QRect(QPoint(0, 0), size))
+
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        children = [child for child in self.findChildren(QWidget, options=QtCore.Qt.FindDirectChildrenOnly)
+                    if child.isVisibleTo(self) and not child.isWindow()]
+
+        painter = QPainter(pixmap)
+        for child in children:
+            child.render(painter, child.pos(), QRegion(),
+                         QWidget.DrawWindowBackground | QWidget.DrawChildren)
+        painter.end()
+
+        self._contentProxyPixmap = pixmap
+        self._contentProxyChildren = children
+
+        # Freeze the layout so the hidden children are not laid out per frame
+        if layout is not None:
+            layout.setEnabled(False)
+        for child in children:
+            child.hide()
+
+        self.update()
+
+    def _stopContentProxy(self):
+        if self._contentProxyPixmap is None:
+            return
+
+        for child in self._contentProxyChildren:
+            child.show()
+        self._contentProxyChildren = []
+        self._contentProxyPixmap = None
+
+        layout = self.layout()
+        if layout is not None:
+            layout.setEnabled(True)
+            layout.activate()
+
+        self.update()
+
+    def paintEvent(self, event):
+        if self._contentProxyPixmap is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self._contentProxyPixmap)
+            painter.end()
+
+    def refresh(self):
+        if self.isExpanded():
+
+            self.collapsed = False
+            self.expanded = True
+
+        else:
 
             self.collapsed = True
             self.expanded = False
@@ -1334,11 +2780,11 @@ class QCustomSlideMenu(QWidget):
             self.applyButtonStyle()
 
     def isExpanded(self):
-        if self.width() > self.getCollapsedWidth() or self.width() > self.getCollapsedHeight():
+        if self.width() > self.getCollapsedWidth() or self.height() > self.getCollapsedHeight():
             return True
 
     def isCollapsed(self):
-        if self.width() < self.getCollapsedWidth() or self.width() < self.getCollapsedHeight():
+        if self.width() < self.getCollapsedWidth() or self.height() < self.getCollapsedHeight():
             return True
 
     def getDefaultWidth(self):
@@ -1389,46 +2835,219 @@ class QCustomSlideMenu(QWidget):
         if self.expandedHeight == "parent":
             return self.parent().width()
 
-    def paintEvent(self, event: QPaintEvent):
-        try:
-            if hasattr(self, "_widthAnimation"):
-                if self._widthAnimation.finished:
-                    if self.collapsed:
-                        if self.collapsedWidth == "parent":
-                            self.setMinimumWidth(self.parent().width())
-                            self.setMaximumWidth(self.parent().width())
-                    if self.expanded:
-                        if self.expandedWidth == "parent":
-                            self.setMinimumWidth(self.parent().width())
-                            self.setMaximumWidth(self.parent().width())
-
-            if hasattr(self, "_heightAnimation"):
-                if self._heightAnimation.finished:
-                    if self.collapsed:
-                        if self.collapsedHeight == "parent":
-                            self.setMinimumHeight(self.parent().height())
-                            self.setMaximumHeight(self.parent().height())
-                    if self.expanded:
-                        if self.expandedHeight == "parent":
-                            self.setMinimumHeight(self.parent().height())
-                            self.setMaximumHeight(self.parent().height())
-
-            if not hasattr(self, "_widthAnimation") and not hasattr(self, "_heightAnimation"):
-                if self.defaultWidth == "parent":
-                    self.setMinimumWidth(self.parent().width())
-                    self.setMaximumWidth(self.parent().width())
-                if self.defaultHeight == "parent":
-                    self.setMinimumHeight(self.parent().height())
-                    self.setMaximumHeight(self.parent().height())
+    ########################################################################
+    # Geometry sync
+    # "parent" sizes and float positions follow the parent through an
+    # event filter instead of being recomputed on every paint
+    ########################################################################
+    def _watchParent(self):
+        parent = self.parent()
+        if getattr(self, "_watchedParent", None) is parent:
+            return
 
-        except Exception as e:
-            print(e)
+        if getattr(self, "_watchedParent", None) is not None:
+            self._watchedParent.removeEventFilter(self)
+
+        self._watchedParent = parent
+        if parent is not None:
+            parent.installEventFilter(self)
 
+    def eventFilter(self, obj, event):
+        if obj is self.parent() and event.type() in (QtCore.QEvent.Resize, QtCore.QEvent.Move):
+            self.syncGeometry()
+        return False
+
+    def event(self, event):
+        if event.type() == QtCore.QEvent.ParentChange:
+            self._watchParent()
+            self.syncGeometry()
+        return super().event(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.syncGeometry()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Float position depends on the menu size
         self.floatMenu()
 
+    def syncGeometry(self):
+        if self.parent() is None:
+            return
+
+        self._syncParentSize()
+        self.floatMenu()
+
+    def _syncParentSize(self):
+        # Sizes are animated while the menu slides
+        if self._menuAnimationState != "idle":
+            return
+
+        if hasattr(self, "_sizeAnimation"):
+            if self.collapsed:
+                width = self.collapsedWidth
+            else:
+                width = self.expandedWidth
+        else:
+            width = self.defaultWidth
+
+        if hasattr(self, "_sizeAnimation"):
+            if self.collapsed:
+                height = self.collapsedHeight
+            else:
+                height = self.expandedHeight
+        else:
+            height = self.defaultHeight
+
+        if width == "parent":
+            self.setMinimumWidth(self.parent().width())
+            self.setMaximumWidth(self.parent().width())
+
+        if height == "parent":
+            self.setMinimumHeight(self.parent().height())
+            self.setMaximumHeight(self.parent().height())
+
     #######################################################################
 
 
+########################################################################
+## Slide menu group (accordion)
+## Only one member menu is expanded at a time. Expanding a menu collapses
+## the others in the same animation so every frame updates all members at
+## once and the surrounding layout is laid out once.
+########################################################################
+class QCustomSlideMenuGroup(QObject):
+    def __init__(self, parent=None):
+        QObject.__init__(self, parent)
+
+        self.menus = []
+        # [(menu, startSize, endSize), ...]
+        self._transitions = []
+
+        # Drives all member menus, the value is the elapsed time in ms
+        self._animation = QVariantAnimation(self)
+        self._animation.setStartValue(0)
+        self._animation.valueChanged.connect(self._animate)
+
+        self.animationGroup = QParallelAnimationGroup(self)
+        self.animationGroup.addAnimation(self._animation)
+        self.animationGroup.finished.connect(self._animationFinished)
+
+    def addMenu(self, menu):
+        if menu not in self.menus:
+            self.menus.append(menu)
+            menu.menuGroup = self
+
+    def removeMenu(self, menu):
+        if menu in self.menus:
+            self.menus.remove(menu)
+            menu.menuGroup = None
+
+    def expandedMenu(self):
+        for menu in self.menus:
+            if not menu.collapsed:
+                return menu
+        return None
+
+    ########################################################################
+    # Toggle a member menu, collapsing the other expanded members
+    ########################################################################
+    def slideMenu(self, menu):
+        self.addMenu(menu)
+        # Retarget from the current sizes
+        self.animationGroup.stop()
+        runningMenus = [transition[0] for transition in self._transitions]
+        self._transitions = []
+
+        if menu.collapsed:
+            for otherMenu in self.menus:
+                if otherMenu is not menu and not otherMenu.collapsed:
+                    self._addTransition(otherMenu, expand=False)
+            self._addTransition(menu, expand=True)
+        else:
+            self._addTransition(menu, expand=False)
+
+        # Menus interrupted mid-animation keep going to their target size
+        transitionMenus = [transition[0] for transition in self._transitions]
+        for runningMenu in runningMenus:
+            if runningMenu not in transitionMenus:
+                self._addTransition(runningMenu, expand=not runningMenu.collapsed)
+
+        duration = max(1, max(transition[0]._sizeAnimation.duration() for transition in self._transitions))
+        self._animation.setDuration(duration)
+        self._animation.setEndValue(duration)
+        self.animationGroup.start()
+
+    def _addTransition(self, menu, expand):
+        # Same flag sequence as QCustomSlideMenu.expandMenu/collapseMenu
+        menu.collapsed = expand
+        menu.expanded = not expand
+
+        startSize, endSize = menu._prepareMenuAnimation()
+
+        menu.collapsed = not expand
+        menu.expanded = expand
+        menu.applyButtonStyle()
+
+        self._transitions.append((menu, startSize, endSize))
+
+    def _animate(self, elapsed):
+        for menu, startSize, endSize in self._transitions:
+            animation = menu._sizeAnimation
+            progress = min(1.0, elapsed / max(1, animation.duration()))
+            value = animation.easingCurve().valueForProgress(progress)
+            menu._applyAnimatedSize(QSize(
+                int(startSize.width() + (endSize.width() - startSize.width()) * value),
+                int(startSize.height() + (endSize.height() - startSize.height()) * value)))
+
+    def _animationFinished(self):
+        transitions = self._transitions
+        self._transitions = []
+        for menu, startSize, endSize in transitions:
+            menu._menuAnimationFinished()
+
+
+########################################################################
+## Floating slide menu anchor
+## "vertical-horizontal" positions compiled into factors of the free
+## space in the parent, left and top follow the parent position
+########################################################################
+class SlideMenuFloatAnchor():
+    def __init__(self, position):
+        self.position = position
+
+        self.horizontalFactor = None
+        self.verticalFactor = None
+
+        parts = position.split("-")
+        if len(parts) != 2:
+            return
+
+        vertical, horizontal = parts
+        self.horizontalFactor = {"left": 0.0, "center": 0.5, "right": 1.0}.get(horizontal)
+        self.verticalFactor = {"top": 0.0, "center": 0.5, "bottom": 1.0}.get(vertical)
+
+    def isValid(self):
+        return self.horizontalFactor is not None and self.verticalFactor is not None
+
+    def geometry(self, size, parent):
+        if not self.isValid() or parent is None:
+            return None
+
+        if self.horizontalFactor == 0.0:
+            x = parent.x()
+        else:
+            x = int((parent.width() - size.width()) * self.horizontalFactor)
+
+        if self.verticalFactor == 0.0:
+            y = parent.y()
+        else:
+            y = int((parent.height() - size.height()) * self.verticalFactor)
+
+        return QRect(x, y, size.width(), size.height())
+
+
 def mouseReleaseEvent(self, QMouseEvent):
     cursor = QtGui.QCursor()
     # self.ui.frame.setGeometry(QRect(cursor.pos().x(), cursor.pos().y(), 151, 111))
@@ -1443,125 +3062,464 @@ def loadJsonStyle(self, ui, **jsonFiles):
     self.customWidgetsThreadpool = QThreadPool()
     # Show Logs
     self.show_custom_widgets_logs = True
+    # Startup report of the time spent in each JSON section
+    self.styleSectionReport = OrderedDict()
+    #######################################################################
+    # Applied style plan, used to reload changed entries
+    self.jsonStyleFiles = []
+    self.appliedStylePlan = None
     #######################################################################
     self.ui = ui
-    if not jsonFiles:
+    # Widgets on hidden QStackedWidget pages are styled when the page is first shown
+    defer = jsonFiles.get("deferHiddenWidgets", False)
+    if "jsonFiles" not in jsonFiles:
         if os.path.isfile("style.json"):
-            file = open('style.json', )
-            data = json.load(file)
-            applyJsonStyle(self, self.ui, data)
+            self.jsonStyleFiles.append(os.path.abspath("style.json"))
 
         elif os.path.isfile("json/style.json"):
-            file = open('json/style.json', )
-            data = json.load(file)
-            applyJsonStyle(self, self.ui, data)
+            self.jsonStyleFiles.append(os.path.abspath("json/style.json"))
 
         elif os.path.isfile("jsonstyles/style.json"):
-            file = open('jsonstyles/style.json', )
-            data = json.load(file)
-            applyJsonStyle(self, self.ui, data)
+            self.jsonStyleFiles.append(os.path.abspath("jsonstyles/style.json"))
 
     else:
         for file in jsonFiles['jsonFiles']:
             if os.path.isfile(file):
-                jsonFile = os.path.abspath(os.path.join(os.getcwd(), file))
-                jsonFile = open(jsonFile, )
-                # Read file
-                data = json.load(jsonFile)
-                ########################################################################
-                # APPLY JSON STYLESHEET
-                ########################################################################
-                # self = QMainWindow class
-                # self.ui = Ui_MainWindow / user interface class
-                applyJsonStyle(self, self.ui, data)
-                ########################################################################
+                self.jsonStyleFiles.append(os.path.abspath(os.path.join(os.getcwd(), file)))
             else:
                 raise Exception("Error loading your JSON files : '" + str(file) + "' does not exist")
 
+    if len(self.jsonStyleFiles) > 0:
+        ########################################################################
+        # APPLY JSON STYLESHEET
+        ########################################################################
+        # self = QMainWindow class
+        # self.ui = Ui_MainWindow / user interface class
+        # All files are merged into one plan, later files override earlier ones
+        # Widgets are resolved and entries validated before anything is applied
+        self.appliedStylePlan = returnStylePlan(self.jsonStyleFiles, self.ui)
+        self.styleProvenance = self.appliedStylePlan.provenance
+        applyStylePlan(self, self.ui, self.appliedStylePlan, None, defer)
+        ########################################################################
+
+    # Reload the JSON files when they change
+    if jsonFiles.get("watch", False):
+        watchJsonStyle(self)
+
 
 ########################################################################
 ## Apply JSon stylesheet
 ########################################################################
 def applyJsonStyle(self, ui, data):
-    ########################################################################
-    ## Show logs
-    ########################################################################
-    if "ShowLogs" in data:
-        if data["ShowLogs"]:
-            # Show Logs
-            self.show_custom_widgets_logs = True
-        else:
-            # Hide Logs
-            self.show_custom_widgets_logs = False
+    applyStylePlan(self, ui, compileStylePlan(data, ui))
 
-    ########################################################################
-    ## QCARDS
-    ########################################################################
-    if "QCard" in data:
-        for QCard in data['QCard']:
-            if "cards" in QCard:
-                for card in QCard['cards']:
 
-                    if "shadow" in QCard:
-                        if hasattr(self.ui, str(card)):
-                            cardWidget = getattr(self.ui, str(card))
-                            effect = QtWidgets.QGraphicsDropShadowEffect(cardWidget)
-                            for shadow in QCard['shadow']:
-                                if "color" in shadow and len(str(shadow["color"])) > 0:
-                                    effect.setColor(QColor(str(shadow["color"])))
-                                else:
-                                    effect.setColor(QColor(0, 0, 0, 0))
-                                if "blurRadius" in shadow and int(shadow["blurRadius"]) > 0:
-                                    effect.setBlurRadius(int(shadow["blurRadius"]))
-                                else:
-                                    effect.setBlurRadius(0)
-                                if "xOffset" in shadow and int(shadow["xOffset"]) > 0:
-                                    effect.setXOffset(int(shadow["xOffset"]))
-                                else:
-                                    effect.setXOffset(0)
-                                if "yOffset" in shadow and int(shadow["yOffset"]) > 0:
-                                    effect.setYOffset(int(shadow["yOffset"]))
-                                else:
-                                    effect.setYOffset(0)
+########################################################################
+## Apply compiled style plan
+########################################################################
+def applyStylePlan(self, ui, plan, source=None, defer=False):
+    self.ui = ui
+    if not hasattr(self, "styleSectionReport"):
+        self.styleSectionReport = OrderedDict()
 
-                            cardWidget.setGraphicsEffect(effect)
+    # Every widget entry is applied on its own, other sections as a whole
+    for operation in plan:
+        if defer and deferStyleOperation(self, ui, operation, source):
+            continue
+        applyStyleOperation(self, ui, operation, source)
 
-    ########################################################################
-    ## BUTTON GROUPS
-    ########################################################################
-    # Add Class To PushButtons
-    QPushButton.getButtonGroup = QCustomPushButtonGroup.getButtonGroup
-    QPushButton.getButtonGroupActiveStyle = QCustomPushButtonGroup.getButtonGroupActiveStyle
-    QPushButton.getButtonGroupNotActiveStyle = QCustomPushButtonGroup.getButtonGroupNotActiveStyle
-    QPushButton.getButtonGroupButtons = QCustomPushButtonGroup.getButtonGroupButtons
-    QPushButton.getButtonGroupActiveStyle = QCustomPushButtonGroup.getButtonGroupActiveStyle
-    QPushButton.setButtonGroupActiveStyle = QCustomPushButtonGroup.setButtonGroupActiveStyle
-    QPushButton.setButtonGroupActiveStyle = QCustomPushButtonGroup.setButtonGroupActiveStyle
-    if "QPushButtonGroup" in data:
-        grp_count = 0
-        for QPushButtonGroup in data['QPushButtonGroup']:
-            if "Buttons" in QPushButtonGroup:
-                grp_count += 1
-                for button in QPushButtonGroup["Buttons"]:
-                    if hasattr(self.ui, str(button)):
-                        btn = getattr(self.ui, str(button))
-                        btn.groupParent = self
-                        btn.active = False
-
-                        if not btn.metaObject().className() == "QPushButton":
-                            raise Exception("Error: " + str(button) + " is not a QPushButton object.")
-                            return
-                        setattr(btn, "group", grp_count)
-
-                        if not hasattr(self, "group_btns_" + str(grp_count)):
-                            setattr(self, "group_btns_" + str(grp_count), [])
-
-                        getattr(self, "group_btns_" + str(grp_count)).append(btn)
-
-                        btn.clicked.connect(self.checkButtonGroup)
+
+########################################################################
+## Apply one style plan operation with its registered section handler
+########################################################################
+def applyStyleOperation(self, ui, operation, source=None):
+    section = styleSectionHandlers.get(operation["section"])
+    if section is None:
+        return
+
+    # Plans compiled without a ui are resolved when applied
+    resolveStyleOperation(operation, ui)
+
+    # Drop the connections of a previous application of the same entry
+    releaseStyleOperation(self, operation, source)
+
+    sectionData = returnOperationData(operation)
+    styleConnectionRecorders.append([])
+    startTime = time.perf_counter()
+    try:
+        widgetCount = section["handler"](self, ui, sectionData)
+    finally:
+        connections = styleConnectionRecorders.pop()
+    elapsed = (time.perf_counter() - startTime) * 1000
+
+    if len(connections) > 0:
+        if not hasattr(self, "styleOperationConnections"):
+            self.styleOperationConnections = {}
+        self.styleOperationConnections[(source,) + returnOperationKey(operation)] = connections
+
+    # Handlers may return the number of widgets they configured
+    if widgetCount is None:
+        widgetCount = len(sectionData) if isinstance(sectionData, list) else 1
+
+    if not hasattr(self, "styleSectionReport"):
+        self.styleSectionReport = OrderedDict()
+    if operation["section"] not in self.styleSectionReport:
+        self.styleSectionReport[operation["section"]] = {"time": 0.0, "widgets": 0, "calls": 0}
+
+    report = self.styleSectionReport[operation["section"]]
+    report["time"] += elapsed
+    report["widgets"] += widgetCount
+    report["calls"] += 1
+
+
+########################################################################
+## Defer a style operation until its QStackedWidget page is shown
+########################################################################
+def deferStyleOperation(self, ui, operation, source=None):
+    section = styleSectionHandlers.get(operation["section"])
+    if section is None or not section["deferrable"]:
+        return False
+
+    page = returnHiddenPage(self, getattr(ui, operation["name"], None))
+    if page is None:
+        return False
+
+    if not hasattr(self, "deferredStyleLoader"):
+        self.deferredStyleLoader = DeferredStyleLoader(self)
+    self.deferredStyleLoader.defer(page, operation, source)
+    return True
+
+
+########################################################################
+## Return the outermost hidden QStackedWidget page containing a widget
+########################################################################
+def returnHiddenPage(window, widget):
+    if not isinstance(widget, QWidget):
+        return None
+
+    hiddenPage = None
+    while widget is not None and widget is not window:
+        parent = widget.parentWidget()
+        if isinstance(parent, QtWidgets.QStackedWidget) and not widget.isVisibleTo(parent):
+            hiddenPage = widget
+        widget = parent
+
+    return hiddenPage
+
+
+########################################################################
+## DEFERRED STYLE LOADER
+########################################################################
+class DeferredStyleLoader(QObject):
+    '''
+    Holds the style operations of widgets on hidden QStackedWidget
+    pages and applies them on the first Show event of the page, or
+    before a snapshot of the page is taken.
+
+    '''
+
+    def __init__(self, window):
+        QObject.__init__(self, window)
+
+        self.window = window
+        # Hidden page -> [(operation, source)]
+        self.pages = {}
+
+    def defer(self, page, operation, source=None):
+        if page not in self.pages:
+            self.pages[page] = []
+            page.installEventFilter(self)
+        self.pages[page].append((operation, source))
+
+    def pendingCount(self):
+        return sum(len(operations) for operations in self.pages.values())
+
+    def findOperation(self, operation, source=None):
+        key = (source,) + returnOperationKey(operation)
+        for page, operations in self.pages.items():
+            for index, (pending, pendingSource) in enumerate(operations):
+                if (pendingSource,) + returnOperationKey(pending) == key:
+                    return page, index
+        return None, None
+
+    def replace(self, operation, source=None):
+        # A reloaded entry that is still waiting replaces the pending one
+        page, index = self.findOperation(operation, source)
+        if page is None:
+            return False
+        self.pages[page][index] = (operation, source)
+        return True
+
+    def discard(self, operation, source=None):
+        page, index = self.findOperation(operation, source)
+        if page is not None:
+            del self.pages[page][index]
+
+    def applyPage(self, page):
+        page.removeEventFilter(self)
+        for operation, source in self.pages.pop(page, []):
+            # Widgets on a nested hidden page wait for that page. The page
+            # itself is still hidden when it is applied for a snapshot.
+            nestedPage = returnHiddenPage(self.window, getattr(self.window.ui, operation["name"], None))
+            if nestedPage is not None and nestedPage is not page:
+                self.defer(nestedPage, operation, source)
+                continue
+            applyStyleOperation(self.window, self.window.ui, operation, source)
+
+    def applyAll(self):
+        while len(self.pages) > 0:
+            page = next(iter(self.pages))
+            page.removeEventFilter(self)
+            for operation, source in self.pages.pop(page):
+                applyStyleOperation(self.window, self.window.ui, operation, source)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Show, PageSnapshotEvent) and obj in self.pages:
+            self.applyPage(obj)
+        return False
+
+
+########################################################################
+## Apply every deferred style operation now
+########################################################################
+def applyDeferredStyles(self):
+    if hasattr(self, "deferredStyleLoader"):
+        self.deferredStyleLoader.applyAll()
+
+
+########################################################################
+## Disconnect the signals connected by a style plan operation
+########################################################################
+def releaseStyleOperation(self, operation, source=None):
+    key = (source,) + returnOperationKey(operation)
+    if key in getattr(self, "styleOperationConnections", {}):
+        for connection in self.styleOperationConnections.pop(key):
+            QObject.disconnect(connection)
+
+
+########################################################################
+## Signal connections made by JSON section handlers
+########################################################################
+# One list per style operation being applied
+styleConnectionRecorders = []
+
+
+def connectStyleSignal(signal, slot):
+    # Recorded connections are disconnected when the entry is re-applied
+    connection = signal.connect(slot)
+    if len(styleConnectionRecorders) > 0:
+        styleConnectionRecorders[-1].append(connection)
+    return connection
+
+
+########################################################################
+## Reload a JSON stylesheet, only changed entries are re-applied
+########################################################################
+def reloadJsonStyle(self):
+    if len(getattr(self, "jsonStyleFiles", [])) == 0:
+        return []
+
+    startTime = time.perf_counter()
+    plan = returnStylePlan(self.jsonStyleFiles, self.ui)
+    changed, removed = diffStylePlans(self.appliedStylePlan, plan)
+
+    # Operations currently applied, updated as each one succeeds
+    appliedOperations = OrderedDict()
+    if self.appliedStylePlan is not None:
+        for operation in self.appliedStylePlan:
+            appliedOperations[returnOperationKey(operation)] = operation
+
+    deferredStyleLoader = getattr(self, "deferredStyleLoader", None)
+    try:
+        for operation in removed:
+            if deferredStyleLoader is not None:
+                deferredStyleLoader.discard(operation)
+            releaseStyleOperation(self, operation)
+            del appliedOperations[returnOperationKey(operation)]
+        for operation in changed:
+            if deferredStyleLoader is None or not deferredStyleLoader.replace(operation):
+                applyStyleOperation(self, self.ui, operation)
+            appliedOperations[returnOperationKey(operation)] = operation
+    except Exception:
+        # Keep what was applied so the next reload retries the failed
+        # and remaining entries only
+        self.appliedStylePlan = StylePlan(list(appliedOperations.values()), self.appliedStylePlan.provenance
+                                          if self.appliedStylePlan is not None else None)
+        raise
+
+    self.appliedStylePlan = plan
+    self.styleProvenance = plan.provenance
+
+    if self.show_custom_widgets_logs:
+        print("Reloaded " + str(len(changed)) + " style entries in " +
+              str(round((time.perf_counter() - startTime) * 1000, 2)) + " ms")
+
+    return changed
+
+
+########################################################################
+## Watch the loaded JSON stylesheets for changes
+########################################################################
+def watchJsonStyle(self):
+    if not hasattr(self, "jsonStyleWatcher"):
+        self.jsonStyleWatcher = QFileSystemWatcher(self)
+        self.jsonStyleWatcher.fileChanged.connect(lambda path: jsonStyleFileChanged(self, path))
+
+        # Editors often write a file in several steps, wait for the last one
+        self.changedJsonStyles = []
+        self.jsonStyleReloadTimer = QTimer(self)
+        self.jsonStyleReloadTimer.setSingleShot(True)
+        self.jsonStyleReloadTimer.setInterval(50)
+        self.jsonStyleReloadTimer.timeout.connect(lambda: reloadChangedJsonStyles(self))
+
+    files = [file for file in getattr(self, "jsonStyleFiles", []) if file not in self.jsonStyleWatcher.files()]
+    if len(files) > 0:
+        self.jsonStyleWatcher.addPaths(files)
+
+
+def unwatchJsonStyle(self):
+    if hasattr(self, "jsonStyleWatcher"):
+        self.jsonStyleReloadTimer.stop()
+        if len(self.jsonStyleWatcher.files()) > 0:
+            self.jsonStyleWatcher.removePaths(self.jsonStyleWatcher.files())
+
+
+def jsonStyleFileChanged(self, path):
+    if path not in self.changedJsonStyles:
+        self.changedJsonStyles.append(path)
+    self.jsonStyleReloadTimer.start()
+
+
+def reloadChangedJsonStyles(self):
+    self.changedJsonStyles = []
+
+    # Wait for the next change while a file is being replaced
+    if not all(os.path.isfile(jsonFile) for jsonFile in self.jsonStyleFiles):
+        return
+
+    # Files replaced on save are no longer watched
+    watchJsonStyle(self)
+
+    try:
+        reloadJsonStyle(self)
+    except Exception as error:
+        # Keep the running style until the files are fixed
+        print(str(error))
+
+
+########################################################################
+## Style section timing report
+########################################################################
+def returnStyleReport(self):
+    # Slowest sections first, times in milliseconds
+    report = [dict(section=section, **values) for section, values in getattr(self, "styleSectionReport", {}).items()]
+    return sorted(report, key=lambda entry: entry["time"], reverse=True)
+
+
+def printStyleProvenance(self):
+    # Which JSON file each applied value came from
+    for path, source in getattr(self, "styleProvenance", {}).items():
+        print(path + " : " + str(source))
+
+
+def printStyleReport(self):
+    report = returnStyleReport(self)
+    print("Custom Widgets style report:")
+    for entry in report:
+        print("  " + entry["section"].ljust(20) + ("%.2f ms" % entry["time"]).rjust(12) +
+              str(entry["widgets"]).rjust(6) + " widgets" + str(entry["calls"]).rjust(6) + " calls")
+    print("  " + "Total".ljust(20) + ("%.2f ms" % sum(entry["time"] for entry in report)).rjust(12))
+
+
+########################################################################
+## REPLAY THE CALLS COMPILED FOR A JSON ENTRY
+########################################################################
+def applyCompiledCalls(calls):
+    for function, args, kwargs in calls:
+        function(*args, **kwargs)
+
+
+########################################################################
+## SHOW LOGS
+########################################################################
+def applyShowLogsSection(self, ui, sectionData):
+    if sectionData:
+        # Show Logs
+        self.show_custom_widgets_logs = True
+    else:
+        # Hide Logs
+        self.show_custom_widgets_logs = False
+
+    return 0
+
+
+########################################################################
+## QCARDS
+########################################################################
+def compileQCardSection(ui, sectionData):
+    compiled = []
+    for QCard in sectionData:
+        if "cards" in QCard:
+            shadowSettings = None
+            if "shadow" in QCard:
+                # Every shadow entry sets all the values, the last one wins
+                shadowSettings = {}
+                for shadow in QCard['shadow']:
+                    if "color" in shadow and len(str(shadow["color"])) > 0:
+                        shadowSettings["color"] = QColor(str(shadow["color"]))
+                    else:
+                        shadowSettings["color"] = QColor(0, 0, 0, 0)
+                    if "blurRadius" in shadow and int(shadow["blurRadius"]) > 0:
+                        shadowSettings["blurRadius"] = int(shadow["blurRadius"])
+                    else:
+                        shadowSettings["blurRadius"] = 0
+                    if "xOffset" in shadow and int(shadow["xOffset"]) > 0:
+                        shadowSettings["xOffset"] = int(shadow["xOffset"])
                     else:
-                        raise Exception("Error: Button named" + str(button) + " was not found.")
-                        return
+                        shadowSettings["xOffset"] = 0
+                    if "yOffset" in shadow and int(shadow["yOffset"]) > 0:
+                        shadowSettings["yOffset"] = int(shadow["yOffset"])
+                    else:
+                        shadowSettings["yOffset"] = 0
+
+            cards = [getattr(ui, str(card)) for card in QCard['cards'] if hasattr(ui, str(card))]
+            compiled.append({"cards": cards, "shadow": shadowSettings, "count": len(QCard['cards'])})
+
+    return compiled
+
+
+def applyQCardSection(self, ui, sectionData):
+    for QCard in sectionData:
+        if QCard["shadow"] is not None:
+            for cardWidget in QCard["cards"]:
+                effect = QtWidgets.QGraphicsDropShadowEffect(cardWidget)
+                if "color" in QCard["shadow"]:
+                    effect.setColor(QCard["shadow"]["color"])
+                    effect.setBlurRadius(QCard["shadow"]["blurRadius"])
+                    effect.setXOffset(QCard["shadow"]["xOffset"])
+                    effect.setYOffset(QCard["shadow"]["yOffset"])
+
+                cardWidget.setGraphicsEffect(effect)
+
+    return sum(QCard["count"] for QCard in sectionData)
+
+
+########################################################################
+## BUTTON GROUPS
+########################################################################
+def compileQPushButtonGroupSection(ui, sectionData):
+    compiled = []
+    for QPushButtonGroup in sectionData:
+        if "Buttons" in QPushButtonGroup:
+            buttons = []
+            for button in QPushButtonGroup["Buttons"]:
+                if not hasattr(ui, str(button)):
+                    raise Exception("Error: Button named" + str(button) + " was not found.")
+
+                btn = getattr(ui, str(button))
+                if not btn.metaObject().className() == "QPushButton":
+                    raise Exception("Error: " + str(button) + " is not a QPushButton object.")
+                buttons.append(btn)
 
             activeStyle = ""
             notActiveStyle = ""
@@ -1572,1002 +3530,927 @@ def applyJsonStyle(self, ui, data):
                     if "NotActive" in style:
                         notActiveStyle = style['NotActive']
 
-            getattr(self, "group_btns_" + str(grp_count))[0].active = True
-            setattr(self, "group_active_" + str(grp_count), activeStyle)
-            setattr(self, "group_not_active_" + str(grp_count), notActiveStyle)
-
-    ########################################################################
-    ## ANALOG GAUGE WIDGET
-    ########################################################################
-    if "AnalogGaugeWidget" in data:
-        for AnalogGaugeWidget in data['AnalogGaugeWidget']:
-            if "name" in AnalogGaugeWidget and len(str(AnalogGaugeWidget["name"])) > 0:
-                if hasattr(self.ui, str(AnalogGaugeWidget["name"])):
-                    gaugeWidget = getattr(self.ui, str(AnalogGaugeWidget["name"]))
-
-                    if not gaugeWidget.metaObject().className() == "AnalogGaugeWidget":
-                        raise Exception(
-                            "Error: " + str(AnalogGaugeWidget["name"]) + " is not a AnalogGaugeWidget object")
-                        return
-
-                    if "units" in AnalogGaugeWidget and len(str(AnalogGaugeWidget["units"])) > 0:
-                        ################################################################################################
-                        # Set gauge units
-                        ################################################################################################
-                        gaugeWidget.units = str(AnalogGaugeWidget["units"])
-
-                    if "minValue" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set gauge min value
-                        ################################################################################################
-                        gaugeWidget.min_value = int(AnalogGaugeWidget["minValue"])
-
-                    if "maxValue" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set gauge max value
-                        ################################################################################################
-                        gaugeWidget.max_value = int(AnalogGaugeWidget["maxValue"])
-
-                    if "scalaCount" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set scala count
-                        ################################################################################################
-                        gaugeWidget.scala_count = int(AnalogGaugeWidget["scalaCount"])
-
-                    if "startValue" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set start value
-                        ################################################################################################
-                        gaugeWidget.updateValue(int(AnalogGaugeWidget["startValue"]))
-
-                    if "gaugeTheme" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set gauge theme
-                        ################################################################################################
-                        gaugeWidget.setGaugeTheme(int(AnalogGaugeWidget["gaugeTheme"]))
-
-                    if "offsetAngle" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set offset angle
-                        ################################################################################################
-                        gaugeWidget.updateAngleOffset(int(AnalogGaugeWidget["offsetAngle"]))
-
-                    if "innerRadius" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set inner radius
-                        ################################################################################################
-                        gaugeWidget.setGaugeColorInnerRadiusFactor(int(AnalogGaugeWidget["innerRadius"]))
-
-                    if "outerRadius" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set outer radius
-                        ################################################################################################
-                        gaugeWidget.setGaugeColorOuterRadiusFactor(int(AnalogGaugeWidget["outerRadius"]))
-
-                    if "scaleStartAngle" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set start angle
-                        ################################################################################################
-                        gaugeWidget.setScaleStartAngle(int(AnalogGaugeWidget["scaleStartAngle"]))
-
-                    if "totalScaleAngle" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set total scale angle
-                        ################################################################################################
-                        gaugeWidget.setTotalScaleAngleSize(int(AnalogGaugeWidget["totalScaleAngle"]))
-
-                    if "enableBarGraph" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set enable bar graph
-                        ################################################################################################
-                        gaugeWidget.setEnableBarGraph(bool(AnalogGaugeWidget["enableBarGraph"]))
-
-                    if "enableValueText" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set enable text value
-                        ################################################################################################
-                        gaugeWidget.setEnableValueText(bool(AnalogGaugeWidget["enableValueText"]))
-
-                    if "enableNeedlePolygon" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set enable needle polygon
-                        ################################################################################################
-                        gaugeWidget.setEnableNeedlePolygon(bool(AnalogGaugeWidget["enableNeedlePolygon"]))
-
-                    if "enableCenterPoint" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set enable needle center
-                        ################################################################################################
-                        gaugeWidget.setEnableCenterPoint(bool(AnalogGaugeWidget["enableCenterPoint"]))
-
-                    if "enableScaleText" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set enable scale text
-                        ################################################################################################
-                        gaugeWidget.setEnableScaleText(bool(AnalogGaugeWidget["enableScaleText"]))
-
-                    if "enableScaleBigGrid" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set enable big scale grid
-                        ################################################################################################
-                        gaugeWidget.setEnableBigScaleGrid(bool(AnalogGaugeWidget["enableScaleBigGrid"]))
-
-                    if "enableScaleFineGrid" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set enable big scale grid
-                        ################################################################################################
-                        gaugeWidget.setEnableFineScaleGrid(bool(AnalogGaugeWidget["enableScaleFineGrid"]))
-
-                    if "needleColor" in AnalogGaugeWidget and len(str(AnalogGaugeWidget["needleColor"])) > 0:
-                        ################################################################################################
-                        # Set needle color
-                        ################################################################################################
-                        gaugeWidget.needle_color = QColor(str(AnalogGaugeWidget["needleColor"]))
-                        gaugeWidget.needle_color_released = QColor(str(AnalogGaugeWidget["needleColor"]))
-
-                    if "needleColorOnDrag" in AnalogGaugeWidget and len(
-                            str(AnalogGaugeWidget["needleColorOnDrag"])) > 0:
-                        ################################################################################################
-                        # Set needle color on drag
-                        ################################################################################################
-                        gaugeWidget.needle_color_drag = QColor(str(AnalogGaugeWidget["needleColorOnDrag"]))
-
-                    if "scaleValueColor" in AnalogGaugeWidget and len(str(AnalogGaugeWidget["scaleValueColor"])) > 0:
-                        ################################################################################################
-                        # Set value color
-                        ################################################################################################
-                        gaugeWidget.scale_value_color = QColor(str(AnalogGaugeWidget["scaleValueColor"]))
-
-                    if "displayValueColor" in AnalogGaugeWidget and len(
-                            str(AnalogGaugeWidget["displayValueColor"])) > 0:
-                        ################################################################################################
-                        # Set display value color
-                        ################################################################################################
-                        gaugeWidget.display_value_color = QColor(str(AnalogGaugeWidget["displayValueColor"]))
-
-                    if "bigScaleColor" in AnalogGaugeWidget and len(str(AnalogGaugeWidget["bigScaleColor"])) > 0:
-                        ################################################################################################
-                        # Set big scale color
-                        ################################################################################################
-                        gaugeWidget.setBigScaleColor(QColor(str(AnalogGaugeWidget["bigScaleColor"])))
-
-                    if "fineScaleColor" in AnalogGaugeWidget and len(str(AnalogGaugeWidget["fineScaleColor"])) > 0:
-                        ################################################################################################
-                        # Set fine scale color
-                        ################################################################################################
-                        gaugeWidget.setFineScaleColor(QColor(str(AnalogGaugeWidget["fineScaleColor"])))
-
-                    if "customGaugeTheme" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set custom gauge theme
-                        ################################################################################################
-                        colors = AnalogGaugeWidget['customGaugeTheme']
-
-                        for x in colors:
-
-                            if "color1" in x and len(str(x['color1'])) > 0:
-                                if "color2" in x and len(str(x['color2'])) > 0:
-                                    if "color3" in x and len(str(x['color3'])) > 0:
-
-                                        gaugeWidget.setCustomGaugeTheme(
-                                            color1=str(x['color1']),
-                                            color2=str(x['color2']),
-                                            color3=str(x['color3'])
-                                        )
-
-                                    else:
-
-                                        gaugeWidget.setCustomGaugeTheme(
-                                            color1=str(x['color1']),
-                                            color2=str(x['color2']),
-                                        )
-
-                                else:
+            compiled.append({"buttons": buttons, "activeStyle": activeStyle, "notActiveStyle": notActiveStyle,
+                             "propertyMode": "PropertyMode" in QPushButtonGroup and
+                                             QPushButtonGroup["PropertyMode"] == True})
 
-                                    gaugeWidget.setCustomGaugeTheme(
-                                        color1=str(x['color1']),
-                                    )
+    return compiled
 
-                    if "scalePolygonColor" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set scale polygon color
-                        ################################################################################################
-                        colors = AnalogGaugeWidget['scalePolygonColor']
 
-                        for x in colors:
+def applyQPushButtonGroupSection(self, ui, sectionData):
+    # Add Class To PushButtons
+    QPushButton.getButtonGroup = QCustomPushButtonGroup.getButtonGroup
+    QPushButton.getButtonGroupActiveStyle = QCustomPushButtonGroup.getButtonGroupActiveStyle
+    QPushButton.getButtonGroupNotActiveStyle = QCustomPushButtonGroup.getButtonGroupNotActiveStyle
+    QPushButton.getButtonGroupButtons = QCustomPushButtonGroup.getButtonGroupButtons
+    QPushButton.getButtonGroupActiveStyle = QCustomPushButtonGroup.getButtonGroupActiveStyle
+    QPushButton.setButtonGroupActiveStyle = QCustomPushButtonGroup.setButtonGroupActiveStyle
+    QPushButton.setButtonGroupNotActiveStyle = QCustomPushButtonGroup.setButtonGroupNotActiveStyle
+
+    grp_count = 0
+    for QPushButtonGroup in sectionData:
+        grp_count += 1
+        # Re-applying a group replaces its buttons
+        setattr(self, "group_btns_" + str(grp_count), [])
+        for btn in QPushButtonGroup["buttons"]:
+            btn.groupParent = self
+            btn.active = False
+            setattr(btn, "group", grp_count)
+
+            getattr(self, "group_btns_" + str(grp_count)).append(btn)
+
+            connectStyleSignal(btn.clicked, self.checkButtonGroup)
+
+        getattr(self, "group_btns_" + str(grp_count))[0].active = True
+        setattr(self, "group_active_" + str(grp_count), QPushButtonGroup["activeStyle"])
+        setattr(self, "group_not_active_" + str(grp_count), QPushButtonGroup["notActiveStyle"])
+
+        if QPushButtonGroup["propertyMode"]:
+            setattr(self, "group_property_mode_" + str(grp_count), True)
+            setattr(self, "group_current_" + str(grp_count), getattr(self, "group_btns_" + str(grp_count))[0])
+            applyButtonGroupPropertyStyle(self, grp_count)
+        else:
+            setattr(self, "group_property_mode_" + str(grp_count), False)
 
-                            if "color1" in x and len(str(x['color1'])) > 0:
-                                if "color2" in x and len(str(x['color2'])) > 0:
-                                    if "color3" in x and len(str(x['color3'])) > 0:
+    return sum(len(QPushButtonGroup["buttons"]) for QPushButtonGroup in sectionData)
 
-                                        gaugeWidget.setScalePolygonColor(
-                                            color1=str(x['color1']),
-                                            color2=str(x['color2']),
-                                            color3=str(x['color3'])
-                                        )
 
-                                    else:
+########################################################################
+## ANALOG GAUGE WIDGET
+########################################################################
+# JSON key -> attribute or method of the gauge, value conversion and whether it is
+# an attribute, in the order the values are applied
+ANALOG_GAUGE_VALUES = [
+    ("units", "units", str, True),
+    ("minValue", "min_value", int, True),
+    ("maxValue", "max_value", int, True),
+    ("scalaCount", "scala_count", int, True),
+    ("startValue", "updateValue", int, False),
+    ("gaugeTheme", "setGaugeTheme", int, False),
+    ("offsetAngle", "updateAngleOffset", int, False),
+    ("innerRadius", "setGaugeColorInnerRadiusFactor", int, False),
+    ("outerRadius", "setGaugeColorOuterRadiusFactor", int, False),
+    ("scaleStartAngle", "setScaleStartAngle", int, False),
+    ("totalScaleAngle", "setTotalScaleAngleSize", int, False),
+    ("enableBarGraph", "setEnableBarGraph", bool, False),
+    ("enableValueText", "setEnableValueText", bool, False),
+    ("enableNeedlePolygon", "setEnableNeedlePolygon", bool, False),
+    ("enableCenterPoint", "setEnableCenterPoint", bool, False),
+    ("enableScaleText", "setEnableScaleText", bool, False),
+    ("enableScaleBigGrid", "setEnableBigScaleGrid", bool, False),
+    ("enableScaleFineGrid", "setEnableFineScaleGrid", bool, False),
+]
+
+# JSON key -> attributes or method set to a color, empty values are ignored
+ANALOG_GAUGE_COLORS = [
+    ("needleColor", ("needle_color", "needle_color_released"), True),
+    ("needleColorOnDrag", ("needle_color_drag",), True),
+    ("scaleValueColor", ("scale_value_color",), True),
+    ("displayValueColor", ("display_value_color",), True),
+    ("bigScaleColor", ("setBigScaleColor",), False),
+    ("fineScaleColor", ("setFineScaleColor",), False),
+]
+
+# JSON key -> method taking up to three colors
+ANALOG_GAUGE_GRADIENTS = [
+    ("customGaugeTheme", "setCustomGaugeTheme"),
+    ("scalePolygonColor", "setScalePolygonColor"),
+    ("needleCenterColor", "setNeedleCenterColor"),
+    ("outerCircleColor", "setOuterCircleColor"),
+]
+
+
+def compileAnalogGaugeWidgetEntry(ui, AnalogGaugeWidget):
+    if not hasattr(ui, str(AnalogGaugeWidget["name"])):
+        raise Exception(str(AnalogGaugeWidget["name"]) + " is not a AnalogGaugeWidget, no widget found")
+
+    gaugeWidget = getattr(ui, str(AnalogGaugeWidget["name"]))
+    if not gaugeWidget.metaObject().className() == "AnalogGaugeWidget":
+        raise Exception("Error: " + str(AnalogGaugeWidget["name"]) + " is not a AnalogGaugeWidget object")
+
+    calls = []
+    for key, name, convert, attribute in ANALOG_GAUGE_VALUES:
+        if key in AnalogGaugeWidget:
+            if key == "units" and len(str(AnalogGaugeWidget[key])) == 0:
+                continue
+            if attribute:
+                calls.append((setattr, (gaugeWidget, name, convert(AnalogGaugeWidget[key])), {}))
+            else:
+                calls.append((getattr(gaugeWidget, name), (convert(AnalogGaugeWidget[key]),), {}))
 
-                                        gaugeWidget.setScalePolygonColor(
-                                            color1=str(x['color1']),
-                                            color2=str(x['color2']),
-                                        )
+    for key, names, attribute in ANALOG_GAUGE_COLORS:
+        if key in AnalogGaugeWidget and len(str(AnalogGaugeWidget[key])) > 0:
+            for name in names:
+                if attribute:
+                    calls.append((setattr, (gaugeWidget, name, QColor(str(AnalogGaugeWidget[key]))), {}))
+                else:
+                    calls.append((getattr(gaugeWidget, name), (QColor(str(AnalogGaugeWidget[key])),), {}))
 
-                                else:
+    for key, name in ANALOG_GAUGE_GRADIENTS:
+        if key in AnalogGaugeWidget:
+            for x in AnalogGaugeWidget[key]:
+                colors = {}
+                for color in ("color1", "color2", "color3"):
+                    # Colors are only read until the first missing one
+                    if color not in x or len(str(x[color])) == 0:
+                        break
+                    colors[color] = str(x[color])
 
-                                    gaugeWidget.setScalePolygonColor(
-                                        color1=str(x['color1']),
-                                    )
+                if len(colors) > 0:
+                    calls.append((getattr(gaugeWidget, name), (), colors))
 
-                    if "needleCenterColor" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set needle center color
-                        ################################################################################################
-                        colors = AnalogGaugeWidget['needleCenterColor']
+    for key, name in (("valueFontFamily", "setValueFontFamily"), ("scaleFontFamily", "setScaleFontFamily")):
+        if key in AnalogGaugeWidget:
+            for x in AnalogGaugeWidget[key]:
+                if "path" in x and len(str(x['path'])) > 0:
+                    calls.append((QFontDatabase.addApplicationFont,
+                                  (os.path.join(os.path.dirname(__file__), str(x['path'])),), {}))
 
-                        for x in colors:
+                if "name" in x and len(str(x['name'])) > 0:
+                    calls.append((getattr(gaugeWidget, name), (str(x['name']),), {}))
 
-                            if "color1" in x and len(str(x['color1'])) > 0:
-                                if "color2" in x and len(str(x['color2'])) > 0:
-                                    if "color3" in x and len(str(x['color3'])) > 0:
+    return calls
 
-                                        gaugeWidget.setNeedleCenterColor(
-                                            color1=str(x['color1']),
-                                            color2=str(x['color2']),
-                                            color3=str(x['color3'])
-                                        )
 
-                                    else:
+def applyAnalogGaugeWidgetSection(self, ui, sectionData):
+    for calls in sectionData:
+        applyCompiledCalls(calls)
 
-                                        gaugeWidget.setNeedleCenterColor(
-                                            color1=str(x['color1']),
-                                            color2=str(x['color2']),
-                                        )
 
-                                else:
+########################################################################
+## MENUS
+########################################################################
+def compileQCustomSlideMenuEntry(ui, QCustomSlideMenu):
+    if not hasattr(ui, str(QCustomSlideMenu["name"])):
+        raise Exception(str(QCustomSlideMenu["name"]) + " is not a QCustomSlideMenu, no widget found")
+
+    containerWidget = getattr(ui, str(QCustomSlideMenu["name"]))
+    if not containerWidget.metaObject().className() == "QCustomSlideMenu":
+        raise Exception("Error: " + str(QCustomSlideMenu["name"]) + " is not a QCustomSlideMenu object")
+
+    #
+    defaultWidth = 0
+    defaultHeight = 0
+    collapsedWidth = 0
+    collapsedHeight = 0
+    expandedWidth = 0
+    expandedHeight = 0
+    animationDuration = 0
+    collapsingAnimationDuration = 0
+    expandingAnimationDuration = 0
+    animationEasingCurve = returnAnimationEasingCurve("Linear")
+    collapsingAnimationEasingCurve = returnAnimationEasingCurve("Linear")
+    expandingAnimationEasingCurve = returnAnimationEasingCurve("Linear")
+    collapsedStyle = ""
+    expandedStyle = ""
+    menuCollapsedIcon = ""
+    menuExpandedIcon = ""
+    menuCollapsedStyle = ""
+    menuExpandedStyle = ""
+    relativeTo = ""
+    position = ""
+    shadowColor = ""
+    shadowBlurRadius = ""
+    shadowXOffset = ""
+    shadowYOffset = ""
+    floatMenu = False
+    autoHide = True
+    contentProxy = False
+    # Widgets the floating menu is moved into, in order
+    floatParents = []
+
+    if "floatPosition" in QCustomSlideMenu:
+        floatMenu = True
+        for floatPosition in QCustomSlideMenu["floatPosition"]:
+
+            if "relativeTo" in floatPosition:
+                if hasattr(ui, str(floatPosition["relativeTo"])):
+                    floatParents.append(getattr(ui, str(floatPosition["relativeTo"])))
+                    # The menu is positioned in its new parent
+                    relativeTo = None
+                else:
+                    relativeTo = floatPosition["relativeTo"]
+
+            if "position" in floatPosition:
+                position = floatPosition["position"]
+
+            if "shadow" in floatPosition:
+                for shadow in floatPosition["shadow"]:
+                    if "color" in shadow:
+                        shadowColor = shadow["color"]
+                    if "blurRadius" in shadow:
+                        shadowBlurRadius = shadow["blurRadius"]
+                    if "xOffset" in shadow:
+                        shadowXOffset = shadow["xOffset"]
+                    if "yOffset" in shadow:
+                        shadowYOffset = shadow["yOffset"]
+
+            if "autoHide" in floatPosition:
+                if floatPosition["position"] == True:
+                    autoHide = True
+                else:
+                    autoHide = False
+            else:
+                autoHide = False
 
-                                    gaugeWidget.setNeedleCenterColor(
-                                        color1=str(x['color1']),
-                                    )
+    if "defaultSize" in QCustomSlideMenu:
+        for defaultSize in QCustomSlideMenu["defaultSize"]:
 
-                    if "outerCircleColor" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set outer circle color
-                        ################################################################################################
-                        colors = AnalogGaugeWidget['outerCircleColor']
+            if "width" in defaultSize:
+                defaultWidth = defaultSize["width"]
 
-                        for x in colors:
+            if "height" in defaultSize:
+                defaultHeight = defaultSize["height"]
 
-                            if "color1" in x and len(str(x['color1'])) > 0:
-                                if "color2" in x and len(str(x['color2'])) > 0:
-                                    if "color3" in x and len(str(x['color3'])) > 0:
+    if "collapsedSize" in QCustomSlideMenu:
+        for collapsedSize in QCustomSlideMenu["collapsedSize"]:
 
-                                        gaugeWidget.setOuterCircleColor(
-                                            color1=str(x['color1']),
-                                            color2=str(x['color2']),
-                                            color3=str(x['color3'])
-                                        )
+            if "width" in collapsedSize:
+                collapsedWidth = collapsedSize["width"]
 
-                                    else:
+            if "height" in collapsedSize:
+                collapsedHeight = collapsedSize["height"]
 
-                                        gaugeWidget.setOuterCircleColor(
-                                            color1=str(x['color1']),
-                                            color2=str(x['color2']),
-                                        )
+    if "expandedSize" in QCustomSlideMenu:
+        for expandedSize in QCustomSlideMenu["expandedSize"]:
 
-                                else:
+            if "width" in expandedSize:
+                expandedWidth = expandedSize["width"]
 
-                                    gaugeWidget.setOuterCircleColor(
-                                        color1=str(x['color1']),
-                                    )
+            if "height" in expandedSize:
+                expandedHeight = expandedSize["height"]
 
-                    if "valueFontFamily" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set value font family
-                        ################################################################################################
-                        font = AnalogGaugeWidget['valueFontFamily']
+    if "menuTransitionAnimation" in QCustomSlideMenu:
 
-                        for x in font:
-                            if "path" in x and len(str(x['path'])) > 0:
-                                QFontDatabase.addApplicationFont(
-                                    os.path.join(os.path.dirname(__file__), str(x['path'])))
+        for menuTransitionAnimation in QCustomSlideMenu["menuTransitionAnimation"]:
 
-                            if "name" in x and len(str(x['name'])) > 0:
-                                gaugeWidget.setValueFontFamily(str(x['name']))
+            if "animationDuration" in menuTransitionAnimation:
+                animationDuration = menuTransitionAnimation["animationDuration"]
+                collapsingAnimationDuration = menuTransitionAnimation["animationDuration"]
+                expandingAnimationDuration = menuTransitionAnimation["animationDuration"]
+
+            if "animationEasingCurve" in menuTransitionAnimation:
+                animationEasingCurve = returnAnimationEasingCurve(
+                    menuTransitionAnimation["animationEasingCurve"])
+                collapsingAnimationEasingCurve = returnAnimationEasingCurve(
+                    menuTransitionAnimation["animationEasingCurve"])
+                expandingAnimationEasingCurve = returnAnimationEasingCurve(
+                    menuTransitionAnimation["animationEasingCurve"])
+
+            if "contentProxy" in menuTransitionAnimation:
+                contentProxy = menuTransitionAnimation["contentProxy"] == True
+
+            if "whenCollapsing" in menuTransitionAnimation:
+                for whenCollapsing in menuTransitionAnimation["whenCollapsing"]:
+                    if "animationDuration" in whenCollapsing:
+                        collapsingAnimationDuration = whenCollapsing["animationDuration"]
+
+                    if "animationEasingCurve" in whenCollapsing:
+                        collapsingAnimationEasingCurve = returnAnimationEasingCurve(
+                            whenCollapsing["animationEasingCurve"])
+
+            if "whenExpanding" in menuTransitionAnimation:
+                for whenExpanding in menuTransitionAnimation["whenExpanding"]:
+                    if "animationDuration" in whenExpanding:
+                        expandingAnimationDuration = whenExpanding["animationDuration"]
+
+                    if "animationEasingCurve" in whenExpanding:
+                        expandingAnimationEasingCurve = returnAnimationEasingCurve(
+                            whenExpanding["animationEasingCurve"])
+
+    if "menuContainerStyle" in QCustomSlideMenu:
+        for menuContainerStyle in QCustomSlideMenu["menuContainerStyle"]:
+            if "whenMenuIsCollapsed" in menuContainerStyle:
+                colSty = ""
+                for collapsedStyle in menuContainerStyle["whenMenuIsCollapsed"]:
+                    colSty += str(collapsedStyle)
+
+                if len(colSty) > 0:
+                    collapsedStyle = colSty
+
+            if "whenMenuIsExpanded" in menuContainerStyle and len(
+                    str(menuContainerStyle["whenMenuIsExpanded"])) > 0:
+                expSty = ""
+                for expandedStyle in menuContainerStyle["whenMenuIsExpanded"]:
+                    expSty += str(expandedStyle)
+
+                if len(expSty) > 0:
+                    expandedStyle = expSty
+
+    accordionGroup = None
+    if "accordionGroup" in QCustomSlideMenu and len(str(QCustomSlideMenu["accordionGroup"])) > 0:
+        accordionGroup = str(QCustomSlideMenu["accordionGroup"])
+
+    toggleButtons = []
+    if "toggleButton" in QCustomSlideMenu:
+        for toggleButton in QCustomSlideMenu["toggleButton"]:
+            if "buttonName" in toggleButton and len(str(toggleButton["buttonName"])) > 0:
+                if not hasattr(ui, str(toggleButton["buttonName"])):
+                    raise Exception(str(toggleButton["buttonName"]) + " toggle button could not be found")
+
+                buttonObject = getattr(ui, str(toggleButton["buttonName"]))
+
+                if "icons" in toggleButton:
+                    for icons in toggleButton["icons"]:
+                        if "whenMenuIsCollapsed" in icons and len(str(icons["whenMenuIsCollapsed"])) > 0:
+                            menuCollapsedIcon = str(icons["whenMenuIsCollapsed"])
+
+                        if "whenMenuIsExpanded" in icons and len(str(icons["whenMenuIsExpanded"])) > 0:
+                            menuExpandedIcon = str(icons["whenMenuIsExpanded"])
+
+                if "style" in toggleButton:
+                    for style in toggleButton["style"]:
+                        if "whenMenuIsCollapsed" in style:
+                            colSty = ""
+                            for collapsedStyle in style["whenMenuIsCollapsed"]:
+                                colSty += str(collapsedStyle)
+
+                            if len(colSty) > 0:
+                                menuCollapsedStyle = colSty
+
+                        if "whenMenuIsExpanded" in style:
+                            expSty = ""
+                            for collapsedStyle in style["whenMenuIsExpanded"]:
+                                expSty += str(collapsedStyle)
+
+                            if len(expSty) > 0:
+                                menuExpandedStyle = expSty
+
+                toggleButtons.append(dict(
+                    buttonName=buttonObject,
+                    iconWhenMenuIsCollapsed=menuCollapsedIcon,
+                    iconWhenMenuIsExpanded=menuExpandedIcon,
+                    styleWhenMenuIsCollapsed=menuCollapsedStyle,
+                    styleWhenMenuIsExpanded=menuExpandedStyle
+                ))
+
+    return {
+        "widget": containerWidget,
+        "floatMenu": floatMenu,
+        "floatParents": floatParents,
+        "customize": dict(
+            defaultWidth=defaultWidth,
+            defaultHeight=defaultHeight,
+            collapsedWidth=collapsedWidth,
+            collapsedHeight=collapsedHeight,
+            expandedWidth=expandedWidth,
+            expandedHeight=expandedHeight,
+            animationDuration=animationDuration,
+            animationEasingCurve=collapsingAnimationDuration,
+            collapsingAnimationDuration=collapsingAnimationDuration,
+            collapsingAnimationEasingCurve=animationEasingCurve,
+            expandingAnimationDuration=expandingAnimationDuration,
+            expandingAnimationEasingCurve=expandingAnimationEasingCurve,
+            collapsedStyle=collapsedStyle,
+            expandedStyle=expandedStyle,
+            floatMenu=floatMenu,
+            relativeTo=relativeTo,
+            position=position,
+            shadowColor=shadowColor,
+            shadowBlurRadius=shadowBlurRadius,
+            shadowXOffset=shadowXOffset,
+            shadowYOffset=shadowYOffset,
+            autoHide=autoHide,
+            contentProxy=contentProxy
+        ),
+        "accordionGroup": accordionGroup,
+        "toggleButtons": toggleButtons
+    }
+
+
+def applyQCustomSlideMenuSection(self, ui, sectionData):
+    for QCustomSlideMenu in sectionData:
+        containerWidget = QCustomSlideMenu["widget"]
+
+        if QCustomSlideMenu["floatMenu"]:
+            #######################################################################
+            # Floating widgets
+            #######################################################################
+            if not hasattr(self, "floatingWidgets"):
+                self.floatingWidgets = []
+            if containerWidget not in self.floatingWidgets:
+                self.floatingWidgets.append(containerWidget)
+
+        for floatParent in QCustomSlideMenu["floatParents"]:
+            containerWidget.setParent(floatParent)
+
+        containerWidget.customizeQCustomSlideMenu(**QCustomSlideMenu["customize"])
+
+        groupName = QCustomSlideMenu["accordionGroup"]
+        if groupName is not None:
+            if not hasattr(self, "slideMenuGroups"):
+                self.slideMenuGroups = {}
+            if groupName not in self.slideMenuGroups:
+                self.slideMenuGroups[groupName] = QCustomSlideMenuGroup(self)
+            if containerWidget.menuGroup is not None and containerWidget.menuGroup is not self.slideMenuGroups[groupName]:
+                containerWidget.menuGroup.removeMenu(containerWidget)
+            self.slideMenuGroups[groupName].addMenu(containerWidget)
+        elif containerWidget.menuGroup in getattr(self, "slideMenuGroups", {}).values():
+            # The entry no longer belongs to a JSON accordion group
+            containerWidget.menuGroup.removeMenu(containerWidget)
+
+        for toggleButton in QCustomSlideMenu["toggleButtons"]:
+            containerWidget.toggleButton(**toggleButton)
+
+        containerWidget.refresh()
 
-                    if "scaleFontFamily" in AnalogGaugeWidget:
-                        ################################################################################################
-                        # Set scale font family
-                        ################################################################################################
-                        font = AnalogGaugeWidget['scaleFontFamily']
-                        for x in font:
-                            if "path" in x and len(str(x['path'])) > 0:
-                                QFontDatabase.addApplicationFont(
-                                    os.path.join(os.path.dirname(__file__), str(x['path'])))
 
-                            if "name" in x and len(str(x['name'])) > 0:
-                                gaugeWidget.setScaleFontFamily(str(x['name']))
+########################################################################
+## WINDOWS FLAG
+########################################################################
+def applyQMainWindowSection(self, ui, sectionData):
+    for QMainWindow in sectionData:
+        if "title" in QMainWindow and len(str(QMainWindow["title"])) > 0:
+            # Set window tittle
+            self.setWindowTitle(str(QMainWindow["title"]))
+
+        if "icon" in QMainWindow and len(str(QMainWindow["icon"])) > 0:
+            #######################################################################
+            # Set window Icon
+            #######################################################################
+            self.setWindowIcon(QtGui.QIcon(str(QMainWindow["icon"])))
+
+        if "frameless" in QMainWindow and QMainWindow["frameless"]:
+            #######################################################################
+            ## # Remove window tittle bar
+            ########################################################################
+            # Changing the flags hides the window, only do it once
+            if not self.windowFlags() & QtCore.Qt.FramelessWindowHint:
+                windowVisible = self.isVisible()
+                self.setWindowFlags(QtCore.Qt.FramelessWindowHint)
+                if windowVisible:
+                    self.show()
+
+        if "transluscentBg" in QMainWindow and QMainWindow["transluscentBg"]:
+            #######################################################################
+            ## # Set main background to transparent
+            ########################################################################
+            self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+
+        if "sizeGrip" in QMainWindow and len(str(QMainWindow["sizeGrip"])) > 0:
+            #################################################################################
+            # Window Size grip to resize window
+            #################################################################################
+            if hasattr(self.ui, str(QMainWindow["sizeGrip"])):
+                sizeGripWidget = getattr(self.ui, str(QMainWindow["sizeGrip"]))
+                # Reloading the stylesheet reuses the existing grip
+                if sizeGripWidget.findChild(QSizeGrip, "", QtCore.Qt.FindDirectChildrenOnly) is None:
+                    QSizeGrip(sizeGripWidget)
+
+        if "shadow" in QMainWindow:
+            #######################################################################
+            ## # Shadow effect style
+            ########################################################################
+
+            for shadow in QMainWindow["shadow"]:
+                if "centralWidget" in shadow and len(str(shadow['centralWidget'])) > 0:
+                    if hasattr(self.ui, str(shadow["centralWidget"])):
+                        self.shadow = QGraphicsDropShadowEffect(self)
+                        if "color" in shadow and len(str(shadow['color'])) > 0:
+                            self.shadow.setColor(QColor(str(shadow['color'])))
+                        if "blurRadius" in shadow and int(shadow['blurRadius']) > 0:
+                            self.shadow.setBlurRadius(int(shadow['blurRadius']))
+                        if "xOffset" in shadow and int(shadow['xOffset']) > 0:
+                            self.shadow.setXOffset(int(shadow['xOffset']))
+                        else:
+                            self.shadow.setXOffset(0)
 
+                        if "yOffset" in shadow and int(shadow['yOffset']) > 0:
+                            self.shadow.setYOffset(int(shadow['yOffset']))
+                        else:
+                            self.shadow.setYOffset(0)
 
-                else:
-                    raise Exception(str(AnalogGaugeWidget["name"]) + " is not a AnalogGaugeWidget, no widget found")
-
-    ########################################################################
-    ## MENUS
-    ########################################################################
-    if "QCustomSlideMenu" in data:
-        for QCustomSlideMenu in data['QCustomSlideMenu']:
-            if "name" in QCustomSlideMenu and len(str(QCustomSlideMenu["name"])) > 0:
-                if hasattr(self.ui, str(QCustomSlideMenu["name"])):
-                    containerWidget = getattr(self.ui, str(QCustomSlideMenu["name"]))
-
-                    if not containerWidget.metaObject().className() == "QCustomSlideMenu":
-                        raise Exception("Error: " + str(QCustomSlideMenu["name"]) + " is not a QCustomSlideMenu object")
-                        return
-
-                    #
-                    defaultWidth = 0
-                    defaultHeight = 0
-                    collapsedWidth = 0
-                    collapsedHeight = 0
-                    expandedWidth = 0
-                    expandedHeight = 0
-                    animationDuration = 0
-                    collapsingAnimationDuration = 0
-                    expandingAnimationDuration = 0
-                    animationEasingCurve = returnAnimationEasingCurve("Linear")
-                    collapsingAnimationEasingCurve = returnAnimationEasingCurve("Linear")
-                    expandingAnimationEasingCurve = returnAnimationEasingCurve("Linear")
-                    collapsedStyle = ""
-                    expandedStyle = ""
-                    buttonObject = ""
-                    menuCollapsedIcon = ""
-                    menuExpandedIcon = ""
-                    menuCollapsedStyle = ""
-                    menuExpandedStyle = ""
-                    relativeTo = ""
-                    position = ""
-                    shadowColor = ""
-                    shadowBlurRadius = ""
-                    shadowXOffset = ""
-                    shadowYOffset = ""
-                    floatMenu = False
-                    autoHide = True
+                        #######################################################################
+                        ## # Appy shadow to central widget
+                        ########################################################################
+                        getattr(self.ui, str(shadow["centralWidget"])).setGraphicsEffect(self.shadow)
+
+        if "navigation" in QMainWindow:
+            for navigation in QMainWindow["navigation"]:
+                if "minimize" in navigation and len(str(navigation["minimize"])) > 0:
+                    #######################################################################
+                    # Minimize window
+                    if hasattr(self.ui, str(navigation["minimize"])):
+                        connectStyleSignal(getattr(self.ui, str(navigation["minimize"])).clicked, lambda: self.showMinimized())
+
+                if "close" in navigation and len(str(navigation["close"])) > 0:
+                    #######################################################################
+                    # Close window
+                    if hasattr(self.ui, str(navigation["close"])):
+                        connectStyleSignal(getattr(self.ui, str(navigation["close"])).clicked, lambda: self.close())
+
+                if "restore" in navigation:
+                    #######################################################################
+                    # Restore/Maximize window
+                    for restore in navigation["restore"]:
+                        if "buttonName" in restore and len(str(restore["buttonName"])) > 0:
+                            if hasattr(self.ui, str(restore["buttonName"])):
+                                connectStyleSignal(getattr(self.ui, str(restore["buttonName"])).clicked,
+                                                   lambda: self.restore_or_maximize_window())
+                                self.restoreBtn = getattr(self.ui, str(restore["buttonName"]))
+                        if "normalIcon" in restore and len(str(restore["normalIcon"])) > 0:
+                            self.normalIcon = str(restore["normalIcon"])
+                        else:
+                            self.normalIcon = ""
 
-                    if "floatPosition" in QCustomSlideMenu:
-                        floatMenu = True
-                        if hasattr(self, "floatingWidgets"):
-                            self.floatingWidgets.append(containerWidget)
+                        if "maximizedIcon" in restore and len(str(restore["maximizedIcon"])) > 0:
+                            self.maximizedIcon = str(restore["maximizedIcon"])
                         else:
+                            self.maximizedIcon = ""
 
-                            #######################################################################
-                            # Floating widgets
-                            #######################################################################
-                            self.floatingWidgets = []
-                            self.floatingWidgets.append(containerWidget)
+                if "moveWindow" in navigation and len(str(navigation["moveWindow"])) > 0:
+                    #######################################################################
+                    # Add click event/Mouse move event/drag event to the top header to move the window
+                    #######################################################################
+                    if hasattr(self.ui, str(navigation["moveWindow"])):
+                        getattr(self.ui, str(navigation["moveWindow"])).mouseMoveEvent = self.moveWindow
+                    #######################################################################
 
-                        for floatPosition in QCustomSlideMenu["floatPosition"]:
+                if "titleBar" in navigation and len(str(navigation["titleBar"])) > 0:
+                    #######################################################################
+                    # Add click event/Mouse move event/drag event to the top header to move the window
+                    #######################################################################
+                    if hasattr(self.ui, str(navigation["titleBar"])):
+                        getattr(self.ui, str(navigation["titleBar"])).mouseDoubleClickEvent = self.toggleWindowSize
+                    #######################################################################
 
-                            if "relativeTo" in floatPosition:
-                                if hasattr(self.ui, floatPosition["relativeTo"]):
-                                    relativeTo = getattr(self.ui, str(floatPosition["relativeTo"]))
 
-                                    relativeTo = containerWidget.setParent(relativeTo)
-                                else:
-                                    relativeTo = floatPosition["relativeTo"]
-
-                            if "position" in floatPosition:
-                                position = floatPosition["position"]
-
-                            if "shadow" in floatPosition:
-                                for shadow in floatPosition["shadow"]:
-                                    if "color" in shadow:
-                                        shadowColor = shadow["color"]
-                                    if "blurRadius" in shadow:
-                                        shadowBlurRadius = shadow["blurRadius"]
-                                    if "xOffset" in shadow:
-                                        shadowXOffset = shadow["xOffset"]
-                                    if "yOffset" in shadow:
-                                        shadowYOffset = shadow["yOffset"]
-
-                            if "autoHide" in floatPosition:
-                                if floatPosition["position"] == True:
-                                    autoHide = True
-                                else:
-                                    autoHide = False
-                            else:
-                                autoHide = False
-
-                    if "defaultSize" in QCustomSlideMenu:
-                        for defaultSize in QCustomSlideMenu["defaultSize"]:
-
-                            if "width" in defaultSize:
-                                defaultWidth = defaultSize["width"]
-
-                            if "height" in defaultSize:
-                                defaultHeight = defaultSize["height"]
-
-                    if "collapsedSize" in QCustomSlideMenu:
-                        for collapsedSize in QCustomSlideMenu["collapsedSize"]:
-
-                            if "width" in collapsedSize:
-                                collapsedWidth = collapsedSize["width"]
-
-                            if "height" in collapsedSize:
-                                collapsedHeight = collapsedSize["height"]
-
-                    if "expandedSize" in QCustomSlideMenu:
-                        for expandedSize in QCustomSlideMenu["expandedSize"]:
-
-                            if "width" in expandedSize:
-                                expandedWidth = expandedSize["width"]
-
-                            if "height" in expandedSize:
-                                expandedHeight = expandedSize["height"]
-
-                    if "menuTransitionAnimation" in QCustomSlideMenu:
-
-                        for menuTransitionAnimation in QCustomSlideMenu["menuTransitionAnimation"]:
-
-                            if "animationDuration" in menuTransitionAnimation:
-                                animationDuration = menuTransitionAnimation["animationDuration"]
-                                collapsingAnimationDuration = menuTransitionAnimation["animationDuration"]
-                                expandingAnimationDuration = menuTransitionAnimation["animationDuration"]
-
-                            if "animationEasingCurve" in menuTransitionAnimation:
-                                animationEasingCurve = returnAnimationEasingCurve(
-                                    menuTransitionAnimation["animationEasingCurve"])
-                                collapsingAnimationEasingCurve = returnAnimationEasingCurve(
-                                    menuTransitionAnimation["animationEasingCurve"])
-                                expandingAnimationEasingCurve = returnAnimationEasingCurve(
-                                    menuTransitionAnimation["animationEasingCurve"])
-
-                            if "whenCollapsing" in menuTransitionAnimation:
-                                for whenCollapsing in menuTransitionAnimation["whenCollapsing"]:
-                                    if "animationDuration" in whenCollapsing:
-                                        collapsingAnimationDuration = whenCollapsing["animationDuration"]
-
-                                    if "animationEasingCurve" in whenCollapsing:
-                                        collapsingAnimationEasingCurve = returnAnimationEasingCurve(
-                                            whenCollapsing["animationEasingCurve"])
-
-                            if "whenExpanding" in menuTransitionAnimation:
-                                for whenExpanding in menuTransitionAnimation["whenExpanding"]:
-                                    if "animationDuration" in whenExpanding:
-                                        expandingAnimationDuration = whenExpanding["animationDuration"]
-
-                                    if "animationEasingCurve" in whenExpanding:
-                                        expandingAnimationEasingCurve = returnAnimationEasingCurve(
-                                            whenExpanding["animationEasingCurve"])
-
-                    if "menuContainerStyle" in QCustomSlideMenu:
-                        for menuContainerStyle in QCustomSlideMenu["menuContainerStyle"]:
-                            if "whenMenuIsCollapsed" in menuContainerStyle:
-                                colSty = ""
-                                for collapsedStyle in menuContainerStyle["whenMenuIsCollapsed"]:
-                                    colSty += str(collapsedStyle)
-
-                                if len(colSty) > 0:
-                                    collapsedStyle = colSty
-
-                            if "whenMenuIsExpanded" in menuContainerStyle and len(
-                                    str(menuContainerStyle["whenMenuIsExpanded"])) > 0:
-                                expSty = ""
-                                for expandedStyle in menuContainerStyle["whenMenuIsExpanded"]:
-                                    expSty += str(expandedStyle)
-
-                                if len(expSty) > 0:
-                                    expandedStyle = expSty
-
-                    containerWidget.customizeQCustomSlideMenu(
-                        defaultWidth=defaultWidth,
-                        defaultHeight=defaultHeight,
-                        collapsedWidth=collapsedWidth,
-                        collapsedHeight=collapsedHeight,
-                        expandedWidth=expandedWidth,
-                        expandedHeight=expandedHeight,
-                        animationDuration=animationDuration,
-                        animationEasingCurve=collapsingAnimationDuration,
-                        collapsingAnimationDuration=collapsingAnimationDuration,
-                        collapsingAnimationEasingCurve=animationEasingCurve,
-                        expandingAnimationDuration=expandingAnimationDuration,
-                        expandingAnimationEasingCurve=expandingAnimationEasingCurve,
-                        collapsedStyle=collapsedStyle,
-                        expandedStyle=expandedStyle,
-                        floatMenu=floatMenu,
-                        relativeTo=relativeTo,
-                        position=position,
-                        shadowColor=shadowColor,
-                        shadowBlurRadius=shadowBlurRadius,
-                        shadowXOffset=shadowXOffset,
-                        shadowYOffset=shadowYOffset,
-                        autoHide=autoHide
-                    )
-
-                    if "toggleButton" in QCustomSlideMenu:
-                        for toggleButton in QCustomSlideMenu["toggleButton"]:
-                            if "buttonName" in toggleButton and len(str(toggleButton["buttonName"])) > 0:
-                                if hasattr(self.ui, str(toggleButton["buttonName"])):
-
-                                    buttonObject = getattr(self.ui, str(toggleButton["buttonName"]))
-
-                                    if "icons" in toggleButton:
-                                        for icons in toggleButton["icons"]:
-                                            if "whenMenuIsCollapsed" in icons and len(
-                                                    str(icons["whenMenuIsCollapsed"])) > 0:
-                                                menuCollapsedIcon = str(icons["whenMenuIsCollapsed"])
-
-                                            if "whenMenuIsExpanded" in icons and len(
-                                                    str(icons["whenMenuIsExpanded"])) > 0:
-                                                menuExpandedIcon = str(icons["whenMenuIsExpanded"])
-
-                                    if "style" in toggleButton:
-                                        for style in toggleButton["style"]:
-                                            if "whenMenuIsCollapsed" in style:
-                                                colSty = ""
-                                                for collapsedStyle in style["whenMenuIsCollapsed"]:
-                                                    colSty += str(collapsedStyle)
-
-                                                if len(colSty) > 0:
-                                                    menuCollapsedStyle = colSty
-
-                                            if "whenMenuIsExpanded" in style:
-                                                expSty = ""
-                                                for collapsedStyle in style["whenMenuIsExpanded"]:
-                                                    expSty += str(collapsedStyle)
-
-                                                if len(expSty) > 0:
-                                                    menuExpandedStyle = expSty
-
-                                    containerWidget.toggleButton(
-                                        buttonName=buttonObject,
-                                        iconWhenMenuIsCollapsed=menuCollapsedIcon,
-                                        iconWhenMenuIsExpanded=menuExpandedIcon,
-                                        styleWhenMenuIsCollapsed=menuCollapsedStyle,
-                                        styleWhenMenuIsExpanded=menuExpandedStyle
-                                    )
+########################################################################
+## QPUSHBUTTON
+########################################################################
+def compileQPushButtonEntry(ui, button):
+    # Unknown buttons and buttons named differently are skipped
+    if not hasattr(ui, str(button["name"])):
+        return []
 
-                                else:
-                                    raise Exception(
-                                        str(toggleButton["buttonName"]) + " toggle button could not be found")
+    buttonObject = getattr(ui, str(button["name"]))
+    # VERIFY IF THE OBJECT IS A BUTTON
+    if not str(buttonObject.metaObject().className()) == "QCustomQPushButton":
+        raise Exception(buttonObject.metaObject().className(), buttonObject,
+                        " is not of type QPushButton")
 
-                    containerWidget.refresh()
+    calls = [(setattr, (buttonObject, "wasFound", False), {}), (setattr, (buttonObject, "wasThemed", False), {})]
+    if not buttonObject.objectName() == button["name"]:
+        return calls
 
+    customThemes = []
+    if "customTheme" in button and len(button["customTheme"]) > 0:
+        customThemes = [(x["color1"], x["color2"]) for x in button["customTheme"] if len(x["color1"]) > 0]
 
-                else:
-                    raise Exception(str(QCustomSlideMenu["name"]) + " is not a QCustomSlideMenu, no widget found")
-    ########################################################################
-    ## END
-    ########################################################################
+    if "theme" in button and len(button["theme"]) > 0:
+        calls.append((buttonObject.setObjectTheme, (button["theme"],), {}))
 
-    ########################################################################
-    ## WINDOWS FLAG
-    ########################################################################
-    if "QMainWindow" in data:
-        for QMainWindow in data['QMainWindow']:
-            if "title" in QMainWindow and len(str(QMainWindow["title"])) > 0:
-                # Set window tittle
-                self.setWindowTitle(str(QMainWindow["title"]))
+    for color1, color2 in customThemes:
+        calls.append((buttonObject.setObjectCustomTheme, (color1, color2), {}))
 
-            if "icon" in QMainWindow and len(str(QMainWindow["icon"])) > 0:
-                #######################################################################
-                # Set window Icon
-                #######################################################################
-                self.setWindowIcon(QtGui.QIcon(str(QMainWindow["icon"])))
+    if "animateOn" in button and len(button["animateOn"]) > 0:
+        calls.append((buttonObject.setObjectAnimateOn, (button["animateOn"],), {}))
 
-            if "frameless" in QMainWindow and QMainWindow["frameless"]:
-                #######################################################################
-                ## # Remove window tittle bar
-                ########################################################################
-                self.setWindowFlags(QtCore.Qt.FramelessWindowHint)
+    if "animation" in button and len(button["animation"]) > 0:
+        calls.append((buttonObject.setObjectAnimation, (button["animation"],), {}))
 
-            if "transluscentBg" in QMainWindow and QMainWindow["transluscentBg"]:
-                #######################################################################
-                ## # Set main background to transparent
-                ########################################################################
-                self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-
-            if "sizeGrip" in QMainWindow and len(str(QMainWindow["sizeGrip"])) > 0:
-                #################################################################################
-                # Window Size grip to resize window
-                #################################################################################
-                if hasattr(self.ui, str(QMainWindow["sizeGrip"])):
-                    QSizeGrip(getattr(self.ui, str(QMainWindow["sizeGrip"])))
-
-            if "shadow" in QMainWindow:
-                #######################################################################
-                ## # Shadow effect style
-                ########################################################################
-
-                for shadow in QMainWindow["shadow"]:
-                    if "centralWidget" in shadow and len(str(shadow['centralWidget'])) > 0:
-                        if hasattr(self.ui, str(shadow["centralWidget"])):
-                            self.shadow = QGraphicsDropShadowEffect(self)
-                            if "color" in shadow and len(str(shadow['color'])) > 0:
-                                self.shadow.setColor(QColor(str(shadow['color'])))
-                            if "blurRadius" in shadow and int(shadow['blurRadius']) > 0:
-                                self.shadow.setBlurRadius(int(shadow['blurRadius']))
-                            if "xOffset" in shadow and int(shadow['xOffset']) > 0:
-                                self.shadow.setXOffset(int(shadow['xOffset']))
-                            else:
-                                self.shadow.setXOffset(0)
+    if "renderMode" in button and len(button["renderMode"]) > 0:
+        calls.append((buttonObject.setObjectRenderMode, (button["renderMode"],), {}))
 
-                            if "yOffset" in shadow and int(shadow['yOffset']) > 0:
-                                self.shadow.setYOffset(int(shadow['yOffset']))
-                            else:
-                                self.shadow.setYOffset(0)
+    if "animationSteps" in button and int(button["animationSteps"]) > 0:
+        calls.append((buttonObject.setObjectAnimationSteps, (int(button["animationSteps"]),), {}))
 
-                            #######################################################################
-                            ## # Appy shadow to central widget
-                            ########################################################################
-                            getattr(self.ui, str(shadow["centralWidget"])).setGraphicsEffect(self.shadow)
+    if "animationDuration" in button and int(button['animationDuration']) > 0:
+        calls.append((buttonObject.setObjectAnimationDuration, (int(button["animationDuration"]),), {}))
 
-            if "navigation" in QMainWindow:
-                for navigation in QMainWindow["navigation"]:
-                    if "minimize" in navigation and len(str(navigation["minimize"])) > 0:
-                        #######################################################################
-                        # Minimize window
-                        if hasattr(self.ui, str(navigation["minimize"])):
-                            getattr(self.ui, str(navigation["minimize"])).clicked.connect(lambda: self.showMinimized())
+    if "animationEasingCurve" in button and len(button['animationEasingCurve']) > 0:
+        easingCurve = returnAnimationEasingCurve(button['animationEasingCurve'])
+        calls.append((buttonObject.setObjectAnimationEasingCurve, (easingCurve,), {}))
 
-                    if "close" in navigation and len(str(navigation["close"])) > 0:
-                        #######################################################################
-                        # Close window
-                        if hasattr(self.ui, str(navigation["close"])):
-                            getattr(self.ui, str(navigation["close"])).clicked.connect(lambda: self.close())
+    fallBackStyle = ""
+    if "fallBackStyle" in button:
+        for x in button["fallBackStyle"]:
+            fallBackStyle += x
 
-                    if "restore" in navigation:
-                        #######################################################################
-                        # Restore/Maximize window
-                        for restore in navigation["restore"]:
-                            if "buttonName" in restore and len(str(restore["buttonName"])) > 0:
-                                if hasattr(self.ui, str(restore["buttonName"])):
-                                    getattr(self.ui, str(restore["buttonName"])).clicked.connect(
-                                        lambda: self.restore_or_maximize_window())
-                                    self.restoreBtn = getattr(self.ui, str(restore["buttonName"]))
-                            if "normalIcon" in restore and len(str(restore["normalIcon"])) > 0:
-                                self.normalIcon = str(restore["normalIcon"])
-                            else:
-                                self.normalIcon = ""
+    defaultStyle = ""
+    if "defaultStyle" in button:
+        for x in button["defaultStyle"]:
+            defaultStyle += x
 
-                            if "maximizedIcon" in restore and len(str(restore["maximizedIcon"])) > 0:
-                                self.maximizedIcon = str(restore["maximizedIcon"])
-                            else:
-                                self.maximizedIcon = ""
+    calls.append((setattr, (buttonObject, "wasThemed", True), {}))
 
-                    if "moveWindow" in navigation and len(str(navigation["moveWindow"])) > 0:
-                        #######################################################################
-                        # Add click event/Mouse move event/drag event to the top header to move the window
-                        #######################################################################
-                        if hasattr(self.ui, str(navigation["moveWindow"])):
-                            getattr(self.ui, str(navigation["moveWindow"])).mouseMoveEvent = self.moveWindow
-                        #######################################################################
+    if len(fallBackStyle) > 0:
+        calls.append((buttonObject.setObjectFallBackStyle, (fallBackStyle,), {}))
 
-                    if "titleBar" in navigation and len(str(navigation["titleBar"])) > 0:
-                        #######################################################################
-                        # Add click event/Mouse move event/drag event to the top header to move the window
-                        #######################################################################
-                        if hasattr(self.ui, str(navigation["titleBar"])):
-                            getattr(self.ui, str(navigation["titleBar"])).mouseDoubleClickEvent = self.toggleWindowSize
-                        #######################################################################
+    if len(defaultStyle) > 0:
+        calls.append((buttonObject.setObjectDefaultStyle, (defaultStyle,), {}))
+
+    if len(fallBackStyle) > 0:
+        calls.append((buttonObject.setStyleSheet, (defaultStyle + fallBackStyle,), {}))
+    elif "theme" in button and len(button["theme"]) > 0:
+        calls.append((applyAnimationThemeStyle, (buttonObject, button["theme"]), {}))
+    elif "customTheme" in button and len(button["customTheme"]) > 0:
+        for color1, color2 in customThemes:
+            calls.append((applyCustomAnimationThemeStyle, (buttonObject, color1, color2), {}))
+    else:
+        calls.append((setattr, (buttonObject, "wasThemed", False), {}))
 
     ########################################################################
-    ## END
+    ## ICONIFY STYLESHEET
     ########################################################################
+    if "iconify" in button:
+        for icon in button['iconify']:
+            if "icon" in icon and len(icon['icon']) > 0:
+                btnIcon = icon['icon']
+                if "color" in icon and len(icon['color']) > 0:
+                    color = icon['color']
+                else:
+                    color = ""
 
-    if "QPushButton" in data:
-        for button in data['QPushButton']:
-            if "name" in button and len(button["name"]) > 0:
-                # GET BUTTON OBJECT
-                if hasattr(self.ui, str(button["name"])):
-                    buttonObject = getattr(self.ui, str(button["name"]))
-                    # VERIFY IF THE OBJECT IS A BUTTON
-                    if not str(buttonObject.metaObject().className()) == "QCustomQPushButton":
-                        raise Exception(buttonObject.metaObject().className(), buttonObject,
-                                        " is not of type QPushButton")
-                        return
+                if "size" in icon and int(icon['size']) > 0:
+                    size = icon['size']
+                else:
+                    size = ""
 
-                    buttonObject.wasFound = False
-                    buttonObject.wasThemed = False
+                if "animateOn" in icon and len(icon['animateOn']) > 0:
+                    animateOn = icon['animateOn']
+                else:
+                    animateOn = ""
 
-                    if buttonObject.objectName() == button["name"]:
-                        if "theme" in button and len(button["theme"]) > 0:
-                            buttonObject.setObjectTheme(button["theme"])
+                if "animation" in icon and len(icon['animation']) > 0:
+                    animation = icon['animation']
+                else:
+                    animation = ""
 
-                        if "customTheme" in button and len(button["customTheme"]) > 0:
-                            for x in button["customTheme"]:
-                                if len(x["color1"]) > 0 and len(x["color1"]) > 0:
-                                    buttonObject.setObjectCustomTheme(x["color1"], x["color2"])
+                calls.append((iconify, (buttonObject,), dict(icon=btnIcon, color=color, size=size,
+                                                              animation=animation, animateOn=animateOn)))
 
-                        if "animateOn" in button and len(button["animateOn"]) > 0:
-                            buttonObject.setObjectAnimateOn(button["animateOn"])
+    ########################################################################
+    ## BUTTON SHADOW STYLESHEET
+    ########################################################################
+    if "shadow" in button:
+        for shadow in button["shadow"]:
+            if "color" in shadow and len(str(shadow['color'])) > 0:
+                shadowColor = shadow['color']
+            else:
+                shadowColor = ""
 
-                        if "animation" in button and len(button["animation"]) > 0:
-                            buttonObject.setObjectAnimation(button["animation"])
+            if "applyShadowOn" in shadow and len(str(shadow['applyShadowOn'])) > 0:
+                applyShadowOn = shadow['applyShadowOn']
+            else:
+                applyShadowOn = ""
 
-                        if "animationDuration" in button and int(button['animationDuration']) > 0:
-                            buttonObject._animation.setDuration(int(button["animationDuration"]))
+            if "animateShadow" in shadow:
+                animateShadow = shadow['animateShadow']
+            else:
+                animateShadow = False
 
-                        if "animationEasingCurve" in button and len(button['animationEasingCurve']) > 0:
-                            easingCurve = returnAnimationEasingCurve(button['animationEasingCurve'])
-                            buttonObject._animation.setEasingCurve(easingCurve)
+            if "shadowRenderMode" in shadow and len(str(shadow['shadowRenderMode'])) > 0:
+                shadowRenderMode = shadow['shadowRenderMode']
+            else:
+                shadowRenderMode = ""
 
-                        fallBackStyle = ""
-                        if "fallBackStyle" in button:
-                            for x in button["fallBackStyle"]:
-                                fallBackStyle += x
+            if "animateShadowDuration" in shadow and int(shadow['animateShadowDuration']) > 0:
+                animateShadowDuration = shadow['animateShadowDuration']
+            else:
+                animateShadowDuration = 0
 
-                        defaultStyle = ""
-                        if "defaultStyle" in button:
-                            for x in button["defaultStyle"]:
-                                defaultStyle += x
+            if "blurRadius" in shadow and int(shadow['blurRadius']) > 0:
+                blurRadius = shadow['blurRadius']
+            else:
+                blurRadius = 0
 
-                        buttonObject.wasThemed = True
+            if "xOffset" in shadow and int(shadow['xOffset']) > 0:
+                xOffset = shadow['xOffset']
+            else:
+                xOffset = 0
 
-                        if len(fallBackStyle) > 0:
-                            buttonObject.setObjectFallBackStyle(fallBackStyle)
+            if "yOffset" in shadow and int(shadow['yOffset']) > 0:
+                yOffset = shadow['yOffset']
+            else:
+                yOffset = 0
 
-                        if len(defaultStyle) > 0:
-                            buttonObject.setObjectDefaultStyle(defaultStyle)
+            calls.append((applyButtonShadow, (buttonObject,), dict(
+                color=shadowColor,
+                applyShadowOn=applyShadowOn,
+                animateShadow=animateShadow,
+                blurRadius=blurRadius,
+                animateShadowDuration=animateShadowDuration,
+                shadowRenderMode=shadowRenderMode,
+                xOffset=xOffset,
+                yOffset=yOffset
+            )))
 
-                        if len(fallBackStyle) > 0:
-                            buttonObject.setStyleSheet(defaultStyle + fallBackStyle)
-                        elif "theme" in button and len(button["theme"]) > 0:
-                            #
-                            applyAnimationThemeStyle(buttonObject, button["theme"])
-                        elif "customTheme" in button and len(button["customTheme"]) > 0:
-                            for x in button["customTheme"]:
-                                if len(x["color1"]) > 0 and len(x["color1"]) > 0:
-                                    applyCustomAnimationThemeStyle(buttonObject, x["color1"], x["color2"])
-                        else:
-                            buttonObject.wasThemed = False
+    calls.append((setattr, (buttonObject, "wasFound", True), {}))
+    return calls
 
-                        ########################################################################
-                        ## ICONIFY STYLESHEET
-                        ########################################################################
-                        if "iconify" in button:
-                            for icon in button['iconify']:
-                                if "icon" in icon and len(icon['icon']) > 0:
-                                    btnIcon = icon['icon']
-                                    if "color" in icon and len(icon['color']) > 0:
-                                        color = icon['color']
-                                    else:
-                                        color = ""
-
-                                    if "size" in icon and int(icon['size']) > 0:
-                                        size = icon['size']
-                                    else:
-                                        size = ""
-
-                                    if "animateOn" in icon and len(icon['animateOn']) > 0:
-                                        animateOn = icon['animateOn']
-                                    else:
-                                        animateOn = ""
-
-                                    if "animation" in icon and len(icon['animation']) > 0:
-                                        animation = icon['animation']
-                                    else:
-                                        animation = ""
-
-                                    iconify(buttonObject, icon=btnIcon, color=color, size=size, animation=animation,
-                                            animateOn=animateOn)
 
-                        ########################################################################
-                        ## BUTTON SHADOW STYLESHEET
-                        ########################################################################
-                        if "shadow" in button:
-                            for shadow in button["shadow"]:
-                                if "color" in shadow and len(str(shadow['color'])) > 0:
-                                    shadowColor = shadow['color']
-                                else:
-                                    shadowColor = ""
+def applyQPushButtonSection(self, ui, sectionData):
+    for calls in sectionData:
+        applyCompiledCalls(calls)
 
-                                if "applyShadowOn" in shadow and len(str(shadow['applyShadowOn'])) > 0:
-                                    applyShadowOn = shadow['applyShadowOn']
-                                else:
-                                    applyShadowOn = ""
 
-                                if "animateShadow" in shadow:
-                                    animateShadow = shadow['animateShadow']
-                                else:
-                                    animateShadow = False
+########################################################################
+## QSTACKED WIDGET
+########################################################################
+def compileQStackedWidgetEntry(ui, stackedWidget):
+    # Unknown widgets and widgets named differently are skipped
+    if not hasattr(ui, str(stackedWidget["name"])):
+        return []
+
+    widget = getattr(ui, str(stackedWidget["name"]))
+    if not widget.objectName() == stackedWidget["name"]:
+        return []
+
+    calls = []
+    if "transitionAnimation" in stackedWidget:
+        for transitionAnimation in stackedWidget["transitionAnimation"]:
+            if "fade" in transitionAnimation:
+                for fade in transitionAnimation["fade"]:
+                    if "active" in fade and fade["active"]:
+                        calls.append((setattr, (widget, "fadeTransition", True), {}))
+                        if "duration" in fade and fade["duration"] > 0:
+                            calls.append((setattr, (widget, "fadeTime", fade["duration"]), {}))
+                        if "easingCurve" in fade and len(str(fade["easingCurve"])) > 0:
+                            calls.append((setattr, (widget, "fadeEasingCurve",
+                                                    returnAnimationEasingCurve(fade["easingCurve"])), {}))
+
+            if "slide" in transitionAnimation:
+                for slide in transitionAnimation["slide"]:
+                    if "active" in slide and slide["active"]:
+                        calls.append((setattr, (widget, "slideTransition", True), {}))
+                        if "duration" in slide and slide["duration"] > 0:
+                            calls.append((setattr, (widget, "transitionTime", slide["duration"]), {}))
+                        if "easingCurve" in slide and len(str(slide["easingCurve"])) > 0:
+                            calls.append((setattr, (widget, "transitionEasingCurve",
+                                                    returnAnimationEasingCurve(slide["easingCurve"])), {}))
+                        if "direction" in slide and len(str(slide["direction"])) > 0:
+                            calls.append((setattr, (widget, "transitionDirection",
+                                                    returnQtDirection(slide["direction"])), {}))
+                        if "mode" in slide and len(str(slide["mode"])) > 0:
+                            calls.append((widget.setSlideTransitionMode, (slide["mode"],), {}))
+
+    if "prewarmPages" in stackedWidget:
+        calls.append((widget.setPagePrewarm, (stackedWidget["prewarmPages"] == True,), {}))
+
+    if "navigation" in stackedWidget:
+        for navigation in stackedWidget["navigation"]:
+            if "nextPage" in navigation:
+                if not hasattr(ui, str(navigation["nextPage"])):
+                    raise Exception("Unknown button '" + str(navigation["nextPage"]) + "'. Please check your JSon file")
+                button = getattr(ui, str(navigation["nextPage"]))
+                calls.append((connectStyleSignal, (button.clicked, lambda: widget.slideToNextWidget()), {}))
+
+            if "previousPage" in navigation:
+                if not hasattr(ui, str(navigation["previousPage"])):
+                    raise Exception(
+                        "Unknown button '" + str(navigation["previousPage"]) + "'. Please check your JSon file")
+                button = getattr(ui, str(navigation["previousPage"]))
+                calls.append((connectStyleSignal, (button.clicked, lambda: widget.slideToPreviousWidget()), {}))
+
+            if "navigationButtons" in navigation:
+                for navigationButton in navigation["navigationButtons"]:
+                    for button in navigationButton:
+                        widgetPage = navigationButton[button]
+                        if hasattr(ui, str(widgetPage)):
+                            widgetPg = getattr(ui, str(widgetPage))
+                        else:
+                            # Pages registered with addLazyWidget() may not be built yet
+                            widgetPg = widget.lazyPage(widgetPage)
+                        if widgetPg is None:
+                            raise Exception("Unknown widget '" + str(
+                                widgetPage) + "'. Please check your JSon file")
+                        if not hasattr(ui, str(button)):
+                            raise Exception(
+                                "Unknown button '" + str(button) + "'. Please check your JSon file")
 
-                                if "animateShadowDuration" in shadow and int(shadow['animateShadowDuration']) > 0:
-                                    animateShadowDuration = shadow['animateShadowDuration']
-                                else:
-                                    animateShadowDuration = 0
+                        pushBtn = getattr(ui, str(button))
+                        calls.append((navigationButtons, (widget, pushBtn, widgetPg), {}))
 
-                                if "blurRadius" in shadow and int(shadow['blurRadius']) > 0:
-                                    blurRadius = shadow['blurRadius']
-                                else:
-                                    blurRadius = 0
+    return calls
 
-                                if "xOffset" in shadow and int(shadow['xOffset']) > 0:
-                                    xOffset = shadow['xOffset']
-                                else:
-                                    xOffset = 0
 
-                                if "yOffset" in shadow and int(shadow['yOffset']) > 0:
-                                    yOffset = shadow['yOffset']
-                                else:
-                                    yOffset = 0
-
-                                applyButtonShadow(
-                                    buttonObject,
-                                    color=shadowColor,
-                                    applyShadowOn=applyShadowOn,
-                                    animateShadow=animateShadow,
-                                    blurRadius=blurRadius,
-                                    animateShadowDuration=animateShadowDuration,
-                                    xOffset=xOffset,
-                                    yOffset=yOffset
-                                )
-
-                        buttonObject.wasFound = True
-
-    ########################################################################
-    ## Qstacked Widget
-    ########################################################################
-    if "QStackedWidget" in data:
-        for stackedWidget in data['QStackedWidget']:
-            if "name" in stackedWidget and len(str(stackedWidget["name"])) > 0:
-                if hasattr(self.ui, str(stackedWidget["name"])):
-                    widget = getattr(self.ui, str(stackedWidget["name"]))
-                    if widget.objectName() == stackedWidget["name"]:
-                        if "transitionAnimation" in stackedWidget:
-                            for transitionAnimation in stackedWidget["transitionAnimation"]:
-                                if "fade" in transitionAnimation:
-                                    for fade in transitionAnimation["fade"]:
-                                        if "active" in fade and fade["active"]:
-                                            widget.fadeTransition = True
-                                            if "duration" in fade and fade["duration"] > 0:
-                                                widget.fadeTime = fade["duration"]
-                                            if "easingCurve" in fade and len(str(fade["easingCurve"])) > 0:
-                                                widget.fadeEasingCurve = returnAnimationEasingCurve(fade["easingCurve"])
-
-                                if "slide" in transitionAnimation:
-                                    for slide in transitionAnimation["slide"]:
-                                        if "active" in slide and slide["active"]:
-                                            widget.slideTransition = True
-                                            if "duration" in slide and slide["duration"] > 0:
-                                                widget.transitionTime = slide["duration"]
-                                            if "easingCurve" in slide and len(str(slide["easingCurve"])) > 0:
-                                                widget.transitionEasingCurve = returnAnimationEasingCurve(
-                                                    slide["easingCurve"])
-                                            if "direction" in slide and len(str(slide["direction"])) > 0:
-                                                widget.transitionDirection = returnQtDirection(slide["direction"])
-
-                        if "navigation" in stackedWidget:
-                            for navigation in stackedWidget["navigation"]:
-                                if "nextPage" in navigation:
-                                    if hasattr(self.ui, str(navigation["nextPage"])):
-                                        button = getattr(self.ui, str(navigation["nextPage"]))
-                                        button.clicked.connect(lambda: widget.slideToNextWidget())
-                                    else:
-                                        raise Exception(
-                                            "Unknown button '" + str(button) + "'. Please check your JSon file")
-
-                                if "previousPage" in navigation:
-                                    if hasattr(self.ui, str(navigation["previousPage"])):
-                                        button = getattr(self.ui, str(navigation["previousPage"]))
-                                        button.clicked.connect(lambda: widget.slideToPreviousWidget())
-                                    else:
-                                        raise Exception(
-                                            "Unknown button '" + str(button) + "'. Please check your JSon file")
-
-                                if "navigationButtons" in navigation:
-                                    for navigationButton in navigation["navigationButtons"]:
-                                        for button in navigationButton:
-                                            widgetPage = navigationButton[button]
-                                            if not hasattr(self.ui, str(widgetPage)):
-                                                raise Exception("Unknown widget '" + str(
-                                                    widgetPage) + "'. Please check your JSon file")
-                                            if not hasattr(self.ui, str(button)):
-                                                raise Exception(
-                                                    "Unknown button '" + str(button) + "'. Please check your JSon file")
-
-                                            pushBtn = getattr(self.ui, str(button))
-                                            widgetPg = getattr(self.ui, str(widgetPage))
-                                            navigationButtons(widget, pushBtn, widgetPg)
-    ########################################################################
-    ## QSETTINGS
-    ########################################################################
-    if "QSettings" in data:
-        for settings in data['QSettings']:
-            if "AppSettings" in settings:
-                appSettings = settings['AppSettings']
-                if "OrganizationName" in appSettings and len(str(appSettings["OrganizationName"])) > 0:
-                    self.organizationName = str(appSettings["OrganizationName"])
-                else:
-                    self.organizationName = ""
+def applyQStackedWidgetSection(self, ui, sectionData):
+    for calls in sectionData:
+        applyCompiledCalls(calls)
 
-                if "ApplicationName" in settings['AppSettings'] and len(str(appSettings["ApplicationName"])) > 0:
-                    self.applicationName = str(appSettings["ApplicationName"])
 
-                else:
-                    self.applicationName = ""
+########################################################################
+## QSETTINGS
+########################################################################
+def applyQSettingsSection(self, ui, sectionData):
+    # Themes are created once, reloading the stylesheet updates them
+    if not hasattr(self.ui, "themes"):
+        setattr(self.ui, "themes", [])
+    themes = getattr(self.ui, "themes")
+
+    for settings in sectionData:
+        if "AppSettings" in settings:
+            appSettings = settings['AppSettings']
+            if "OrganizationName" in appSettings and len(str(appSettings["OrganizationName"])) > 0:
+                self.organizationName = str(appSettings["OrganizationName"])
+            else:
+                self.organizationName = ""
 
-                if "OrganizationDomain" in settings['AppSettings'] and len(
-                        str(appSettings["OrganizationDomain"])) > 0:
-                    self.organizationDomain = str(appSettings["OrganizationDomain"]).replace(" ", "")
-                else:
-                    self.organizationDomain = ""
+            if "ApplicationName" in settings['AppSettings'] and len(str(appSettings["ApplicationName"])) > 0:
+                self.applicationName = str(appSettings["ApplicationName"])
 
-            if "ThemeSettings" in settings:
-                for themeSettings in settings['ThemeSettings']:
-                    if "CustomTheme" in themeSettings:
-                        # Create themes
-                        if not hasattr(self.ui, "themes"):
-                            setattr(self.ui, "themes", [])
-                            themes = getattr(self.ui, "themes")
+            else:
+                self.applicationName = ""
 
-                        for customTheme in themeSettings['CustomTheme']:
-                            if "Theme-name" in customTheme and len(str(customTheme['Theme-name'])) > 0:
-                                if not hasattr(self.ui, str(customTheme['Theme-name'])):
-                                    setattr(self.ui, str(customTheme['Theme-name']), Object())
+            if "OrganizationDomain" in settings['AppSettings'] and len(
+                    str(appSettings["OrganizationDomain"])) > 0:
+                self.organizationDomain = str(appSettings["OrganizationDomain"]).replace(" ", "")
+            else:
+                self.organizationDomain = ""
 
-                                    theme = getattr(self.ui, str(customTheme["Theme-name"]))
-                                    theme.name = str(customTheme["Theme-name"])
+        if "ThemeSettings" in settings:
+            for themeSettings in settings['ThemeSettings']:
+                if "CustomTheme" in themeSettings:
+                    # Create themes
+                    for customTheme in themeSettings['CustomTheme']:
+                        if "Theme-name" in customTheme and len(str(customTheme['Theme-name'])) > 0:
+                            if not hasattr(self.ui, str(customTheme['Theme-name'])):
+                                setattr(self.ui, str(customTheme['Theme-name']), Object())
 
-                                if "Background-color" in customTheme and len(str(customTheme['Background-color'])) > 0:
-                                    # theme.backgroundColor = str(customTheme['Background-color'])
-                                    setattr(theme, "backgroundColor", str(customTheme['Background-color']))
+                            theme = getattr(self.ui, str(customTheme["Theme-name"]))
+                            theme.name = str(customTheme["Theme-name"])
 
-                                else:
-                                    theme.backgroundColor = ""
+                            if "Background-color" in customTheme and len(str(customTheme['Background-color'])) > 0:
+                                # theme.backgroundColor = str(customTheme['Background-color'])
+                                setattr(theme, "backgroundColor", str(customTheme['Background-color']))
 
-                                if "Text-color" in customTheme and len(str(customTheme['Text-color'])) > 0:
-                                    theme.textColor = str(customTheme['Text-color'])
+                            else:
+                                theme.backgroundColor = ""
 
-                                else:
-                                    theme.textColor = ""
+                            if "Text-color" in customTheme and len(str(customTheme['Text-color'])) > 0:
+                                theme.textColor = str(customTheme['Text-color'])
 
-                                if "Accent-color" in customTheme and len(str(customTheme['Accent-color'])) > 0:
-                                    theme.accentColor = str(customTheme['Accent-color'])
+                            else:
+                                theme.textColor = ""
 
-                                else:
-                                    theme.accentColor = ""
+                            if "Accent-color" in customTheme and len(str(customTheme['Accent-color'])) > 0:
+                                theme.accentColor = str(customTheme['Accent-color'])
 
-                                if "Icons-color" in customTheme and len(str(customTheme['Icons-color'])) > 0:
-                                    theme.iconsColor = str(customTheme['Icons-color'])
+                            else:
+                                theme.accentColor = ""
 
-                                else:
-                                    theme.iconsColor = ""
+                            if "Icons-color" in customTheme and len(str(customTheme['Icons-color'])) > 0:
+                                theme.iconsColor = str(customTheme['Icons-color'])
 
-                                if "Default-Theme" in customTheme and bool(customTheme['Default-Theme']) == True:
-                                    # THEME = settings.value("THEME")
-                                    setngs = QSettings()
-                                    if setngs.contains("THEME") and setngs.contains("THEME") is not None:
-                                        theme.defaultTheme = False
-                                    else:
-                                        theme.defaultTheme = True
+                            else:
+                                theme.iconsColor = ""
 
-                                else:
+                            if "Default-Theme" in customTheme and bool(customTheme['Default-Theme']) == True:
+                                # THEME = settings.value("THEME")
+                                setngs = QSettings()
+                                if setngs.contains("THEME") and setngs.contains("THEME") is not None:
                                     theme.defaultTheme = False
-
-                                if "Create-icons" in customTheme and bool(customTheme['Create-icons']) == False:
-                                    theme.createNewIcons = False
                                 else:
-                                    theme.createNewIcons = True
+                                    theme.defaultTheme = True
+
+                            else:
+                                theme.defaultTheme = False
 
+                            if "Create-icons" in customTheme and bool(customTheme['Create-icons']) == False:
+                                theme.createNewIcons = False
+                            else:
+                                theme.createNewIcons = True
+
+                            if theme not in themes:
                                 themes.append(theme)
 
-        if not hasattr(self.ui, "DARK"):
-            setattr(self.ui, "DARK", Object())
-            darkTheme = getattr(self.ui, "DARK")
-            darkTheme.name = "DARK"
-            darkTheme.defaultTheme = False
-            darkTheme.createNewIcons = True
-            themes.append(darkTheme)
-        if not hasattr(self.ui, "LIGHT"):
-            setattr(self.ui, "LIGHT", Object())
-            lightTheme = getattr(self.ui, "LIGHT")
-            lightTheme.name = "LIGHT"
-            lightTheme.defaultTheme = False
-            lightTheme.createNewIcons = True
-            themes.append(lightTheme)
+    if not hasattr(self.ui, "DARK"):
+        setattr(self.ui, "DARK", Object())
+        darkTheme = getattr(self.ui, "DARK")
+        darkTheme.name = "DARK"
+        darkTheme.defaultTheme = False
+        darkTheme.createNewIcons = True
+        themes.append(darkTheme)
+    if not hasattr(self.ui, "LIGHT"):
+        setattr(self.ui, "LIGHT", Object())
+        lightTheme = getattr(self.ui, "LIGHT")
+        lightTheme.name = "LIGHT"
+        lightTheme.defaultTheme = False
+        lightTheme.createNewIcons = True
+        themes.append(lightTheme)
 
-        # QAppSettings.updateAppSettings(self)
+    # QAppSettings.updateAppSettings(self)
+
+
+########################################################################
+## REGISTER THE BUILT-IN JSON SECTIONS
+########################################################################
+registerStyleSection("ShowLogs", applyShowLogsSection)
+registerStyleSection("QCard", applyQCardSection, compiler=compileQCardSection)
+registerStyleSection("QPushButtonGroup", applyQPushButtonGroupSection, compiler=compileQPushButtonGroupSection)
+registerStyleSection("AnalogGaugeWidget", applyAnalogGaugeWidgetSection, widgetSection=True, deferrable=True,
+                     compiler=compileAnalogGaugeWidgetEntry)
+# Slide menus are not deferred, their entries also reparent floating menus,
+# connect toggle buttons and fill accordion groups outside the menu itself
+registerStyleSection("QCustomSlideMenu", applyQCustomSlideMenuSection, widgetSection=True,
+                     compiler=compileQCustomSlideMenuEntry)
+registerStyleSection("QMainWindow", applyQMainWindowSection, singleEntry=True)
+registerStyleSection("QPushButton", applyQPushButtonSection, widgetSection=True, deferrable=True,
+                     compiler=compileQPushButtonEntry)
+registerStyleSection("QStackedWidget", applyQStackedWidgetSection, widgetSection=True,
+                     compiler=compileQStackedWidgetEntry)
+registerStyleSection("QSettings", applyQSettingsSection, singleEntry=True)
 
 
 ########################################################################
@@ -2581,7 +4464,9 @@ class Object(object):
 ##
 ########################################################################
 def navigationButtons(stackedWidget, pushButton, widgetPage):
-    pushButton.clicked.connect(lambda: stackedWidget.setCurrentWidget(widgetPage))
+    connectStyleSignal(pushButton.clicked, lambda: stackedWidget.setCurrentWidget(widgetPage))
+    if hasattr(stackedWidget, "addNavigationTarget"):
+        stackedWidget.addNavigationTarget(widgetPage)
 
 
 ########################################################################
@@ -2698,6 +4583,21 @@ def returnQtDirection(direction):
         raise Exception("Empty direction name given, please use Vertical or Horizontal direction")
 
 
+########################################################################
+##
+########################################################################
+
+########################################################################
+## RETURN THE LAST PIXEL LENGTH GIVEN TO A STYLESHEET PROPERTY
+########################################################################
+def returnStyleLength(style, styleProperty):
+    lengths = re.findall(r"(?<![\w-])" + re.escape(styleProperty) + r"\s*:\s*[^;{}]*?(\d+(?:\.\d+)?)px", str(style))
+    if len(lengths) > 0:
+        return float(lengths[-1])
+
+    return None
+
+
 ########################################################################
 ## END
 ########################################################################
@@ -0,0 +1,101 @@
+########################################################################
+## QCustomQPushButton CONSTRUCTION BENCHMARK
+## Construction time and memory of 1,000 animated buttons.
+## "custom" builds QCustomQPushButton (animations created lazily on the
+## shared clock), "eager" builds QPushButtons that each own two
+## QVariantAnimations like the buttons did before the shared clock.
+##
+## Run from the project root:
+##     python benchmarks/button_construction.py [count]
+########################################################################
+
+########################################################################
+## IMPORTS
+########################################################################
+import os
+import sys
+import time
+import subprocess
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("ICONIFY_QTLIB", "PySide6")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+########################################################################
+## RESIDENT MEMORY IN KB
+########################################################################
+def returnRss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        # Peak RSS where /proc is not available
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def createCustomButtons(parent, count):
+    from Custom_Widgets.Widgets import QCustomQPushButton
+
+    buttons = []
+    for i in range(count):
+        button = QCustomQPushButton(parent)
+        button.setObjectTheme(1)
+        buttons.append(button)
+    return buttons
+
+
+def createEagerButtons(parent, count):
+    from PySide6 import QtCore, QtWidgets
+
+    buttons = []
+    for i in range(count):
+        button = QtWidgets.QPushButton(parent)
+        button._animation = QtCore.QVariantAnimation(button, startValue=0.00001, endValue=0.9999, duration=500)
+        button._animation.valueChanged.connect(button.update)
+        button._shadowAnimation = QtCore.QVariantAnimation(button, startValue=0, endValue=10, duration=500)
+        button._shadowAnimation.valueChanged.connect(button.update)
+        buttons.append(button)
+    return buttons
+
+
+########################################################################
+## MEASURE ONE VARIANT (RUNS IN ITS OWN PROCESS)
+########################################################################
+def measure(variant, count):
+    from PySide6 import QtWidgets
+
+    app = QtWidgets.QApplication([])
+    # Import before measuring so only the buttons are counted
+    import Custom_Widgets.Widgets
+    parent = QtWidgets.QWidget()
+
+    rss = returnRss()
+    start = time.perf_counter()
+    if variant == "custom":
+        buttons = createCustomButtons(parent, count)
+    else:
+        buttons = createEagerButtons(parent, count)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(variant, round(elapsed, 1), returnRss() - rss)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print("%d buttons" % count)
+    print("%-8s %12s %12s" % ("variant", "time (ms)", "RSS (KB)"))
+    for variant in ("custom", "eager"):
+        output = subprocess.check_output([sys.executable, __file__, "--measure", variant, str(count)], text=True)
+        name, elapsed, rss = output.split()[-3:]
+        print("%-8s %12s %12s" % (name, elapsed, rss))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--measure":
+        measure(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,78 @@
+########################################################################
+## COLOR ENGINE IMPORT BENCHMARK
+## Import time and memory of matplotlib.colors, which the theme engine
+## used to depend on, against the built-in Custom_Widgets color engine.
+## Every import runs in a fresh interpreter, best of several runs.
+##
+## Run from the project root:
+##     python benchmarks/color_engine_import.py [runs]
+## matplotlib is optional, it is skipped when it is not installed.
+########################################################################
+
+########################################################################
+## IMPORTS
+########################################################################
+import os
+import sys
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Load the color engine module on its own, the Custom_Widgets package
+# imports the whole widget library
+MODULES = {
+    "matplotlib.colors": "import matplotlib.colors as colors",
+    "colorengine": "import importlib.util\n"
+                   "spec = importlib.util.spec_from_file_location('colorengine', "
+                   + repr(os.path.join(ROOT, "Custom_Widgets", "Qss", "colorengine.py")) + ")\n"
+                   "colors = importlib.util.module_from_spec(spec)\n"
+                   "spec.loader.exec_module(colors)"
+}
+
+MEASURE = """
+import os, sys, time
+def returnRss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss // 1024 if sys.platform == "darwin" else rss
+rss = returnRss()
+start = time.perf_counter()
+{statement}
+elapsed = (time.perf_counter() - start) * 1000
+colors.to_hex("steelblue")
+print(round(elapsed, 2), returnRss() - rss)
+"""
+
+
+def measure(module, runs):
+    times = []
+    memory = []
+    for run in range(runs):
+        result = subprocess.run([sys.executable, "-c", MEASURE.format(statement=MODULES[module])],
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        elapsed, rss = result.stdout.split()
+        times.append(float(elapsed))
+        memory.append(int(rss))
+    return min(times), min(memory)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print("%-20s %12s %12s" % ("module", "import (ms)", "RSS (KB)"))
+    for module in MODULES:
+        result = measure(module, runs)
+        if result is None:
+            print("%-20s %12s" % (module, "not installed"))
+        else:
+            print("%-20s %12s %12s" % (module, result[0], result[1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+########################################################################
+## SHARED TEST FIXTURES
+## Tests run offscreen, from the project root:
+##     python -m pytest tests
+########################################################################
+import gc
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("ICONIFY_QTLIB", "PySide6")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+from PySide6 import QtWidgets
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
+
+
+@pytest.fixture(autouse=True)
+def collectWindows():
+    # Windows of a test live in reference cycles (widgets, style plans).
+    # Collect them between tests, a collection in the middle of a Qt call
+    # of a later test would delete widgets that are still being used.
+    yield
+    gc.collect()
+    QtWidgets.QApplication.processEvents()
@@ -0,0 +1,53 @@
+########################################################################
+## ANIMATION CONNECTIONS
+## Hover and toggle handlers must reuse the connections made when the
+## animations are created instead of adding one per event
+########################################################################
+from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6.QtCore import SIGNAL
+
+from Custom_Widgets.Widgets import QCustomQPushButton, QCustomSlideMenu, applyButtonShadow
+
+CYCLES = 10000
+
+
+def hover(button):
+    position = QtCore.QPointF(5, 5)
+    button.enterEvent(QtGui.QEnterEvent(position, position, position))
+    button.leaveEvent(QtCore.QEvent(QtCore.QEvent.Leave))
+
+
+def test_button_receivers_constant_over_hover_cycles(qapp):
+    button = QCustomQPushButton()
+    button.setObjectTheme(1)
+    applyButtonShadow(button, applyShadowOn="hover", animateShadow=True, color="#000", blurRadius=10)
+
+    hover(button)
+    receivers = [button._animation.valueChanged.receivers(), button._animation.finished.receivers(),
+                 button._shadowAnimation.valueChanged.receivers(), button._shadowAnimation.finished.receivers()]
+
+    for i in range(CYCLES):
+        hover(button)
+
+    assert [button._animation.valueChanged.receivers(), button._animation.finished.receivers(),
+            button._shadowAnimation.valueChanged.receivers(),
+            button._shadowAnimation.finished.receivers()] == receivers
+    assert receivers == [1, 1, 1, 1]
+
+
+def test_slide_menu_receivers_constant_over_toggle_cycles(qapp):
+    parent = QtWidgets.QWidget()
+    parent.resize(400, 300)
+    menu = QCustomSlideMenu(parent)
+    menu.customizeQCustomSlideMenu(defaultWidth=200, collapsedWidth=0, expandedWidth=200, animationDuration=10)
+
+    menu.slideMenu()
+    receivers = [menu._sizeAnimation.receivers(SIGNAL("valueChanged(QVariant)")),
+                 menu._menuAnimationGroup.receivers(SIGNAL("finished()"))]
+
+    for i in range(CYCLES):
+        menu.slideMenu()
+
+    assert [menu._sizeAnimation.receivers(SIGNAL("valueChanged(QVariant)")),
+            menu._menuAnimationGroup.receivers(SIGNAL("finished()"))] == receivers
+    assert receivers == [1, 1]
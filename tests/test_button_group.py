@@ -0,0 +1,57 @@
+########################################################################
+## QPUSHBUTTON GROUP PROPERTY MODE
+## Plain declarations are compiled into a "groupActive" selector, styles
+## with their own selectors fall back to per button stylesheets
+########################################################################
+import json
+
+from PySide6 import QtWidgets
+
+from Custom_Widgets.Widgets import QMainWindow, loadJsonStyle
+
+
+class Ui():
+    pass
+
+
+def createWindow(tmp_path, activeStyle, notActiveStyle):
+    window = QMainWindow()
+    window.ui = Ui()
+    for index in range(3):
+        button = QtWidgets.QPushButton(window)
+        setattr(window.ui, "button_" + str(index), button)
+
+    jsonFile = tmp_path / "style.json"
+    jsonFile.write_text(json.dumps({"ShowLogs": False, "QPushButtonGroup": [{
+        "Buttons": ["button_0", "button_1", "button_2"],
+        "Style": [{"Active": activeStyle, "NotActive": notActiveStyle}],
+        "PropertyMode": True}]}))
+    loadJsonStyle(window, window.ui, jsonFiles=[str(jsonFile)])
+
+    return window
+
+
+def test_declarations_use_property_mode(qapp, tmp_path):
+    window = createWindow(tmp_path, "color: red;", "color: blue;")
+
+    assert window.group_property_mode_1
+    window.ui.button_1.click()
+
+    assert window.ui.button_1.property("groupActive") is True
+    assert window.ui.button_0.property("groupActive") is False
+    assert window.ui.button_0.styleSheet() == window.ui.button_1.styleSheet()
+
+
+def test_selector_styles_fall_back(qapp, tmp_path):
+    activeStyle = "QPushButton{color: red;} QPushButton:hover{color: white;}"
+    notActiveStyle = "QPushButton{color: blue;}"
+    window = createWindow(tmp_path, activeStyle, notActiveStyle)
+
+    assert not window.group_property_mode_1
+    assert window.ui.button_0.styleSheet() == activeStyle
+    assert window.ui.button_1.styleSheet() == notActiveStyle
+
+    window.ui.button_1.click()
+
+    assert window.ui.button_1.styleSheet() == activeStyle
+    assert window.ui.button_0.styleSheet() == notActiveStyle
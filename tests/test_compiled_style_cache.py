@@ -0,0 +1,34 @@
+########################################################################
+## COMPILED STYLESHEET CACHE
+## The key follows the generated _variables.scss text and the cache
+## folder only keeps the most recently used stylesheets.
+########################################################################
+import os
+
+from Custom_Widgets.Qss import SassCompiler
+
+
+def test_key_follows_variables_text(tmp_path):
+    mainScss = tmp_path / "main.scss"
+    mainScss.write_text("@import 'variables';\nQWidget{border: $BORDER_1;}\n")
+    (tmp_path / "_variables.scss").write_text("$BORDER_1: 1px solid red;\n")
+
+    variables = "$COLOR_BACKGROUND_1: #000000;\n$BORDER_1: 1px solid $COLOR_BACKGROUND_1;\n"
+    key = SassCompiler.returnCompiledStyleKey(variables, str(mainScss))
+
+    assert SassCompiler.returnCompiledStyleKey(variables, str(mainScss)) == key
+    # Fixed template lines are part of the key, not only the palette
+    changed = variables.replace("1px", "2px")
+    assert SassCompiler.returnCompiledStyleKey(changed, str(mainScss)) != key
+
+
+def test_prune_keeps_most_recent(tmp_path):
+    for i in range(10):
+        cssFile = tmp_path / ("style%d.css" % i)
+        cssFile.write_text("QWidget{}")
+        os.utime(cssFile, (1000 + i, 1000 + i))
+    (tmp_path / "notes.txt").write_text("")
+
+    SassCompiler.pruneCompiledStyles(str(tmp_path), keep=3)
+
+    assert sorted(os.listdir(tmp_path)) == ["notes.txt", "style7.css", "style8.css", "style9.css"]
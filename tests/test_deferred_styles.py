@@ -0,0 +1,88 @@
+########################################################################
+## DEFERRED STYLES
+## Widgets on hidden QStackedWidget pages are styled when the page is
+## shown, or before the page is rendered for a transition snapshot
+########################################################################
+import json
+
+from PySide6 import QtWidgets
+
+from Custom_Widgets.Widgets import QMainWindow, QCustomQPushButton, QCustomSlideMenu, QCustomStackedWidget, loadJsonStyle
+
+
+class Ui():
+    pass
+
+
+def createWindow(tmp_path):
+    window = QMainWindow()
+    window.ui = Ui()
+
+    stackedWidget = QCustomStackedWidget(window)
+    window.setCentralWidget(stackedWidget)
+    for index in range(2):
+        page = QtWidgets.QWidget()
+        button = QCustomQPushButton(page)
+        button.setObjectName("button_" + str(index))
+        setattr(window.ui, button.objectName(), button)
+        stackedWidget.addWidget(page)
+    stackedWidget.setCurrentIndex(0)
+    window.resize(400, 300)
+    window.show()
+
+    jsonFile = tmp_path / "style.json"
+    jsonFile.write_text(json.dumps({"ShowLogs": False, "QPushButton": [
+        {"name": "button_0", "theme": "1"}, {"name": "button_1", "theme": "2"}]}))
+    loadJsonStyle(window, window.ui, jsonFiles=[str(jsonFile)], deferHiddenWidgets=True)
+
+    return window, stackedWidget
+
+
+def test_hidden_page_is_styled_before_its_snapshot(qapp, tmp_path):
+    window, stackedWidget = createWindow(tmp_path)
+
+    assert window.ui.button_0.color1 is not None
+    assert window.ui.button_1.color1 is None
+    assert window.deferredStyleLoader.pendingCount() == 1
+
+    stackedWidget.pageSnapshot(stackedWidget.widget(1))
+
+    assert window.ui.button_1.color1 is not None
+    assert window.deferredStyleLoader.pendingCount() == 0
+
+
+def test_prewarmed_page_is_styled(qapp, tmp_path):
+    window, stackedWidget = createWindow(tmp_path)
+
+    assert stackedWidget.prewarmPage(stackedWidget.widget(1))
+
+    assert window.ui.button_1.color1 is not None
+    assert window.deferredStyleLoader.pendingCount() == 0
+
+
+def test_slide_menu_on_hidden_page_is_applied_right_away(qapp, tmp_path):
+    window = QMainWindow()
+    window.ui = Ui()
+    centralWidget = QtWidgets.QWidget(window)
+    window.setCentralWidget(centralWidget)
+    window.ui.menuButton = QtWidgets.QPushButton(centralWidget)
+    stackedWidget = QCustomStackedWidget(centralWidget)
+    stackedWidget.addWidget(QtWidgets.QWidget())
+    page = QtWidgets.QWidget()
+    window.ui.menu = QCustomSlideMenu(page)
+    stackedWidget.addWidget(page)
+    stackedWidget.setCurrentIndex(0)
+    window.resize(400, 300)
+    window.show()
+
+    jsonFile = tmp_path / "style.json"
+    jsonFile.write_text(json.dumps({"ShowLogs": False, "QCustomSlideMenu": [
+        {"name": "menu", "expandedSize": [{"width": 200, "height": 100}],
+         "toggleButton": [{"buttonName": "menuButton"}]}]}))
+    loadJsonStyle(window, window.ui, jsonFiles=[str(jsonFile)], deferHiddenWidgets=True)
+
+    # The toggle button sits outside the hidden page, it works before the page is shown
+    assert not hasattr(window, "deferredStyleLoader") or window.deferredStyleLoader.pendingCount() == 0
+    assert window.ui.menu.targetBtn is window.ui.menuButton
+    assert window.ui.menuButton.targetMenu is window.ui.menu
+    assert window.ui.menu.expandedWidth == 200
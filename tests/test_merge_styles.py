@@ -0,0 +1,82 @@
+########################################################################
+## MERGED JSON STYLESHEETS
+## Later files override earlier ones and every applied value remembers
+## the file it came from
+########################################################################
+import json
+
+from Custom_Widgets.StylePlan import mergeJsonStyles
+from Custom_Widgets.Widgets import QMainWindow, loadJsonStyle, printStyleProvenance
+
+
+class Ui():
+    pass
+
+
+def test_later_files_override_single_entry_sections(qapp):
+    data, provenance = mergeJsonStyles([
+        ("base.json", {"QMainWindow": [{"title": "Base", "frameless": True}, {"icon": "base.png"}],
+                       "QSettings": [{"ThemeSettings": [{"Name": "Base"}], "AppSettings": {"Version": "1"}}]}),
+        ("app.json", {"QMainWindow": [{"title": "App"}],
+                      "QSettings": [{"ThemeSettings": [{"Name": "App"}], "AppSettings": {"Name": "App"}}]})
+    ])
+
+    # All the entries of a single entry section are merged into one
+    assert data["QMainWindow"] == [{"title": "App", "frameless": True, "icon": "base.png"}]
+    assert data["QSettings"] == [{"ThemeSettings": [{"Name": "App"}], "AppSettings": {"Version": "1", "Name": "App"}}]
+
+    assert provenance["QMainWindow[0].title"] == "app.json"
+    assert provenance["QMainWindow[0].frameless"] == "base.json"
+    assert provenance["QMainWindow[0].icon"] == "base.json"
+    assert provenance["QSettings[0].ThemeSettings"] == "app.json"
+    assert provenance["QSettings[0].AppSettings.Version"] == "base.json"
+    assert provenance["QSettings[0].AppSettings.Name"] == "app.json"
+
+
+def test_list_sections_are_concatenated(qapp):
+    data, provenance = mergeJsonStyles([
+        ("base.json", {"QPushButtonGroup": [{"Buttons": ["button_0", "button_1"]}]}),
+        ("app.json", {"QPushButtonGroup": [{"Buttons": ["button_2"]}, {"Buttons": ["button_3"]}]})
+    ])
+
+    assert data["QPushButtonGroup"] == [{"Buttons": ["button_0", "button_1"]}, {"Buttons": ["button_2"]},
+                                        {"Buttons": ["button_3"]}]
+    assert provenance["QPushButtonGroup[0].Buttons"] == "base.json"
+    assert provenance["QPushButtonGroup[1].Buttons"] == "app.json"
+    assert provenance["QPushButtonGroup[2].Buttons"] == "app.json"
+
+
+def test_named_entries_are_merged_key_by_key(qapp):
+    data, provenance = mergeJsonStyles([
+        ("base.json", {"QPushButton": [{"name": "button", "theme": "1", "shadow": [{"color": "#000"}]},
+                                       {"name": "other", "theme": "2"}]}),
+        ("app.json", {"QPushButton": [{"name": "button", "theme": "3", "shadow": [{"blurRadius": 4}]},
+                                      {"name": "new", "theme": "4"}]})
+    ])
+
+    # Values and unnamed lists inside an entry are replaced
+    assert data["QPushButton"] == [{"name": "button", "theme": "3", "shadow": [{"blurRadius": 4}]},
+                                   {"name": "other", "theme": "2"}, {"name": "new", "theme": "4"}]
+    assert provenance["QPushButton[button].name"] == "app.json"
+    assert provenance["QPushButton[button].theme"] == "app.json"
+    assert provenance["QPushButton[button].shadow"] == "app.json"
+    assert provenance["QPushButton[other].theme"] == "base.json"
+    assert provenance["QPushButton[new].theme"] == "app.json"
+
+
+def test_loaded_window_records_the_source_file_of_every_value(qapp, tmp_path, capsys):
+    baseFile = tmp_path / "base.json"
+    baseFile.write_text(json.dumps({"ShowLogs": False, "QMainWindow": [{"title": "Base"}]}))
+    appFile = tmp_path / "app.json"
+    appFile.write_text(json.dumps({"QMainWindow": [{"title": "App"}]}))
+
+    window = QMainWindow()
+    window.ui = Ui()
+    loadJsonStyle(window, window.ui, jsonFiles=[str(baseFile), str(appFile)])
+
+    assert window.windowTitle() == "App"
+    assert window.styleProvenance["ShowLogs"] == str(baseFile)
+    assert window.styleProvenance["QMainWindow[0].title"] == str(appFile)
+
+    printStyleProvenance(window)
+    assert "QMainWindow[0].title : " + str(appFile) in capsys.readouterr().out.splitlines()
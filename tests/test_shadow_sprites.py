@@ -0,0 +1,35 @@
+########################################################################
+## SHADOW SPRITES
+## Buttons without a parent have no sibling to draw the sprite on and
+## fall back to the shadow effect
+########################################################################
+from PySide6 import QtWidgets
+
+from Custom_Widgets.Widgets import QCustomQPushButton, applyButtonShadow
+
+
+def createButton(parent=None):
+    button = QCustomQPushButton(parent)
+    applyButtonShadow(button, applyShadowOn="hover", animateShadow=True, color="#000", blurRadius=10,
+                      shadowRenderMode="sprite")
+    return button
+
+
+def test_parentless_sprite_button_falls_back_to_effect(qapp):
+    button = createButton()
+
+    assert button.shadowSprite() is None
+    button._animateShadow(5)
+    button.removeButtonShadow()
+
+    assert button.graphicsEffect() is button.shadow
+
+
+def test_sprite_button_uses_sprite(qapp):
+    parent = QtWidgets.QWidget()
+    button = createButton(parent)
+
+    button.removeButtonShadow()
+
+    assert button.shadowSprite() is not None
+    assert button.graphicsEffect() is None
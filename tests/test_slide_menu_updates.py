@@ -0,0 +1,118 @@
+########################################################################
+## QCustomSlideMenu LAYOUT REQUESTS AND PAINTS
+## Geometry is synced from parent events, an idle menu must not keep
+## requesting layouts or repainting, and an animation must cost about one
+## layout request and one paint per frame or parent resize
+########################################################################
+import time
+
+from PySide6 import QtCore, QtWidgets
+
+from Custom_Widgets.Widgets import QCustomSlideMenu
+
+
+class EventCounter(QtCore.QObject):
+    def __init__(self, *widgets):
+        super().__init__()
+        self.counts = {QtCore.QEvent.LayoutRequest: 0, QtCore.QEvent.Paint: 0}
+        for widget in widgets:
+            widget.installEventFilter(self)
+
+    def reset(self):
+        for eventType in self.counts:
+            self.counts[eventType] = 0
+
+    def layoutRequests(self):
+        return self.counts[QtCore.QEvent.LayoutRequest]
+
+    def paints(self):
+        return self.counts[QtCore.QEvent.Paint]
+
+    def eventFilter(self, obj, event):
+        if event.type() in self.counts:
+            self.counts[event.type()] += 1
+        return False
+
+
+def processEvents(app, seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        app.processEvents()
+
+
+def createWindow():
+    window = QtWidgets.QWidget()
+    window.resize(600, 400)
+    layout = QtWidgets.QHBoxLayout(window)
+    # A "parent" height is the full parent height, the layout must not add margins
+    layout.setContentsMargins(0, 0, 0, 0)
+
+    menu = QCustomSlideMenu(window)
+    menu.setStyleSheet("background-color: #123;")
+    QtWidgets.QVBoxLayout(menu).addWidget(QtWidgets.QLabel("Menu"))
+    menu.customizeQCustomSlideMenu(defaultWidth=200, defaultHeight="parent", collapsedWidth=0,
+                                   expandedWidth=200, expandedHeight="parent", animationDuration=300)
+    layout.addWidget(menu)
+    layout.addWidget(QtWidgets.QLabel("Content"))
+
+    window.show()
+    return window, menu
+
+
+def test_idle_menu_does_not_request_layouts_or_paint(qapp):
+    window, menu = createWindow()
+    processEvents(qapp, 0.3)
+
+    counter = EventCounter(window, menu)
+    processEvents(qapp, 1.0)
+
+    assert counter.layoutRequests() == 0
+    assert counter.paints() == 0
+
+
+def test_animation_costs_about_one_layout_and_paint_per_frame(qapp):
+    window, menu = createWindow()
+    processEvents(qapp, 0.3)
+
+    frames = []
+    menu._createMenuAnimations()
+    menu._sizeAnimation.valueChanged.connect(frames.append)
+    counter = EventCounter(window, menu)
+
+    menu.slideMenu()
+    end = time.monotonic() + 2
+    while menu._menuAnimationState != "idle" and time.monotonic() < end:
+        qapp.processEvents()
+    processEvents(qapp, 0.2)
+
+    assert menu._menuAnimationState == "idle"
+    assert menu.width() == 0
+    assert len(frames) > 0
+    # One layout request of the window and one of the menu per frame at most
+    assert counter.layoutRequests() <= 2 * len(frames) + 4
+    assert counter.paints() <= 2 * len(frames) + 4
+
+
+def test_parent_resize_costs_about_one_layout_and_paint_per_resize(qapp):
+    window, menu = createWindow()
+    processEvents(qapp, 0.3)
+    assert menu.width() == 200
+
+    counter = EventCounter(window, menu)
+    resizes = 20
+    for i in range(resizes):
+        window.resize(600 + 10 * (i + 1), 400 + 5 * (i + 1))
+        qapp.processEvents()
+    processEvents(qapp, 0.3)
+
+    # The open menu follows the parent height without a layout loop
+    assert menu.width() == 200
+    assert menu.height() == window.height()
+    assert counter.layoutRequests() <= 2 * resizes + 4
+    assert counter.paints() <= 2 * resizes + 4
+
+    # and settles once the parent stops resizing
+    counter.reset()
+    processEvents(qapp, 0.5)
+    assert counter.layoutRequests() == 0
+    assert counter.paints() == 0
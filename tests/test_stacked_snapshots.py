@@ -0,0 +1,68 @@
+########################################################################
+## QCustomStackedWidget PAGE SNAPSHOTS
+## Navigating between unchanged pages reuses their cached snapshots,
+## content changes still invalidate them
+########################################################################
+from PySide6 import QtTest, QtWidgets
+
+from Custom_Widgets.Widgets import QCustomStackedWidget
+
+
+def createStackedWidget():
+    window = QtWidgets.QWidget()
+    QtWidgets.QVBoxLayout(window)
+
+    stackedWidget = QCustomStackedWidget(window)
+    window.layout().addWidget(stackedWidget)
+    for index in range(2):
+        page = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(page)
+        layout.addWidget(QtWidgets.QLabel("Page " + str(index)))
+        layout.addWidget(QtWidgets.QPushButton("Button"))
+        stackedWidget.addWidget(page)
+
+    stackedWidget.setSlideTransition(True)
+    stackedWidget.setFadeTransition(True)
+    stackedWidget.setTransitionSpeed(50)
+    stackedWidget.setFadeSpeed(50)
+
+    window.resize(300, 200)
+    window.show()
+    QtTest.QTest.qWait(400)
+
+    return window, stackedWidget
+
+
+def navigate(stackedWidget, index):
+    stackedWidget.slideToWidgetIndex(index)
+    QtTest.QTest.qWait(300)
+
+
+def test_navigating_back_and_forth_hits_the_cache(qapp):
+    window, stackedWidget = createStackedWidget()
+    captures = []
+    capturePageSnapshot = stackedWidget._capturePageSnapshot
+    stackedWidget._capturePageSnapshot = lambda page: captures.append(page) or capturePageSnapshot(page)
+
+    navigate(stackedWidget, 1)
+    navigate(stackedWidget, 0)
+    captured = len(captures)
+
+    navigate(stackedWidget, 1)
+    navigate(stackedWidget, 0)
+
+    assert len(captures) == captured
+    assert set(stackedWidget._snapshotCache) == {stackedWidget.widget(0), stackedWidget.widget(1)}
+
+
+def test_content_change_invalidates(qapp):
+    window, stackedWidget = createStackedWidget()
+    navigate(stackedWidget, 1)
+    navigate(stackedWidget, 0)
+    page = stackedWidget.widget(0)
+    assert page in stackedWidget._snapshotCache
+
+    page.findChild(QtWidgets.QLabel).setText("Changed page text")
+    QtTest.QTest.qWait(50)
+
+    assert page not in stackedWidget._snapshotCache
@@ -0,0 +1,117 @@
+########################################################################
+## STYLE PLANS
+## Compiling a plan with a ui resolves the widgets and validates every
+## entry, applying the plan then only replays the resolved operations
+########################################################################
+import pytest
+
+from PySide6 import QtWidgets
+
+from Custom_Widgets.AnalogGaugeWidget import AnalogGaugeWidget
+from Custom_Widgets.StylePlan import compileStylePlan
+from Custom_Widgets.Widgets import (QMainWindow, QCustomQPushButton, QCustomSlideMenu, QCustomStackedWidget,
+                                    applyJsonStyle, applyStylePlan)
+
+
+class Ui():
+    pass
+
+
+STYLE = {
+    "ShowLogs": False,
+    "QCard": [{"cards": ["card"], "shadow": [{"color": "#112233", "blurRadius": 12, "xOffset": 2, "yOffset": 3}]}],
+    "QPushButtonGroup": [{"Buttons": ["groupButton_0", "groupButton_1"],
+                          "Style": [{"Active": "background-color: red;", "NotActive": "background-color: blue;"}]}],
+    "AnalogGaugeWidget": [{"name": "gauge", "units": "km/h", "minValue": 10, "maxValue": 90,
+                           "needleColor": "#ff0000"}],
+    "QCustomSlideMenu": [{"name": "menu", "defaultSize": [{"width": 50, "height": "parent"}],
+                          "collapsedSize": [{"width": 0, "height": "parent"}],
+                          "expandedSize": [{"width": 200, "height": "parent"}],
+                          "toggleButton": [{"buttonName": "menuButton"}]}],
+    "QPushButton": [{"name": "button", "theme": "1"}],
+    "QStackedWidget": [{"name": "stackedWidget",
+                        "transitionAnimation": [{"fade": [{"active": True, "duration": 321}]}]}]
+}
+
+
+def createWindow():
+    window = QMainWindow()
+    window.ui = Ui()
+    centralWidget = QtWidgets.QWidget(window)
+    window.setCentralWidget(centralWidget)
+
+    window.ui.card = QtWidgets.QFrame(centralWidget)
+    window.ui.gauge = AnalogGaugeWidget(centralWidget)
+    window.ui.menu = QCustomSlideMenu(centralWidget)
+    window.ui.menuButton = QtWidgets.QPushButton(centralWidget)
+    window.ui.button = QCustomQPushButton(centralWidget)
+    window.ui.button.setObjectName("button")
+    window.ui.stackedWidget = QCustomStackedWidget(centralWidget)
+    window.ui.stackedWidget.setObjectName("stackedWidget")
+    for index in range(2):
+        button = QtWidgets.QPushButton(centralWidget)
+        setattr(window.ui, "groupButton_" + str(index), button)
+
+    window.resize(400, 300)
+    return window
+
+
+def returnWidgetState(ui):
+    effect = ui.card.graphicsEffect()
+    return {
+        "card": (effect.color().name(), effect.blurRadius(), effect.xOffset(), effect.yOffset()),
+        "group": [getattr(button, "groupParent", None) is not None for button in (ui.groupButton_0, ui.groupButton_1)],
+        "gauge": (ui.gauge.units, ui.gauge.min_value, ui.gauge.max_value, ui.gauge.needle_color.name()),
+        "menu": (ui.menu.defaultWidth, ui.menu.collapsedWidth, ui.menu.expandedWidth, ui.menu.targetBtn is ui.menuButton),
+        "button": ui.button.wasThemed,
+        "stackedWidget": (ui.stackedWidget.fadeTransition, ui.stackedWidget.fadeTime)
+    }
+
+
+def test_compiled_plan_holds_resolved_widgets(qapp):
+    window = createWindow()
+    plan = compileStylePlan(STYLE, window.ui)
+
+    operations = {operation["section"]: operation for operation in plan}
+    assert operations["QCard"]["compiled"][0]["cards"] == [window.ui.card]
+    assert operations["QPushButtonGroup"]["compiled"][0]["buttons"] == [window.ui.groupButton_0,
+                                                                        window.ui.groupButton_1]
+    assert operations["QCustomSlideMenu"]["compiled"]["widget"] is window.ui.menu
+    assert operations["QCustomSlideMenu"]["compiled"]["toggleButtons"][0]["buttonName"] is window.ui.menuButton
+    # Sections without a compiler keep their raw data
+    assert "compiled" not in operations["ShowLogs"]
+
+
+def test_compiled_plan_applies_like_a_plan_resolved_when_applied(qapp):
+    compiledWindow = createWindow()
+    applyStylePlan(compiledWindow, compiledWindow.ui, compileStylePlan(STYLE, compiledWindow.ui))
+
+    resolvedWindow = createWindow()
+    applyStylePlan(resolvedWindow, resolvedWindow.ui, compileStylePlan(STYLE))
+
+    state = returnWidgetState(compiledWindow.ui)
+    assert state == returnWidgetState(resolvedWindow.ui)
+    assert state["card"] == ("#112233", 12, 2, 3)
+    assert state["group"] == [True, True]
+    assert state["gauge"] == ("km/h", 10, 90, "#ff0000")
+    assert state["menu"] == (50, 0, 200, True)
+    assert state["button"]
+    assert state["stackedWidget"] == (True, 321)
+
+
+@pytest.mark.parametrize("entry, message", [
+    ({"AnalogGaugeWidget": [{"name": "missingGauge"}]}, "no widget found"),
+    ({"AnalogGaugeWidget": [{"name": "card"}]}, "is not a AnalogGaugeWidget object"),
+    ({"QCustomSlideMenu": [{"name": "menu", "toggleButton": [{"buttonName": "missingButton"}]}]},
+     "could not be found")
+])
+def test_invalid_entries_fail_before_anything_is_applied(qapp, entry, message):
+    window = createWindow()
+    style = dict(STYLE, **entry)
+
+    with pytest.raises(Exception, match=message):
+        applyJsonStyle(window, window.ui, style)
+
+    # Entries compiled before the invalid one were not applied either
+    assert window.ui.card.graphicsEffect() is None
+    assert not hasattr(window.ui.groupButton_0, "groupParent")
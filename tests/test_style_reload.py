@@ -0,0 +1,93 @@
+########################################################################
+## STYLE RELOADS
+## Reloading a JSON stylesheet re-applies changed entries without
+## stacking signal connections, removed entries release theirs
+########################################################################
+import json
+
+from PySide6 import QtWidgets
+
+from Custom_Widgets.Widgets import (QMainWindow, QCustomSlideMenu, QCustomStackedWidget, loadJsonStyle,
+                                    reloadJsonStyle)
+
+
+class Ui():
+    pass
+
+
+def returnStyle(duration=300, stackedWidget=True):
+    style = {"ShowLogs": False,
+             "QCustomSlideMenu": [{"name": "menu", "menuTransitionAnimation": [{"animationDuration": duration}],
+                                   "toggleButton": [{"buttonName": "menuButton"}]}]}
+    if stackedWidget:
+        style["QStackedWidget"] = [{"name": "stackedWidget",
+                                    "navigation": [{"nextPage": "nextButton",
+                                                    "navigationButtons": [{"pageButton": "page_1"}]}]}]
+    return style
+
+
+def createWindow(tmp_path):
+    window = QMainWindow()
+    window.ui = Ui()
+    centralWidget = QtWidgets.QWidget(window)
+    window.setCentralWidget(centralWidget)
+
+    window.ui.menu = QCustomSlideMenu(centralWidget)
+    window.ui.menuButton = QtWidgets.QPushButton(centralWidget)
+    window.ui.nextButton = QtWidgets.QPushButton(centralWidget)
+    window.ui.pageButton = QtWidgets.QPushButton(centralWidget)
+    window.ui.stackedWidget = QCustomStackedWidget(centralWidget)
+    window.ui.stackedWidget.setObjectName("stackedWidget")
+    for index in range(2):
+        page = QtWidgets.QWidget()
+        setattr(window.ui, "page_" + str(index), page)
+        window.ui.stackedWidget.addWidget(page)
+
+    # Count the slots the JSON connections end up calling
+    calls = {"toggle": 0, "next": 0}
+    window.ui.menu.toggleMenu = lambda buttonObject: calls.__setitem__("toggle", calls["toggle"] + 1)
+    window.ui.stackedWidget.slideToNextWidget = lambda: calls.__setitem__("next", calls["next"] + 1)
+
+    jsonFile = tmp_path / "style.json"
+    jsonFile.write_text(json.dumps(returnStyle()))
+    loadJsonStyle(window, window.ui, jsonFiles=[str(jsonFile)])
+    return window, jsonFile, calls
+
+
+def clickButtons(window, calls):
+    window.ui.stackedWidget.setCurrentIndex(0)
+    for key in calls:
+        calls[key] = 0
+    for button in (window.ui.menuButton, window.ui.nextButton, window.ui.pageButton):
+        button.click()
+    return dict(calls, page=window.ui.stackedWidget.currentIndex())
+
+
+def test_reloading_the_same_json_keeps_one_connection_per_button(qapp, tmp_path):
+    window, jsonFile, calls = createWindow(tmp_path)
+    assert clickButtons(window, calls) == {"toggle": 1, "next": 1, "page": 1}
+
+    reloadJsonStyle(window)
+    reloadJsonStyle(window)
+    assert clickButtons(window, calls) == {"toggle": 1, "next": 1, "page": 1}
+
+
+def test_reloading_changed_entries_replaces_their_connections(qapp, tmp_path):
+    window, jsonFile, calls = createWindow(tmp_path)
+
+    for duration in (400, 500):
+        jsonFile.write_text(json.dumps(returnStyle(duration)))
+        reloadJsonStyle(window)
+        assert window.ui.menu.animationDuration == duration
+        assert clickButtons(window, calls) == {"toggle": 1, "next": 1, "page": 1}
+
+
+def test_removed_entries_release_their_connections(qapp, tmp_path):
+    window, jsonFile, calls = createWindow(tmp_path)
+    assert (None, "QStackedWidget", "stackedWidget") in window.styleOperationConnections
+
+    jsonFile.write_text(json.dumps(returnStyle(stackedWidget=False)))
+    reloadJsonStyle(window)
+
+    assert (None, "QStackedWidget", "stackedWidget") not in window.styleOperationConnections
+    assert clickButtons(window, calls) == {"toggle": 1, "next": 0, "page": 0}
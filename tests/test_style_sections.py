@@ -0,0 +1,130 @@
+########################################################################
+## STYLE SECTIONS
+## Custom top level JSON sections and the per section timing report
+########################################################################
+import json
+import time
+
+import pytest
+
+from PySide6 import QtWidgets
+
+from Custom_Widgets.Widgets import (QMainWindow, loadJsonStyle, registerStyleSection, unregisterStyleSection,
+                                    returnStyleReport, printStyleReport)
+
+
+class Ui():
+    pass
+
+
+def createWindow(tmp_path, style):
+    window = QMainWindow()
+    window.ui = Ui()
+    for index in range(3):
+        label = QtWidgets.QLabel(window)
+        setattr(window.ui, "label_" + str(index), label)
+
+    jsonFile = tmp_path / "style.json"
+    jsonFile.write_text(json.dumps(dict({"ShowLogs": False}, **style)))
+    loadJsonStyle(window, window.ui, jsonFiles=[str(jsonFile)])
+    return window
+
+
+@pytest.fixture
+def labelSection():
+    calls = []
+
+    def applyLabelSection(self, ui, sectionData):
+        calls.append(sectionData)
+        for entry in sectionData:
+            getattr(ui, entry["name"]).setText(entry["text"])
+
+    registerStyleSection("QLabel", applyLabelSection, widgetSection=True)
+    yield calls
+    unregisterStyleSection("QLabel")
+
+
+def test_custom_widget_section_applies_every_entry_on_its_own(qapp, tmp_path, labelSection):
+    window = createWindow(tmp_path, {"QLabel": [{"name": "label_0", "text": "first"},
+                                                {"name": "label_1", "text": "second"},
+                                                {"text": "entries without a name are ignored"}]})
+
+    assert window.ui.label_0.text() == "first"
+    assert window.ui.label_1.text() == "second"
+    assert window.ui.label_2.text() == ""
+    assert labelSection == [[{"name": "label_0", "text": "first"}], [{"name": "label_1", "text": "second"}]]
+
+
+def test_unregistered_section_is_ignored(qapp, tmp_path, labelSection):
+    unregisterStyleSection("QLabel")
+    window = createWindow(tmp_path, {"QLabel": [{"name": "label_0", "text": "first"}]})
+
+    assert window.ui.label_0.text() == ""
+    assert labelSection == []
+    assert "QLabel" not in [entry["section"] for entry in returnStyleReport(window)]
+
+    # Unregistering an unknown section does nothing
+    unregisterStyleSection("QLabel")
+
+
+def test_custom_section_compiler_resolves_the_widgets(qapp, tmp_path):
+    calls = []
+
+    def compileLabelEntry(ui, entry):
+        if not hasattr(ui, entry["name"]):
+            raise Exception(entry["name"] + " is not a QLabel, no widget found")
+        return {"label": getattr(ui, entry["name"]), "text": entry["text"].upper()}
+
+    def applyLabelSection(self, ui, sectionData):
+        calls.append(sectionData)
+        for entry in sectionData:
+            entry["label"].setText(entry["text"])
+
+    registerStyleSection("QLabel", applyLabelSection, widgetSection=True, compiler=compileLabelEntry)
+    try:
+        window = createWindow(tmp_path, {"QLabel": [{"name": "label_0", "text": "first"}]})
+        assert window.ui.label_0.text() == "FIRST"
+        assert calls == [[{"label": window.ui.label_0, "text": "FIRST"}]]
+
+        with pytest.raises(Exception, match="no widget found"):
+            createWindow(tmp_path, {"QLabel": [{"name": "missingLabel", "text": "first"}]})
+    finally:
+        unregisterStyleSection("QLabel")
+
+
+def test_sections_need_callable_handlers(qapp):
+    with pytest.raises(Exception, match="handler of the 'QLabel' section is not callable"):
+        registerStyleSection("QLabel", None)
+    with pytest.raises(Exception, match="compiler of the 'QLabel' section is not callable"):
+        registerStyleSection("QLabel", lambda self, ui, sectionData: None, compiler="compileLabelEntry")
+
+
+def test_report_times_every_section_slowest_first(qapp, tmp_path, capsys):
+    def applySlowSection(self, ui, sectionData):
+        time.sleep(0.02)
+        # Handlers may return the number of widgets they configured
+        return 3
+
+    registerStyleSection("SlowSection", applySlowSection)
+    try:
+        window = createWindow(tmp_path, {"SlowSection": {"value": 1},
+                                         "QMainWindow": [{"title": "Report"}]})
+    finally:
+        unregisterStyleSection("SlowSection")
+
+    report = returnStyleReport(window)
+    sections = [entry["section"] for entry in report]
+    assert sections[0] == "SlowSection"
+    assert "QMainWindow" in sections
+    assert [entry["time"] for entry in report] == sorted((entry["time"] for entry in report), reverse=True)
+    assert report[0]["time"] >= 20
+    assert report[0]["widgets"] == 3
+    assert report[0]["calls"] == 1
+
+    printStyleReport(window)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "Custom Widgets style report:"
+    assert lines[1].split()[0] == "SlowSection"
+    assert lines[1].split()[3:] == ["3", "widgets", "1", "calls"]
+    assert lines[-1].split()[0] == "Total"
+    assert len(lines) == len(report) + 2